@@ -36,25 +36,26 @@ from builtins import input
 __docformat__ = 'restructuredtext'
 
 import sys
+from importlib import import_module
 
 from fipy.boundaryConditions import *
 from fipy.meshes import *
-from fipy.solvers import *
 from fipy.steppers import *
 from fipy.terms import *
 from fipy.tools import *
 from fipy.variables import *
-from fipy.viewers import *
-
-__all__ = []
-__all__.extend(boundaryConditions.__all__)
-__all__.extend(meshes.__all__)
-__all__.extend(solvers.__all__)
-__all__.extend(steppers.__all__)
-__all__.extend(terms.__all__)
-__all__.extend(tools.__all__)
-__all__.extend(variables.__all__)
-__all__.extend(viewers.__all__)
+
+# The solver suite and the viewers are only imported on first use of one
+# of their names, see `__getattr__`
+_lazy_packages = ["solvers", "viewers"]
+
+_all = []
+_all.extend(boundaryConditions.__all__)
+_all.extend(meshes.__all__)
+_all.extend(steppers.__all__)
+_all.extend(terms.__all__)
+_all.extend(tools.__all__)
+_all.extend(variables.__all__)
 
 # fipy needs to export raw_input whether or not parallel
 
@@ -72,10 +73,44 @@ if parallelComm.Nproc > 1:
             return ""
     input = mpi_input
 
-__all__.extend(['input', 'input_original'])
+_all.extend(['input', 'input_original'])
 
 from future.utils import text_to_native_str
-__all__ = [text_to_native_str(n) for n in __all__]
+_all = [text_to_native_str(n) for n in _all]
+
+def _lazy_all():
+    """`__all__`, including the names of the lazy packages
+    """
+    names = list(_all)
+    for package in _lazy_packages:
+        names.extend(import_module("fipy." + package).__all__)
+
+    return [text_to_native_str(n) for n in names]
+
+def __getattr__(name):
+    """Import a name of the solver suite or the viewers on first use
+
+    For instance, `fipy.Viewer` imports :mod:`fipy.viewers` and
+    `fipy.DefaultSolver` binds the solver suite.
+    """
+    if name == "__all__":
+        globals()["__all__"] = _lazy_all()
+        return __all__
+
+    for package in _lazy_packages:
+        module = import_module("fipy." + package)
+        if name in module.__all__:
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+if sys.version_info < (3, 7):
+    # no module `__getattr__`
+    from fipy.solvers import *
+    from fipy.viewers import *
+    __all__ = _lazy_all()
 
 _saved_stdout = sys.stdout
 
@@ -0,0 +1,13 @@
+"""Benchmarks of the phases of FiPy simulations
+
+Run ``python -m fipy.benchmarks --help`` for the command-line options.
+"""
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext'
+
+from fipy.benchmarks.phaseTimer import *
+from fipy.benchmarks.benchmark import *
+
+__all__ = []
+__all__.extend(phaseTimer.__all__)
+__all__.extend(benchmark.__all__)
@@ -0,0 +1,4 @@
+from __future__ import unicode_literals
+from fipy.benchmarks.benchmark import main
+
+main()
@@ -0,0 +1,186 @@
+"""Run benchmark cases and report the results as JSON
+
+    >>> report = run(cases=["diffusion"], sizes=[16, 64], steps=2)
+    >>> print(sorted(report.keys()))
+    ['environment', 'results']
+    >>> print([(result["case"], result["numberOfCells"])
+    ...        for result in report["results"]])
+    [('diffusion', 16), ('diffusion', 64)]
+    >>> result = report["results"][0]
+    >>> print(sorted(result["phases"].keys()))
+    ['assembly', 'evaluation', 'solve', 'updateOld']
+    >>> print(result["phases"]["updateOld"]["calls"])
+    2
+    >>> phases = sum(phase["time"] for phase in result["phases"].values())
+    >>> print(phases <= result["time"])
+    True
+
+A case that fails, e.g., because :term:`Gmsh` is not installed, is
+reported with its error rather than stopping the run
+
+    >>> report = run(cases=["unknown"], sizes=[16], steps=1)
+    >>> print(report["results"][0]["error"])
+    KeyError: 'unknown'
+
+The report can be written as JSON
+
+    >>> import json
+    >>> print(sorted(json.loads(json.dumps(report))["environment"].keys()))
+    ['Nproc', 'fipy', 'numpy', 'platform', 'python', 'solver', 'timestamp']
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext'
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from timeit import default_timer
+
+from fipy.benchmarks.cases import cases as _cases
+from fipy.benchmarks.phaseTimer import PhaseTimer
+
+__all__ = ["run", "main"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+def _environment():
+    """What was benchmarked, and where
+    """
+    import numpy
+    import fipy
+    from fipy import solvers
+    from fipy.tools import parallelComm
+
+    return dict(fipy=fipy.__version__,
+                numpy=numpy.__version__,
+                python=platform.python_version(),
+                platform=platform.platform(),
+                solver=solvers.solver,
+                Nproc=parallelComm.Nproc,
+                timestamp=datetime.datetime.utcnow().isoformat())
+
+def _runCase(name, numberOfElements, steps):
+    result = dict(case=name, numberOfElements=numberOfElements, steps=steps)
+    try:
+        start = default_timer()
+        mesh, step = _cases[name](numberOfElements=numberOfElements)
+        result["setup"] = default_timer() - start
+        result["numberOfCells"] = int(mesh.globalNumberOfCells)
+
+        with PhaseTimer() as timer:
+            start = default_timer()
+            for i in range(steps):
+                step()
+            result["time"] = default_timer() - start
+        result["phases"] = timer.results()
+    except Exception as e:
+        result["error"] = "%s: %s" % (e.__class__.__name__, e)
+
+    return result
+
+def run(cases=None, sizes=(1000,), steps=5):
+    """Time each of `cases` at each of `sizes` with the current solver suite
+
+    Parameters
+    ----------
+    cases : list of str
+        Names of the cases in :data:`fipy.benchmarks.cases.cases` to run.
+        All of them, if `None`.
+    sizes : list of int
+        Approximate numbers of cells.
+    steps : int
+        Number of time steps to time for each case and size.
+
+    Returns
+    -------
+    dict
+        The ``"environment"`` of the run and a list of ``"results"``.
+        Each result holds the ``"case"``, the ``"numberOfCells"``, the
+        ``"setup"`` time, the total ``"time"`` of the steps and the
+        ``"phases"`` reported by :class:`~fipy.benchmarks.phaseTimer.PhaseTimer`,
+        or an ``"error"`` if the case failed.  Times are in seconds.
+    """
+    if cases is None:
+        cases = list(_cases.keys())
+
+    results = [_runCase(name, numberOfElements=size, steps=steps)
+               for name in cases for size in sizes]
+
+    return dict(environment=_environment(), results=results)
+
+def _runSolvers(solvers, argv):
+    """Run the benchmarks in a new process for each solver suite
+    """
+    reports = []
+    for solver in solvers:
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            env = dict(os.environ)
+            env["FIPY_SOLVERS"] = solver
+            subprocess.check_call([sys.executable, "-m", "fipy.benchmarks",
+                                   "--output", path] + argv,
+                                  env=env)
+            with open(path, 'r') as f:
+                reports.extend(json.load(f))
+        finally:
+            os.remove(path)
+
+    return reports
+
+def main(argv=None):
+    """Command-line interface of ``python -m fipy.benchmarks``
+
+    Writes a JSON list of reports, as returned by :func:`run`, one for
+    each solver suite.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(prog="python -m fipy.benchmarks",
+                                     description="Time the phases of FiPy simulations")
+    parser.add_argument("--cases", nargs="+", choices=list(_cases.keys()),
+                        default=None, help="cases to run (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000],
+                        help="approximate numbers of cells")
+    parser.add_argument("--steps", type=int, default=5,
+                        help="number of time steps of each case")
+    parser.add_argument("--solvers", nargs="+", default=None,
+                        help="solver suites to compare, each in its own process "
+                             "(default: the suite FiPy would otherwise use)")
+    parser.add_argument("--output", default=None,
+                        help="file to write the JSON report to (default: stdout)")
+    # solver flags, such as `--petsc`, are left for FiPy
+    args, unknown = parser.parse_known_args(argv)
+
+    if args.solvers is not None:
+        forwarded = (["--steps", str(args.steps), "--sizes"]
+                     + [str(size) for size in args.sizes]
+                     + unknown)
+        if args.cases is not None:
+            forwarded += ["--cases"] + args.cases
+        reports = _runSolvers(args.solvers, forwarded)
+    else:
+        reports = [run(cases=args.cases, sizes=args.sizes, steps=args.steps)]
+
+    from fipy.tools import parallelComm
+    if parallelComm.procID == 0:
+        if args.output is None:
+            json.dump(reports, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.output, 'w') as f:
+                json.dump(reports, f, indent=2)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
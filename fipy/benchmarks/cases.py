@@ -0,0 +1,206 @@
+"""Simulations to benchmark
+
+Each case is a function of the approximate number of cells,
+`numberOfElements`, that sets up a problem and returns its mesh and a
+function that advances the problem by one time step.
+
+    >>> mesh, step = cases["diffusion"](numberOfElements=100)
+    >>> print(mesh.numberOfCells)
+    100
+    >>> step()
+
+The convection cases differ only by the discretization scheme
+
+    >>> for name in cases:
+    ...     if name.startswith("convection"):
+    ...         print(name)
+    convection-centraldifference
+    convection-upwind
+    convection-hybrid
+    convection-powerlaw
+    convection-exponential
+    convection-vanleer
+    >>> for name in cases:
+    ...     if name.startswith("convection"):
+    ...         mesh, step = cases[name](numberOfElements=25)
+    ...         step()
+
+    >>> mesh, step = cases["cahnhilliard-coupled"](numberOfElements=25)
+    >>> step()
+
+    >>> mesh, step = cases["gmsh-diffusion"](numberOfElements=100) # doctest: +GMSH
+    >>> step() # doctest: +GMSH
+
+Some cases time a single operation, rather than a time step
+
+    >>> mesh, step = cases["putadd"](numberOfElements=100)
+    >>> step()
+"""
+from __future__ import division
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext'
+
+from collections import OrderedDict
+
+from fipy.tools import numerix
+
+__all__ = ["cases"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+def _squareGrid(numberOfElements):
+    from fipy.meshes import Grid2D
+
+    N = max(int(round(numerix.sqrt(numberOfElements))), 1)
+    return Grid2D(nx=N, ny=N, dx=1. / N, dy=1. / N)
+
+def _diffusion(mesh):
+    """Nonlinear diffusion, which is reassembled at every step
+    """
+    from fipy.terms import TransientTerm, DiffusionTerm
+    from fipy.variables.cellVariable import CellVariable
+
+    var = CellVariable(mesh=mesh, value=0., hasOld=True)
+    var.constrain(1., where=mesh.facesLeft)
+    var.constrain(0., where=mesh.facesRight)
+
+    eq = TransientTerm() == DiffusionTerm(coeff=1. + var)
+    dt = 0.1
+
+    def step():
+        var.updateOld()
+        eq.solve(var=var, dt=dt)
+
+    return mesh, step
+
+def diffusion(numberOfElements):
+    """Nonlinear diffusion on a square `Grid2D`
+    """
+    return _diffusion(_squareGrid(numberOfElements))
+
+def _convection(Term):
+    def convection(numberOfElements):
+        from fipy.terms import TransientTerm, DiffusionTerm
+        from fipy.variables.cellVariable import CellVariable
+
+        mesh = _squareGrid(numberOfElements)
+        var = CellVariable(mesh=mesh, value=0., hasOld=True)
+        var.constrain(1., where=mesh.facesLeft)
+        var.constrain(0., where=mesh.facesRight)
+
+        eq = (TransientTerm() + Term(coeff=(1., 0.))
+              == DiffusionTerm(coeff=0.01))
+        dt = 0.5 / numerix.sqrt(mesh.numberOfCells)
+
+        def step():
+            var.updateOld()
+            eq.solve(var=var, dt=dt)
+
+        return mesh, step
+
+    convection.__doc__ = """Convection-diffusion on a square `Grid2D` with `%s`
+    """ % Term.__name__
+
+    return convection
+
+def cahnHilliard(numberOfElements):
+    """Coupled Cahn-Hilliard on a square `Grid2D`, as in
+    :mod:`examples.cahnHilliard.mesh2DCoupled`
+    """
+    from fipy.terms import TransientTerm, DiffusionTerm, ImplicitSourceTerm
+    from fipy.variables.cellVariable import CellVariable
+
+    mesh = _squareGrid(numberOfElements)
+    phi = CellVariable(mesh=mesh, hasOld=True)
+    psi = CellVariable(mesh=mesh, hasOld=True)
+
+    x, y = mesh.cellCenters.value
+    phi.value = 0.5 + 0.01 * numerix.sin(40 * x) * numerix.cos(30 * y)
+
+    dfdphi = phi * (1 - phi) * (1 - 2 * phi)
+    d2fdphi2 = 1 - 6 * phi * (1 - phi)
+    eq1 = (TransientTerm(var=phi) == DiffusionTerm(coeff=1., var=psi))
+    eq2 = (ImplicitSourceTerm(coeff=1., var=psi)
+           == ImplicitSourceTerm(coeff=d2fdphi2, var=phi) - d2fdphi2 * phi + dfdphi
+           - DiffusionTerm(coeff=1e-4, var=phi))
+    eq = eq1 & eq2
+    dt = 1e-3
+
+    def step():
+        phi.updateOld()
+        psi.updateOld()
+        eq.solve(dt=dt)
+
+    return mesh, step
+
+def gmshDiffusion(numberOfElements):
+    """Nonlinear diffusion on a triangulated square generated by Gmsh
+    """
+    from fipy.meshes import Gmsh2D
+
+    # the area of an equilateral triangle of side h is sqrt(3) h**2 / 4
+    cellSize = numerix.sqrt(4. / (numerix.sqrt(3.) * numberOfElements))
+    mesh = Gmsh2D('''
+                  cellSize = %(cellSize)g;
+                  Point(1) = {0, 0, 0, cellSize};
+                  Point(2) = {1, 0, 0, cellSize};
+                  Point(3) = {1, 1, 0, cellSize};
+                  Point(4) = {0, 1, 0, cellSize};
+                  Line(5) = {1, 2};
+                  Line(6) = {2, 3};
+                  Line(7) = {3, 4};
+                  Line(8) = {4, 1};
+                  Line Loop(9) = {5, 6, 7, 8};
+                  Plane Surface(10) = {9};
+                  ''' % locals())
+
+    return _diffusion(mesh)
+
+def putAdd(numberOfElements):
+    """Sum of the values of the faces of each cell of a square `Grid2D`
+    with :func:`~fipy.tools.vector.putAdd`
+    """
+    from fipy.tools import vector
+
+    mesh = _squareGrid(numberOfElements)
+    ids = mesh.faceCellIDs.ravel()
+    mask = numerix.MA.getmaskarray(ids)
+    faceValues = numerix.random.random(ids.shape)
+    cellValues = numerix.zeros(mesh.numberOfCells)
+
+    def step():
+        vector._putAdd(cellValues, ids, faceValues, mask=mask)
+
+    return mesh, step
+
+def _cases():
+    from fipy.terms import (CentralDifferenceConvectionTerm,
+                            UpwindConvectionTerm,
+                            HybridConvectionTerm,
+                            PowerLawConvectionTerm,
+                            ExponentialConvectionTerm,
+                            VanLeerConvectionTerm)
+
+    cases = OrderedDict()
+    cases["diffusion"] = diffusion
+    for name, Term in (("centraldifference", CentralDifferenceConvectionTerm),
+                       ("upwind", UpwindConvectionTerm),
+                       ("hybrid", HybridConvectionTerm),
+                       ("powerlaw", PowerLawConvectionTerm),
+                       ("exponential", ExponentialConvectionTerm),
+                       ("vanleer", VanLeerConvectionTerm)):
+        cases["convection-" + name] = _convection(Term)
+    cases["cahnhilliard-coupled"] = cahnHilliard
+    cases["gmsh-diffusion"] = gmshDiffusion
+    cases["putadd"] = putAdd
+
+    return cases
+
+cases = _cases()
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
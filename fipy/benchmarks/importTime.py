@@ -0,0 +1,94 @@
+"""Time ``import fipy`` in a fresh interpreter
+
+``import fipy`` loads the meshes, variables and terms, but leaves the
+solver suite and the viewers to be imported on first use of one of their
+names
+
+    >>> report = importTime() # doctest: +SERIAL
+    >>> print(report["loaded"]) # doctest: +SERIAL
+    []
+
+This keeps the start up of short jobs within a budget of
+:envvar:`FIPY_IMPORT_BUDGET` seconds, by default a generous 5 seconds, as
+wall-clock times depend on the machine and its load
+
+    >>> print(report["time"] < _budget()) # doctest: +SERIAL
+    True
+
+Using one of their names imports them
+
+    >>> statement = "fipy.Viewer; fipy.DefaultSolver"
+    >>> report = importTime(statement=statement) # doctest: +SERIAL
+    >>> print("fipy.viewers" in report["loaded"]) # doctest: +SERIAL
+    True
+"""
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext'
+
+import json
+import os
+import subprocess
+import sys
+
+__all__ = ["importTime"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+# modules that `import fipy` should not load
+_lazyModules = ("fipy.viewers",
+                "fipy.solvers.scipy",
+                "fipy.solvers.pyAMG",
+                "fipy.solvers.pyamgx")
+
+_script = """
+import json, sys, timeit
+start = timeit.default_timer()
+import fipy
+{statement}
+time = timeit.default_timer() - start
+loaded = [name for name in {lazyModules!r} if name in sys.modules]
+json.dump(dict(time=time, loaded=loaded), sys.stdout)
+"""
+
+def _budget():
+    """Seconds that ``import fipy`` may take
+    """
+    return float(os.environ.get("FIPY_IMPORT_BUDGET", 5.))
+
+def importTime(statement="", repeat=3):
+    """Time ``import fipy``, each time in a new process
+
+    The new processes use the same solver suite as this one.
+
+    Parameters
+    ----------
+    statement : str
+        Python code to time after ``import fipy``.
+    repeat : int
+        Number of processes to time.
+
+    Returns
+    -------
+    dict
+        The shortest ``"time"``, in seconds, and the lazily imported
+        modules that were ``"loaded"``.
+    """
+    from fipy import solvers
+
+    env = dict(os.environ)
+    env["FIPY_SOLVERS"] = solvers.solver
+    script = _script.format(statement=statement, lazyModules=_lazyModules)
+
+    reports = [json.loads(subprocess.check_output([sys.executable, "-c", script],
+                                                  env=env).decode())
+               for i in range(repeat)]
+
+    return dict(time=min(report["time"] for report in reports),
+                loaded=sorted(reports[0]["loaded"]))
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -0,0 +1,190 @@
+"""Time spent in each phase of a FiPy simulation
+
+A `PhaseTimer` temporarily wraps the methods that carry out each phase
+of a time step:
+
+``assembly``
+    building the matrix and RHS vector of an equation
+    (:meth:`~fipy.terms.term.Term._buildAndAddMatrices`)
+``solve``
+    solving the linear system (:meth:`~fipy.solvers.solver.Solver._solve`)
+``evaluation``
+    evaluating `Variable` objects, e.g., coefficients and sources
+``updateOld``
+    :meth:`~fipy.variables.cellVariable.CellVariable.updateOld`
+
+Phases are timed exclusively: time spent evaluating a coefficient while
+assembling a matrix counts toward ``evaluation``, not ``assembly``, so
+the phase times add up to no more than the total.
+
+    >>> from fipy import CellVariable, Grid1D, TransientTerm, DiffusionTerm
+    >>> mesh = Grid1D(nx=10)
+    >>> var = CellVariable(mesh=mesh, value=mesh.x, hasOld=True)
+    >>> eq = TransientTerm() == DiffusionTerm(coeff=1. + var)
+
+    >>> with PhaseTimer() as timer:
+    ...     for step in range(3):
+    ...         var.updateOld()
+    ...         eq.solve(var=var, dt=1.)
+    >>> results = timer.results()
+    >>> print(sorted(results.keys()))
+    ['assembly', 'evaluation', 'solve', 'updateOld']
+    >>> print(results["updateOld"]["calls"], results["solve"]["calls"])
+    3 3
+    >>> print(all(result["time"] >= 0 for result in results.values()))
+    True
+
+The solver suite is timed, even if it was not imported before
+
+    >>> import subprocess, sys
+    >>> script = "; ".join([
+    ...     "from fipy import CellVariable, Grid1D, DiffusionTerm",
+    ...     "from fipy.benchmarks.phaseTimer import PhaseTimer",
+    ...     "var = CellVariable(mesh=Grid1D(nx=10), value=0.)",
+    ...     "var.constrain(1., var.mesh.facesLeft)",
+    ...     "timer = PhaseTimer().__enter__()",
+    ...     "DiffusionTerm().solve(var=var)",
+    ...     "print(timer.results()['solve']['calls'])"])
+    >>> output = subprocess.check_output([sys.executable, "-W", "ignore",
+    ...                                   "-c", script]) # doctest: +SERIAL
+    >>> print(output.decode().strip()) # doctest: +SERIAL
+    1
+
+The methods are restored afterwards
+
+    >>> from fipy.variables.cellVariable import CellVariable
+    >>> CellVariable.updateOld is timer._originals[0][2]
+    True
+"""
+from __future__ import unicode_literals
+from builtins import object
+__docformat__ = 'restructuredtext'
+
+import functools
+from timeit import default_timer
+
+__all__ = ["PhaseTimer"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+def _phaseMethods():
+    """The (phase, base class, method name) of each phase
+    """
+    from fipy.terms.term import Term
+    from fipy.solvers.solver import Solver
+    from fipy.variables.variable import Variable
+    from fipy.variables.cellVariable import CellVariable
+
+    return (("updateOld", CellVariable, "updateOld"),
+            ("assembly", Term, "_buildAndAddMatrices"),
+            ("solve", Solver, "_solve"),
+            ("evaluation", Variable, "_getValue"),
+            ("evaluation", Variable, "value"))
+
+def _subclasses(cls):
+    """`cls` and all of its (currently imported) subclasses
+    """
+    found = [cls]
+    for subclass in cls.__subclasses__():
+        for klass in _subclasses(subclass):
+            if klass not in found:
+                found.append(klass)
+    return found
+
+class PhaseTimer(object):
+    """Accumulate the time spent in each phase of a simulation
+
+    Use as a context manager. Only one `PhaseTimer` should be active at a
+    time.  Wrapping the methods adds a small overhead to every call,
+    which is most noticeable for ``evaluation`` of small meshes.
+    """
+    def __init__(self):
+        self._originals = []
+        self._stack = []
+        self.reset()
+
+    @property
+    def phases(self):
+        phases = []
+        for phase, _, _ in _phaseMethods():
+            if phase not in phases:
+                phases.append(phase)
+        return phases
+
+    def reset(self):
+        """Discard the times accumulated so far
+        """
+        self.times = dict((phase, 0.) for phase in self.phases)
+        self.calls = dict((phase, 0) for phase in self.phases)
+
+    def results(self):
+        """The accumulated time (in seconds) and number of calls of each phase
+
+        Returns
+        -------
+        dict
+            ``{phase: {"time": float, "calls": int}}``
+        """
+        return dict((phase, dict(time=self.times[phase], calls=self.calls[phase]))
+                    for phase in self.phases)
+
+    def _wrap(self, phase, method):
+        timer = self
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            # calls of the same phase from within that phase, e.g., by
+            # `super()` or recursion, are part of the outer call
+            if timer._stack and timer._stack[-1][0] == phase:
+                return method(*args, **kwargs)
+
+            frame = [phase, 0.]
+            timer._stack.append(frame)
+            start = default_timer()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = default_timer() - start
+                timer._stack.pop()
+                timer.times[phase] += elapsed - frame[1]
+                timer.calls[phase] += 1
+                if timer._stack:
+                    timer._stack[-1][1] += elapsed
+
+        return wrapper
+
+    def __enter__(self):
+        # a solver suite that is only imported on first use would not
+        # be wrapped
+        from fipy import solvers
+        try:
+            solvers.DefaultSolver
+        except ImportError:
+            pass
+
+        self._originals = []
+        for phase, base, name in _phaseMethods():
+            for klass in _subclasses(base):
+                if name in klass.__dict__:
+                    method = klass.__dict__[name]
+                    self._originals.append((klass, name, method))
+                    if isinstance(method, property):
+                        # a property holds the original getter, not its name
+                        wrapped = property(self._wrap(phase, method.fget),
+                                           method.fset, method.fdel, method.__doc__)
+                    else:
+                        wrapped = self._wrap(phase, method)
+                    setattr(klass, name, wrapped)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for klass, name, method in reversed(self._originals):
+            setattr(klass, name, method)
+        self._stack = []
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -6,6 +6,8 @@ __all__ = ["Constraint"]
 from future.utils import text_to_native_str
 __all__ = [text_to_native_str(n) for n in __all__]
 
+from fipy.tools import numerix
+
 class Constraint(object):
     def __init__(self, value, where=None):
         """Object to hold a `Variable` to `value` at `where`
@@ -15,5 +17,34 @@ class Constraint(object):
         self.value = value
         self.where = where
 
+    @property
+    def _indices(self):
+        """Index of the elements selected by the mask `where`
+
+        The mask is only converted again if `where` is replaced, or if it
+        may have changed in place (anything but a `tuple`).
+
+        >>> c = Constraint(1., where=(True, False, True))
+        >>> print(c._indices)
+        (Ellipsis, array([0, 2]))
+        >>> c._indices is c._indices
+        True
+        """
+        where = self.where
+        if getattr(self, "_mask", None) is not where:
+            indices = (Ellipsis,) + numerix.nonzero(numerix.array(where, dtype=bool))
+            if not isinstance(where, tuple):
+                return indices
+            self._mask, self._maskIndices = where, indices
+
+        return self._maskIndices
+
     def __repr__(self):
         return "Constraint(value=%s, where=%s)" % (repr(self.value), repr(self.where))
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
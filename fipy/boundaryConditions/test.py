@@ -12,6 +12,7 @@ def _suite():
         docTestModuleNames = (
             'fipy.boundaryConditions.boundaryCondition',
             'fipy.boundaryConditions.fixedFlux',
+            'fipy.boundaryConditions.constraint',
         ))
 
 if __name__ == '__main__':
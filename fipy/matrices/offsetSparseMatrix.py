@@ -19,6 +19,13 @@ def OffsetSparseMatrix(SparseMatrix, numberOfVariables, numberOfEquations):
             SparseMatrix.__init__(self, mesh=mesh, bandwidth=bandwidth, sizeHint=sizeHint,
                                   numberOfVariables=numberOfVariables, numberOfEquations=numberOfEquations)
 
+        @classmethod
+        def _assemblyKey(cls):
+            # a new class is made for every assembly, so identify it by
+            # where it places its entries instead
+            return SparseMatrix._assemblyKey() + (numberOfVariables, numberOfEquations,
+                                                  cls.equationIndex, cls.varIndex)
+
         def put(self, vector, id1, id2):
             SparseMatrix.put(self, vector, id1 + self.mesh.numberOfCells * self.equationIndex, id2 + self.mesh.numberOfCells * self.varIndex)
 
@@ -4,11 +4,289 @@ __docformat__ = 'restructuredtext'
 
 __all__ = []
 
+from collections import OrderedDict
+import os
+
 import scipy.sparse as sp
 from fipy.tools import numerix
 
 from fipy.matrices.sparseMatrix import _SparseMatrix
 
+def _fingerprint(shape, values):
+    """Cheap lookup key for a large array of matrix positions
+
+    Hashing every position would cost about as much as the assembly it
+    is meant to save, so only a sample of `values` is used. Anything
+    found under this key must be confirmed with `numerix.array_equal`.
+    """
+    stride = max(1, len(values) // 64)
+    return (shape, len(values), values[::stride].tobytes())
+
+def _unique(values):
+    """Sorted unique `values` and the index of each value in them
+
+    Like `numerix.unique(values, return_inverse=True)`, but with a stable
+    sort, which is much faster for the long ordered runs that come from
+    mesh connectivity or from concatenated patterns.
+
+        >>> keys, inverse = _unique(numerix.array((3, 1, 3, 2)))
+        >>> print(keys)
+        [1 2 3]
+        >>> print(inverse)
+        [2 0 2 1]
+    """
+    order = numerix.argsort(values, kind="stable")
+    ordered = values[order]
+    first = numerix.empty(ordered.shape, dtype=bool)
+    first[:1] = True
+    numerix.not_equal(ordered[1:], ordered[:-1], out=first[1:])
+    inverse = numerix.empty(ordered.shape, dtype=numerix.int64)
+    inverse[order] = numerix.cumsum(first) - 1
+    return ordered[first], inverse
+
+def _scatterAdd(target, slots, data, unique):
+    """Add `data` to the `slots` of `target`
+
+    `slots` may be `None` if `data` is ordered like `target`. Repeated
+    slots are summed. `bincount` is faster than fancy indexing, even for
+    unique slots, unless only a few slots of a long `target` are set.
+    """
+    if slots is None:
+        target += data
+    elif unique and len(slots) * 8 < len(target):
+        target[slots] += data
+    elif numerix.iscomplexobj(data) or numerix.iscomplexobj(target):
+        numerix.add.at(target, slots, data)
+    else:
+        target += numerix.bincount(slots, weights=data, minlength=len(target))
+
+class _ScipySparsityPattern(object):
+    """Compressed Sparse Row structure of a set of matrix positions
+
+    The structure is stored in canonical form (sorted column indices
+    without duplicates), so that any `csr_matrix` built from it can be
+    added to in place.
+
+        >>> p = _ScipySparsityPattern(shape=(3, 3),
+        ...                           keys=numerix.array((1, 2, 4, 6, 8)))
+        >>> print(p.indptr)
+        [0 2 3 5]
+        >>> print(p.indices)
+        [1 2 1 0 2]
+    """
+    def __init__(self, shape, keys):
+        """
+        Parameters
+        ----------
+        shape : tuple of int
+            The shape of the matrix.
+        keys : ndarray of int
+            Sorted, unique, row-major positions `row * cols + col` of the
+            non-zeros.
+        """
+        self.shape = shape
+        self.keys = keys
+        self.nnz = len(keys)
+
+        rows, cols = shape
+        counts = numerix.bincount(keys // cols, minlength=rows)
+        if max(rows, cols, self.nnz) < 2**31:
+            indexType = numerix.int32
+        else:
+            indexType = numerix.int64
+        indptr = numerix.concatenate(([0], numerix.cumsum(counts)))
+        self.indptr = indptr.astype(indexType)
+        self.indices = (keys % cols).astype(indexType)
+
+        # patterns are shared by many matrices, so protect them
+        for arr in (self.keys, self.indptr, self.indices):
+            arr.flags.writeable = False
+
+    def csr_matrix(self, data):
+        """Wrap `data`, ordered according to this pattern, as a `csr_matrix`
+
+        The matrix gets its own, writable, copies of the index arrays, so
+        it can be modified like any other `csr_matrix`.
+        """
+        matrix = sp.csr_matrix((data, self.indices.copy(), self.indptr.copy()),
+                               shape=self.shape, copy=False)
+        matrix.has_sorted_indices = True
+        matrix.has_canonical_format = True
+        return matrix
+
+    def _slotType(self):
+        return numerix.int32 if self.nnz < 2**31 else numerix.int64
+
+    @property
+    def nbytes(self):
+        return self.keys.nbytes + self.indptr.nbytes + self.indices.nbytes
+
+def _nbytes(value):
+    """Bytes held by the arrays and patterns in `value`
+    """
+    if isinstance(value, tuple):
+        return sum(_nbytes(element) for element in value)
+    else:
+        return getattr(value, "nbytes", 0)
+
+class _ScipySparsityPatterns(object):
+    """Cache of the `_ScipySparsityPattern` objects used to assemble matrices
+
+    Builds each pattern, and each map from a set of (row, column)
+    triplets or from a pair of patterns to the slots of a pattern, only
+    once. Assembly of a matrix whose structure has been seen before is
+    then a scatter-add into its `data` array, without any sorting.
+
+        >>> cache = _ScipySparsityPatterns()
+        >>> p1, s1 = cache.triplets((3, 3), [0, 2, 0], [1, 2, 1])
+        >>> print(s1)
+        [0 1 0]
+        >>> p2, s2 = cache.triplets((3, 3), numerix.array([0, 2, 0]),
+        ...                         numerix.array([1, 2, 1]))
+        >>> p1 is p2 and s1 is s2
+        True
+        >>> p3, s3 = cache.triplets((3, 3), [1, 2], [1, 2])
+        >>> union, a, b = cache.union(p1, p3)
+        >>> print(union.keys)
+        [1 4 8]
+        >>> print(a)
+        [0 2]
+        >>> print(b)
+        [1 2]
+        >>> cache.union(p1, p3)[0] is union
+        True
+
+    A pattern that contains the other needs no map
+
+        >>> cache.union(union, p1)[0] is union
+        True
+        >>> print(cache.union(union, p1)[1])
+        None
+
+    The least recently used patterns and maps are forgotten to keep
+    within `maxbytes`
+
+        >>> small = _ScipySparsityPatterns(maxbytes=100)
+        >>> p4, s4 = small.triplets((3, 3), [0, 2, 0], [1, 2, 1])
+        >>> p5, s5 = small.triplets((3, 3), [1, 2], [1, 2])
+        >>> print(len(small._maps), small.nbytes <= 100)
+        1 True
+    """
+    def __init__(self, maxbytes=None):
+        """
+        Parameters
+        ----------
+        maxbytes : int, optional
+            The maximum number of bytes of patterns, triplet sets and maps
+            between patterns to remember. The least recently used are
+            forgotten first.  Defaults to the megabytes given by the
+            `FIPY_PATTERN_CACHE` environment variable, or 64.
+        """
+        if maxbytes is None:
+            maxbytes = int(float(os.environ.get("FIPY_PATTERN_CACHE", 64)) * 1024**2)
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._maps = OrderedDict()
+
+    def _remember(self, key, value):
+        nbytes = _nbytes(value)
+        if nbytes > self.maxbytes:
+            return value
+        self._forget(key)
+        self._maps[key] = (value, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.maxbytes:
+            self.nbytes -= self._maps.popitem(last=False)[1][1]
+        return value
+
+    def _forget(self, key):
+        value = self._maps.pop(key, None)
+        if value is not None:
+            self.nbytes -= value[1]
+
+    def _recall(self, key):
+        value = self._maps.pop(key, None)
+        if value is None:
+            return None
+        self._maps[key] = value
+        return value[0]
+
+    def _pattern(self, shape, keys):
+        """Obtain the shared pattern with positions `keys`
+        """
+        key = ("pattern",) + _fingerprint(shape, keys)
+        pattern = self._recall(key)
+        if pattern is None or not numerix.array_equal(pattern.keys, keys):
+            pattern = self._remember(key, _ScipySparsityPattern(shape=shape, keys=keys))
+        return pattern
+
+    def triplets(self, shape, id1, id2):
+        """Pattern of the positions (`id1`, `id2`) and the slot of each position
+
+        Returns
+        -------
+        pattern : ~fipy.matrices.scipyMatrix._ScipySparsityPattern
+        slots : ndarray of int
+            Index of each (`id1`, `id2`) pair in the `data` of `pattern`
+        """
+        id1 = numerix.asarray(id1)
+        id2 = numerix.asarray(id2)
+        positions = (id1.astype(numerix.int64) * shape[1] + id2).ravel()
+
+        key = ("triplets",) + _fingerprint(shape, positions)
+        value = self._recall(key)
+        if value is not None and numerix.array_equal(value[0], positions):
+            return value[1:]
+
+        keys, slots = _unique(positions)
+        pattern = self._pattern(shape, keys)
+        slots = slots.astype(pattern._slotType())
+        for arr in (positions, slots):
+            arr.flags.writeable = False
+        return self._remember(key, (positions, pattern, slots))[1:]
+
+    def matrix(self, matrix):
+        """Pattern of an arbitrary `csr_matrix`
+
+        Brings `matrix` to canonical form, so that its `data` is ordered
+        according to the returned pattern.
+        """
+        matrix.sum_duplicates()
+        rows = numerix.repeat(numerix.arange(matrix.shape[0], dtype=numerix.int64),
+                              numerix.diff(matrix.indptr))
+        keys = rows * matrix.shape[1] + matrix.indices
+        return self._pattern(matrix.shape, keys)
+
+    def union(self, pattern1, pattern2):
+        """Pattern holding the positions of both `pattern1` and `pattern2`
+
+        Returns
+        -------
+        union : ~fipy.matrices.scipyMatrix._ScipySparsityPattern
+        slots1, slots2 : ndarray of int
+            Index of the entries of `pattern1` and of `pattern2` in the
+            `data` of `union`, or `None` if the pattern is `union`
+        """
+        if pattern1 is pattern2:
+            return pattern1, None, None
+
+        key = ("union", id(pattern1), id(pattern2))
+        value = self._recall(key)
+        if value is not None and value[0] is pattern1 and value[1] is pattern2:
+            return value[2:]
+
+        n1 = pattern1.nnz
+        keys, slots = _unique(numerix.concatenate((pattern1.keys, pattern2.keys)))
+        union = self._pattern(pattern1.shape, keys)
+        slots = slots.astype(union._slotType())
+        slots = [slots[:n1], slots[n1:]]
+        for i, pattern in enumerate((pattern1, pattern2)):
+            if pattern is union:
+                slots[i] = None
+            else:
+                slots[i].flags.writeable = False
+        return self._remember(key, (pattern1, pattern2, union) + tuple(slots))[2:]
+
 class _ScipyMatrix(_SparseMatrix):
 
     """class wrapper for a scipy sparse matrix.
@@ -30,6 +308,66 @@ class _ScipyMatrix(_SparseMatrix):
 
         super(_ScipyMatrix, self).__init__()
 
+    @property
+    def _sparsityPatterns(self):
+        if not hasattr(self, "_patterns"):
+            self._patterns = _ScipySparsityPatterns()
+        return self._patterns
+
+    def _getPattern(self):
+        """The `_ScipySparsityPattern` of `self.matrix`
+        """
+        pattern, indices, indptr = getattr(self, "_pattern", (None, None, None))
+        if (pattern is None
+            or self.matrix.indices is not indices
+            or self.matrix.indptr is not indptr
+            or len(self.matrix.data) != pattern.nnz):
+            # `self.matrix` was not assembled from a known pattern
+            pattern = self._sparsityPatterns.matrix(self.matrix)
+            self._setPattern(pattern, self.matrix.data)
+        return pattern
+
+    def _setPattern(self, pattern, data):
+        self.matrix = pattern.csr_matrix(data)
+        # `self.matrix` is only known to still have this pattern while it
+        # holds these index arrays
+        self._pattern = (pattern, self.matrix.indices, self.matrix.indptr)
+
+    def _addPattern(self, pattern, data, slots=None):
+        """Add `data` to the matrix
+
+        Parameters
+        ----------
+        pattern : ~fipy.matrices.scipyMatrix._ScipySparsityPattern
+            The positions of the values to add.
+        data : ndarray
+            The values to add.
+        slots : ndarray of int, optional
+            Index of each element of `data` in `pattern`. If `None`,
+            `data` is ordered according to `pattern`.
+        """
+        # the slots of a set of triplets are unique if it has no repeated
+        # positions, and mapping into a union preserves that
+        unique = slots is None or len(slots) == pattern.nnz
+
+        current = self._getPattern()
+        dtype = numerix.result_type(self.matrix.data, data)
+        if current.nnz == 0:
+            union, slots2 = pattern, None
+            self._setPattern(union, numerix.zeros(union.nnz, dtype=dtype))
+        else:
+            union, slots1, slots2 = self._sparsityPatterns.union(current, pattern)
+            if union is not current:
+                newData = numerix.zeros(union.nnz, dtype=dtype)
+                _scatterAdd(newData, slots1, self.matrix.data, unique=True)
+                self._setPattern(union, newData)
+            elif self.matrix.data.dtype != dtype:
+                self._setPattern(union, self.matrix.data.astype(dtype))
+
+        if slots2 is not None:
+            slots = slots2 if slots is None else slots2[slots]
+        _scatterAdd(self.matrix.data, slots, data, unique=unique)
+
     def copy(self):
         return _ScipyMatrix(matrix=self.matrix.copy())
 
@@ -44,7 +382,10 @@ class _ScipyMatrix(_SparseMatrix):
         return self._iadd(other)
 
     def _iadd(self, other, sign=1):
-        if hasattr(other, "matrix"):
+        if isinstance(other, _ScipyMatrix) and other.matrix.shape == self.matrix.shape:
+            pattern = other._getPattern()
+            self._addPattern(pattern, sign * other.matrix.data)
+        elif hasattr(other, "matrix"):
             self.matrix = self.matrix + (sign * other.matrix)
         elif isinstance(other, (float, int)):
             fillVec = numerix.repeat(other, self.matrix.nnz)
@@ -186,14 +527,53 @@ class _ScipyMatrix(_SparseMatrix):
                 ---    10.000000   3.000000  
                 ---     3.141593      ---    
              2.500000      ---        ---    
+
+        Each value put at a repeated position replaces the value the
+        position had before the call, and the replacements add up
+
+            >>> L.put([1., 2.], [0, 0], [1, 1])
+            >>> print(L[0, 1])
+            -7.0
+
+        Entries that become zero stay in the structure of the matrix, so
+        that matrices assembled in the same way share their structure
+
+            >>> L.put([0.], [1], [1])
+            >>> print(L.matrix.nnz)
+            4
+            >>> L.matrix.eliminate_zeros()
+            >>> print(L.matrix.nnz)
+            3
+
+        Complex values make the matrix complex
+
+            >>> L.put([1j], [2], [0])
+            >>> print(L.matrix[2, 0])
+            1j
         """
         assert len(id1) == len(id2) == len(vector)
 
-        # done in such a way to vectorize everything
-        tempVec = numerix.array(vector) - self.matrix[id1, id2].flat
-        tempMat = sp.csr_matrix((tempVec, (id1, id2)), self.matrix.shape)
-
-        self.matrix = self.matrix + tempMat
+        pattern, slots = self._sparsityPatterns.triplets(self._shape, id1, id2)
+        current = self._getPattern()
+        dtype = numerix.result_type(self.matrix.data, numerix.asarray(vector))
+        union, slots1, slots2 = self._sparsityPatterns.union(current, pattern)
+        if union is not current:
+            newData = numerix.zeros(union.nnz, dtype=dtype)
+            newData[slots1] = self.matrix.data
+            self._setPattern(union, newData)
+        elif self.matrix.data.dtype != dtype:
+            self._setPattern(union, self.matrix.data.astype(dtype))
+        if slots2 is not None:
+            slots = slots2[slots]
+
+        data = self.matrix.data
+        if len(slots) == pattern.nnz:
+            data[slots] = vector
+        else:
+            # as `csr_matrix` sums repeated positions, add the change from
+            # the current value for each occurrence
+            _scatterAdd(data, slots, numerix.asarray(vector) - data[slots],
+                        unique=False)
 
     def putDiagonal(self, vector):
         """
@@ -249,9 +629,8 @@ class _ScipyMatrix(_SparseMatrix):
         """
         assert len(id1) == len(id2) == len(vector)
 
-        temp = sp.csr_matrix((vector, (id1, id2)), self.matrix.shape)
-
-        self.matrix = self.matrix + temp
+        pattern, slots = self._sparsityPatterns.triplets(self._shape, id1, id2)
+        self._addPattern(pattern, numerix.asarray(vector).ravel(), slots=slots)
 
     def addAtDiagonal(self, vector):
         if isinstance(vector, (int, float)):
@@ -429,6 +808,14 @@ class _ScipyBaseMeshMatrix(_ScipyMatrixFromShape):
                                                    matrix=matrix,
                                                    storeZeros=storeZeros)
 
+    @property
+    def _sparsityPatterns(self):
+        # the connectivity of a mesh never changes, so every matrix
+        # assembled on it can share the same patterns
+        if not hasattr(self.mesh, "_scipySparsityPatterns"):
+            self.mesh._scipySparsityPatterns = _ScipySparsityPatterns()
+        return self.mesh._scipySparsityPatterns
+
     def _getGhostedValues(self, var):
         """Obtain current ghost values from across processes
 
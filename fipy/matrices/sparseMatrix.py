@@ -30,6 +30,14 @@ class _SparseMatrix(object):
     def copy(self):
         raise NotImplementedError
 
+    @classmethod
+    def _assemblyKey(cls):
+        """Objects that identify the matrices built by this class
+
+        Matrices built with equal keys can be reused in place of each other.
+        """
+        return (cls,)
+
     def __getitem__(self, index):
         raise NotImplementedError
 
@@ -7,6 +7,8 @@ __docformat__ = 'restructuredtext'
 
 __all__ = []
 
+import weakref
+
 from PyTrilinos import Epetra
 from PyTrilinos import EpetraExt
 
@@ -32,6 +34,24 @@ from fipy.tools import numerix
 # the warnings that guard for those, and all tests pass. Because of the way
 # FiPy constructs its matrices, I do not anticipate any of these occurring.
 
+# The distributed maps of a mesh, and the plans to communicate between
+# them, only depend on how the mesh is partitioned, which never changes.
+# Building them requires collective communication, so they are kept for
+# as long as the mesh lives.
+_epetraObjects = weakref.WeakKeyDictionary()
+
+def _cachedEpetraObject(mesh, key, create):
+    """Epetra object of `mesh` identified by `key`, made by `create()` the
+    first time it is asked for
+
+    Every process must ask for the same objects, in the same order, as
+    `create()` may be collective.
+    """
+    objects = _epetraObjects.setdefault(mesh, {})
+    if key not in objects:
+        objects[key] = create()
+    return objects[key]
+
 class _TrilinosMatrix(_SparseMatrix):
     """class wrapper for a PyTrilinos `Epetra.CrsMatrix`.
 
@@ -805,7 +825,8 @@ class _TrilinosBaseMeshMatrix(_TrilinosMatrixFromShape):
         # If NumGlobalElements = -1 and NumMyElements is passed in then
         # NumGlobalElements will be computed as the sum of NumMyElements across
         # all processors.
-        return Epetra.Map(-1, self.rows, 0, comm)
+        return _cachedEpetraObject(self.mesh, ("rowMap", self.rows),
+                                   lambda: Epetra.Map(-1, self.rows, 0, comm))
 
     @property
     def colMap(self):
@@ -814,7 +835,19 @@ class _TrilinosBaseMeshMatrix(_TrilinosMatrixFromShape):
         # If NumGlobalElements = -1 and NumMyElements is passed in then
         # NumGlobalElements will be computed as the sum of NumMyElements across
         # all processors.
-        return Epetra.Map(-1, self.cols, 0, comm)
+        return _cachedEpetraObject(self.mesh, ("colMap", self.cols),
+                                   lambda: Epetra.Map(-1, self.cols, 0, comm))
+
+    @property
+    def _colMapImport(self):
+        """Plan to import from `domainMap` into the ghosted `colMap`
+        """
+        colMap = self.colMap
+        domainMap = self.domainMap
+        # the maps are cached for the life of the mesh, so their ids are
+        # not reused
+        return _cachedEpetraObject(self.mesh, ("Import", id(colMap), id(domainMap)),
+                                   lambda: Epetra.Import(colMap, domainMap))
 
     def copy(self):
         tmp = super(_TrilinosBaseMeshMatrix, self).copy()
@@ -847,7 +880,7 @@ class _TrilinosBaseMeshMatrix(_TrilinosMatrixFromShape):
 
         overlappingVector = Epetra.Vector(self.colMap)
         overlappingVector.Import(nonOverlappingVector,
-                                 Epetra.Import(self.colMap, self.domainMap),
+                                 self._colMapImport,
                                  Epetra.Insert)
 
         return numerix.reshape(numerix.asarray(overlappingVector), var.shape)
@@ -927,7 +960,12 @@ class _TrilinosRowMeshMatrix(_TrilinosBaseMeshMatrix):
         comm = self.mesh.communicator.epetra_comm
         # Epetra.Map(numGlobalElements, myGlobalElements, indexBase, comm)
         # Specify -1 to have the constructor compute the number of global elements.
-        return Epetra.Map(-1, list(self._m2m.globalNonOverlappingRowIDs), 0, comm)
+        return _cachedEpetraObject(self.mesh,
+                                   ("globalNonOverlappingRowIDs",
+                                    self._m2m.numberOfEquations),
+                                   lambda: Epetra.Map(
+                                       -1, list(self._m2m.globalNonOverlappingRowIDs),
+                                       0, comm))
 
     @property
     def domainMap(self):
@@ -976,7 +1014,12 @@ class _TrilinosColMeshMatrix(_TrilinosBaseMeshMatrix):
         comm = self.mesh.communicator.epetra_comm
         # Epetra.Map(numGlobalElements, myGlobalElements, indexBase, comm)
         # Specify -1 to have the constructor compute the number of global elements.
-        return Epetra.Map(-1, list(self._m2m.globalOverlappingColIDs), 0, comm)
+        return _cachedEpetraObject(self.mesh,
+                                   ("globalOverlappingColIDs",
+                                    self._m2m.numberOfVariables),
+                                   lambda: Epetra.Map(
+                                       -1, list(self._m2m.globalOverlappingColIDs),
+                                       0, comm))
 
     @property
     def domainMap(self):
@@ -988,7 +1031,12 @@ class _TrilinosColMeshMatrix(_TrilinosBaseMeshMatrix):
         comm = self.mesh.communicator.epetra_comm
         # Epetra.Map(numGlobalElements, myGlobalElements, indexBase, comm)
         # Specify -1 to have the constructor compute the number of global elements.
-        return Epetra.Map(-1, list(self._m2m.globalNonOverlappingColIDs), 0, comm)
+        return _cachedEpetraObject(self.mesh,
+                                   ("globalNonOverlappingColIDs",
+                                    self._m2m.numberOfVariables),
+                                   lambda: Epetra.Map(
+                                       -1, list(self._m2m.globalNonOverlappingColIDs),
+                                       0, comm))
 
 class _TrilinosMeshMatrix(_TrilinosRowMeshMatrix):
     def __init__(self, mesh, numberOfVariables=1, numberOfEquations=1,
@@ -1030,7 +1078,12 @@ class _TrilinosMeshMatrix(_TrilinosRowMeshMatrix):
         comm = self.mesh.communicator.epetra_comm
         # Epetra.Map(numGlobalElements, myGlobalElements, indexBase, comm)
         # Specify -1 to have the constructor compute the number of global elements.
-        return Epetra.Map(-1, list(self._m2m.globalOverlappingColIDs), 0, comm)
+        return _cachedEpetraObject(self.mesh,
+                                   ("globalOverlappingColIDs",
+                                    self._m2m.numberOfVariables),
+                                   lambda: Epetra.Map(
+                                       -1, list(self._m2m.globalOverlappingColIDs),
+                                       0, comm))
 
     def asTrilinosMeshMatrix(self):
         self.finalize()
@@ -1054,8 +1107,7 @@ class _TrilinosMeshMatrix(_TrilinosRowMeshMatrix):
 
         overlapping_result = Epetra.Vector(self.colMap)
         overlapping_result.Import(nonoverlapping_result,
-                                  Epetra.Import(self.colMap,
-                                                self.domainMap),
+                                  self._colMapImport,
                                   Epetra.Insert)
 
         return overlapping_result
@@ -1136,8 +1188,7 @@ class _TrilinosMeshMatrix(_TrilinosRowMeshMatrix):
                     if other_map.SameAs(self.colMap):
                         overlapping_result = Epetra.Vector(self.colMap)
                         overlapping_result.Import(nonoverlapping_result,
-                                                  Epetra.Import(self.colMap,
-                                                                self.domainMap),
+                                                  self._colMapImport,
                                                   Epetra.Insert)
 
                         return overlapping_result
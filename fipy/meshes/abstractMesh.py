@@ -20,6 +20,41 @@ from fipy.meshes.topologies.abstractTopology import _AbstractTopology
 class MeshAdditionError(Exception):
     pass
 
+def _invertMatrices(mat):
+    """Invert the (D, D) matrix of each of the N elements of a (D, D, N) array
+
+    Matrices of up to three dimensions are inverted in closed form.
+
+        >>> mat = numerix.array([[[2., 1.], [0., 1.], [1., 0.]],
+        ...                      [[0., 2.], [3., 1.], [0., 1.]],
+        ...                      [[1., 0.], [0., 1.], [4., 2.]]])
+        >>> inverse = _invertMatrices(mat)
+        >>> print(numerix.allclose(numerix.einsum('ijn,jkn->ikn', inverse, mat),
+        ...                        numerix.eye(3)[..., numerix.newaxis]))
+        True
+        >>> print(_invertMatrices(numerix.array([[[2., 4.]]])))
+        [[[ 0.5   0.25]]]
+    """
+    D = mat.shape[0]
+    if D == 1:
+        return 1. / mat
+    elif D == 2:
+        det = mat[0, 0] * mat[1, 1] - mat[0, 1] * mat[1, 0]
+        return numerix.array([[mat[1, 1], -mat[0, 1]],
+                              [-mat[1, 0], mat[0, 0]]]) / det
+    elif D == 3:
+        # transposed matrix of cofactors
+        adj = numerix.empty_like(mat)
+        for i in range(3):
+            i1, i2 = (i + 1) % 3, (i + 2) % 3
+            for j in range(3):
+                j1, j2 = (j + 1) % 3, (j + 2) % 3
+                adj[j, i] = mat[i1, j1] * mat[i2, j2] - mat[i1, j2] * mat[i2, j1]
+        det = numerix.sum(mat[0] * adj[:, 0], axis=0)
+        return adj / det
+    else:
+        return numerix.linalg.inv(mat.transpose((2, 0, 1))).transpose((1, 2, 0))
+
 class AbstractMesh(object):
     """
     A class encapsulating all commonalities among meshes in FiPy.
@@ -36,6 +71,11 @@ class AbstractMesh(object):
     def _setGeometry(self):
         raise NotImplementedError
 
+    def _geometryChanged(self):
+        """Discard anything derived from the geometry of the mesh
+        """
+        self._leastSquaresInverseData = None
+
     """
     Scale business
     """
@@ -48,6 +88,7 @@ class AbstractMesh(object):
         scaleLength : float
         """
         self._scale['length'] = scaleLength
+        self._geometryChanged()
 
     scale = property(lambda s: s._scale, _setScale)
 
@@ -256,6 +297,7 @@ class AbstractMesh(object):
                                       cellFaceIDs[i])
             ## add those faces back to the main self.cellFaceIDs
             numerix.put(self.cellFaceIDs[i], faceCellIDs, cellFaceIDs[i])
+        self._cellFacePairsData = None
 
         ## calculate new topology
         self._setTopology()
@@ -692,6 +734,49 @@ class AbstractMesh(object):
         """
         return self.topology._localOverlappingFaceIDs
 
+    def _gatheredIDs(self, name, root=None):
+        """The global IDs `name`, e.g., "_globalNonOverlappingCellIDs", of
+        every processor
+
+        The IDs are only communicated the first time they are asked for.
+
+            >>> from fipy import Grid1D
+            >>> mesh = Grid1D(nx=3)
+            >>> ids = mesh._gatheredIDs("_globalNonOverlappingCellIDs", root=0)
+            >>> print(numerix.concatenate(ids)) # doctest: +SERIAL
+            [0 1 2]
+            >>> ids is mesh._gatheredIDs("_globalNonOverlappingCellIDs", root=0)
+            True
+
+        Parameters
+        ----------
+        name : str
+            Name of the property holding the IDs of this processor.
+        root : int
+            Processor to gather the IDs on.  All processors, if `None`.
+
+        Returns
+        -------
+        list of ndarray
+            The IDs of each processor, or `None` on processors other than
+            `root`.
+        """
+        if getattr(self, "_gatheredIDsData", None) is None:
+            self._gatheredIDsData = {}
+
+        key = (name, root)
+        if key not in self._gatheredIDsData:
+            ids = getattr(self, name)
+            if self.communicator.Nproc == 1:
+                gathered = [ids]
+            elif root is None:
+                gathered = self.communicator.allgather(ids)
+            else:
+                gathered = self.communicator.gather(ids, root=root)
+            self._gatheredIDsData[key] = gathered
+
+        return self._gatheredIDsData[key]
+
     @property
     def _vertexCellIDs(self):
         """Return cell IDs bounded by each vertex
@@ -914,6 +999,102 @@ class AbstractMesh(object):
     def _cellAreaProjections(self):
         return self._cellNormals * self._cellAreas
 
+    @property
+    def _cellFacePairs(self):
+        """The faces of each cell, as a compact alternative to the masked
+        `cellFaceIDs`
+
+        Returns the `cellIDs` and `faceIDs` of each face of each cell and
+        the `slots` of those faces in `cellFaceIDs`, such that
+        `cellFaceIDs[slots, cellIDs] == faceIDs`, with no entries for the
+        faces a cell does not have.  They are computed once, until faces
+        are connected.
+
+            >>> from fipy.meshes import Grid2D, Tri2D
+            >>> mesh = Grid2D(nx=1, ny=1) + (Tri2D(nx=1, ny=1) + ((1,), (0,)))
+            >>> print(mesh.cellFaceIDs)
+            [[0 6 5 3 4]
+             [3 8 9 7 7]
+             [1 10 10 9 8]
+             [2 -- -- -- --]]
+            >>> cellIDs, faceIDs, slots = mesh._cellFacePairs
+            >>> print(cellIDs)
+            [0 1 2 3 4 0 1 2 3 4 0 1 2 3 4 0]
+            >>> print(faceIDs)
+            [ 0  6  5  3  4  3  8  9  7  7  1 10 10  9  8  2]
+            >>> print(numerix.allequal(mesh.cellFaceIDs[slots, cellIDs], faceIDs))
+            True
+            >>> mesh._cellFacePairs is mesh._cellFacePairs
+            True
+        """
+        if getattr(self, "_cellFacePairsData", None) is None:
+            cellFaceIDs = self.cellFaceIDs
+            slots, cellIDs = numerix.nonzero(~MA.getmaskarray(cellFaceIDs))
+            faceIDs = numerix.asarray(MA.getdata(cellFaceIDs))[slots, cellIDs]
+            self._cellFacePairsData = (cellIDs, faceIDs, slots)
+        return self._cellFacePairsData
+
+    @property
+    def _leastSquaresDistanceNormals(self):
+        """The (D, M, N) cell-to-cell distance times the normal of each face
+        of each cell, zero for the faces a cell does not have
+        """
+        return MA.filled(self._cellToCellDistances * self._cellNormals, 0)
+
+    def cacheLeastSquaresGrad(self, cache=True):
+        """Keep the inverse normal matrix of each cell, which
+        :attr:`~fipy.variables.cellVariable.CellVariable.leastSquaresGrad`
+        needs, from one evaluation to the next
+
+        The inverses only depend on the geometry of the mesh, but take
+        `D * D` values per cell, so they are only kept when requested.
+        They are discarded if the geometry of the mesh changes.
+
+            >>> from fipy import Grid3D
+            >>> from fipy.meshes.mesh import Mesh
+            >>> grid = Grid3D(nx=2, ny=2, nz=2)
+            >>> mesh = Mesh(grid.vertexCoords, grid.faceVertexIDs, grid.cellFaceIDs)
+            >>> distanceNormals = mesh._leastSquaresDistanceNormals
+            >>> inverse = mesh._leastSquaresInverse(distanceNormals)
+            >>> inverse is mesh._leastSquaresInverse(distanceNormals)
+            False
+            >>> mesh.cacheLeastSquaresGrad()
+            >>> inverse = mesh._leastSquaresInverse(distanceNormals)
+            >>> inverse is mesh._leastSquaresInverse(distanceNormals)
+            True
+            >>> mesh._handleFaceConnection()
+            >>> inverse is mesh._leastSquaresInverse(distanceNormals)
+            False
+
+        The inverses of uniform grids, whose geometry is recomputed on
+        request, are kept too
+
+            >>> grid.cacheLeastSquaresGrad()
+            >>> distanceNormals = grid._leastSquaresDistanceNormals
+            >>> inverse = grid._leastSquaresInverse(distanceNormals)
+            >>> inverse is grid._leastSquaresInverse(distanceNormals)
+            True
+
+        Parameters
+        ----------
+        cache : bool
+            Whether to keep the inverses.
+        """
+        self._cacheLeastSquares = cache
+        self._leastSquaresInverseData = None
+
+    def _leastSquaresInverse(self, distanceNormals):
+        """The (D, D, N) inverse of the normal matrix of the least-squares
+        gradient of each cell, given its `_leastSquaresDistanceNormals`
+        """
+        inverse = getattr(self, "_leastSquaresInverseData", None)
+        if inverse is None:
+            mat = numerix.einsum('imn,jmn->ijn', distanceNormals, distanceNormals)
+            inverse = _invertMatrices(mat)
+            if getattr(self, "_cacheLeastSquares", False):
+                self._leastSquaresInverseData = inverse
+        return inverse
+
     """
     Special methods
     """
@@ -0,0 +1,170 @@
+"""Memory-budgeted cache of the derived geometry of uniform grids
+
+The geometry of a `UniformGrid2D` or `UniformGrid3D` (cell centers,
+face centers, cell distances, adjacency, ...) is not stored, but is
+recomputed from `nx`, `dx`, etc. every time it is requested.  This keeps
+uniform grids small, but repeats the same work on every sweep of a
+solution.
+
+When a geometry cache is enabled, either for all uniform grids with the
+`FIPY_GEOMETRY_CACHE` environment variable (a budget in megabytes) or
+for a single mesh with :meth:`~fipy.meshes.uniformGrid.UniformGrid.cacheGeometry`,
+each property is computed the first time it is requested and kept for
+later requests, until the geometry of the mesh changes.  The cached
+arrays are made read-only, so copy them before modifying them.  If the cached
+arrays would exceed the budget, the least recently used arrays are
+evicted until the new array fits.  An array larger than the whole budget
+is simply not cached.
+
+    >>> from fipy import numerix
+    >>> cache = _GeometryCache(budget=100)
+    >>> calls = []
+    >>> def compute():
+    ...     calls.append(1)
+    ...     return numerix.arange(10.)
+    >>> a = cache.get("a", compute)
+    >>> a is cache.get("a", compute)
+    True
+    >>> len(calls), cache.nbytes
+    (1, 80)
+    >>> a[0] = 3.
+    Traceback (most recent call last):
+        ...
+    ValueError: assignment destination is read-only
+
+Adding a second array that does not fit evicts the least recently used one
+
+    >>> b = cache.get("b", lambda: numerix.zeros(5))
+    >>> list(cache._arrays.keys()), cache.nbytes
+    (['b'], 40)
+
+and arrays larger than the whole budget are never cached
+
+    >>> c = cache.get("c", lambda: numerix.zeros(20))
+    >>> list(cache._arrays.keys()), cache.nbytes
+    (['b'], 40)
+    >>> c[0] = 1.
+
+A budget of `None` does not limit the cache
+
+    >>> cache = _GeometryCache(budget=None)
+    >>> c = cache.get("c", lambda: numerix.zeros(20))
+    >>> cache.nbytes
+    160
+"""
+from __future__ import unicode_literals
+from builtins import object
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+import os
+from collections import OrderedDict
+import functools
+
+from fipy.tools import numerix
+
+def _arrays(value):
+    if isinstance(value, tuple):
+        return value
+    else:
+        return (value,)
+
+def _nbytes(value):
+    return sum(getattr(a, "nbytes", 0) for a in _arrays(value))
+
+def _freeze(value):
+    for a in _arrays(value):
+        if isinstance(a, numerix.ndarray):
+            a.flags.writeable = False
+    return value
+
+class _GeometryCache(object):
+    """Least recently used cache of geometry arrays with a memory budget
+    """
+    def __init__(self, budget=None):
+        """
+        Parameters
+        ----------
+        budget : int, optional
+            Maximum number of bytes to hold.  `None` for no limit.
+        """
+        self.budget = budget
+        self.nbytes = 0
+        self._arrays = OrderedDict()
+
+    def get(self, name, compute):
+        """Return the cached value of `name`, calling `compute()` if needed
+        """
+        if name in self._arrays:
+            value = self._arrays.pop(name)
+            self._arrays[name] = value
+            return value
+
+        value = compute()
+        nbytes = _nbytes(value)
+        if self.budget is not None and nbytes > self.budget:
+            return value
+
+        if self.budget is not None:
+            while self._arrays and self.nbytes + nbytes > self.budget:
+                _, evicted = self._arrays.popitem(last=False)
+                self.nbytes -= _nbytes(evicted)
+
+        self._arrays[name] = _freeze(value)
+        self.nbytes += nbytes
+
+        return value
+
+    def clear(self):
+        self._arrays.clear()
+        self.nbytes = 0
+
+def _parseBudget(budget):
+    """Convert a budget in megabytes, such as `FIPY_GEOMETRY_CACHE`, to bytes
+
+    Returns `None` if the cache is not requested.
+
+        >>> print(_parseBudget("1.5"))
+        1572864
+        >>> print(_parseBudget("0"))
+        None
+        >>> print(_parseBudget(None))
+        None
+    """
+    if budget is None:
+        return None
+    budget = int(float(budget) * 1024**2)
+    if budget <= 0:
+        return None
+    return budget
+
+def _defaultCache():
+    """A new cache, if one is requested by `FIPY_GEOMETRY_CACHE`, else `None`
+    """
+    budget = _parseBudget(os.environ.get("FIPY_GEOMETRY_CACHE", None))
+    if budget is None:
+        return None
+    return _GeometryCache(budget=budget)
+
+def _cachedGeometry(fget):
+    """Property whose value is held in the mesh's geometry cache, if any
+    """
+    name = fget.__name__
+
+    @functools.wraps(fget)
+    def wrapper(self):
+        cache = self._geometryCache
+        if cache is None:
+            return fget(self)
+        else:
+            return cache.get(name, lambda: fget(self))
+
+    return property(wrapper)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
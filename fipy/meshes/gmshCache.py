@@ -0,0 +1,189 @@
+"""On-disk cache of the meshes read from Gmsh
+
+Generating a mesh with Gmsh and parsing the resulting `.msh` file can
+take much longer than the simulation that uses it.  When the
+`FIPY_GMSH_CACHE` environment variable names a directory, `Gmsh2D` and
+`Gmsh3D` store what they read from Gmsh there, as `.npy` arrays, and
+later constructions from the same input memory-map them instead of
+running and parsing Gmsh again.
+
+An entry is identified by a hash of the Gmsh script or `.msh` file, the
+Gmsh version, the number of partitions and the arguments that affect
+how the mesh is read.  Each processor stores and loads its own
+partition.
+
+    >>> import shutil
+    >>> import tempfile
+    >>> from fipy.tools import numerix
+    >>> directory = tempfile.mkdtemp()
+    >>> cache = _GmshCache(directory)
+
+    >>> key = cache.key("Point(1) = {0, 0, 0, 1};", version="4.6.0",
+    ...                 Nproc=1, dimensions=2, coordDimensions=2, overlap=1)
+    >>> key == cache.key("Point(1) = {0, 0, 0, 1};", version="4.6.0",
+    ...                  Nproc=1, dimensions=2, coordDimensions=2, overlap=1)
+    True
+    >>> key == cache.key("Point(1) = {0, 0, 0, 1};", version="4.6.0",
+    ...                  Nproc=2, dimensions=2, coordDimensions=2, overlap=1)
+    False
+    >>> print(cache.load(key, procID=0))
+    None
+
+    >>> cellVertexIDs = numerix.MA.masked_equal([[0, 1], [2, -1]], -1)
+    >>> cache.save(key, procID=0,
+    ...            arrays=dict(vertexCoords=numerix.array([[0., 1., 2.]]),
+    ...                        cellVertexIDs=cellVertexIDs),
+    ...            metadata=dict(Nproc=1))
+    >>> arrays, metadata = cache.load(key, procID=0)
+    >>> print(arrays["vertexCoords"])
+    [[ 0.  1.  2.]]
+    >>> print(arrays["cellVertexIDs"])
+    [[0 1]
+     [2 --]]
+    >>> print(metadata["Nproc"])
+    1
+
+    >>> shutil.rmtree(directory)
+"""
+from __future__ import unicode_literals
+from builtins import object
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from fipy.tools import numerix
+
+class _GmshCache(object):
+    """Directory of meshes read from Gmsh, one subdirectory per entry
+    """
+    def __init__(self, directory):
+        self.directory = directory
+
+    @classmethod
+    def fromEnvironment(cls):
+        """The cache named by `FIPY_GMSH_CACHE`, or `None`
+        """
+        directory = os.environ.get("FIPY_GMSH_CACHE", None)
+        if not directory:
+            return None
+        return cls(os.path.expanduser(directory))
+
+    def key(self, arg, version, **kwargs):
+        """Hash of everything that determines the mesh read from `arg`
+
+        Parameters
+        ----------
+        arg : str
+            Gmsh script, or the name of a `.geo` or `.msh` file.
+        version : str
+            Version of Gmsh.
+        **kwargs
+            Anything else that affects the mesh, such as the number of
+            partitions.
+        """
+        digest = hashlib.sha256()
+        if os.path.exists(arg):
+            with open(arg, 'rb') as f:
+                for block in iter(lambda: f.read(2**20), b""):
+                    digest.update(block)
+        else:
+            digest.update(arg.encode('utf-8'))
+        digest.update(str(version).encode('utf-8'))
+        digest.update(json.dumps(sorted(kwargs.items())).encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def _path(self, key, procID):
+        return os.path.join(self.directory, key, "%d" % procID)
+
+    def load(self, key, procID):
+        """Memory-map the arrays stored for partition `procID` of `key`
+
+        Arrays are mapped copy-on-write, so they can be modified without
+        affecting the cache.
+
+        Returns
+        -------
+        arrays : dict
+        metadata : dict
+            or `None` if there is no such entry.
+        """
+        path = self._path(key, procID)
+        try:
+            with open(os.path.join(path, "metadata.json"), 'r') as f:
+                metadata = json.load(f)
+
+            arrays = {}
+            for name in metadata["arrays"]:
+                # a plain `ndarray` view, as FiPy does not expect `memmap`
+                array = numerix.load(os.path.join(path, name + ".npy"), mmap_mode='c')
+                arrays[name] = numerix.asarray(array)
+            for name in metadata["masked"]:
+                arrays[name] = numerix.MA.array(arrays[name],
+                                                mask=arrays.pop(name + "Mask"))
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+
+        return arrays, metadata
+
+    def save(self, key, procID, arrays, metadata):
+        """Store the arrays for partition `procID` of `key`
+
+        Parameters
+        ----------
+        arrays : dict
+            Arrays, possibly masked, to store as `.npy` files.
+        metadata : dict
+            Anything else, which must be representable as JSON.
+        """
+        path = self._path(key, procID)
+        parent = os.path.dirname(path)
+        if not os.path.isdir(parent):
+            try:
+                os.makedirs(parent)
+            except OSError:
+                # another processor got there first
+                pass
+
+        # write to a scratch directory and rename it, so that
+        # an interrupted or concurrent save is never loaded
+        scratch = tempfile.mkdtemp(dir=parent)
+        try:
+            metadata = dict(metadata)
+            metadata["arrays"] = []
+            metadata["masked"] = []
+            for name, value in arrays.items():
+                if isinstance(value, numerix.MA.MaskedArray):
+                    metadata["masked"].append(name)
+                    metadata["arrays"].append(name + "Mask")
+                    numerix.save(os.path.join(scratch, name + "Mask.npy"),
+                                 numerix.MA.getmaskarray(value))
+                    value = numerix.MA.filled(value)
+                metadata["arrays"].append(name)
+                numerix.save(os.path.join(scratch, name + ".npy"),
+                             numerix.asarray(value))
+
+            with open(os.path.join(scratch, "metadata.json"), 'w') as f:
+                json.dump(metadata, f)
+
+            os.rename(scratch, path)
+        except OSError:
+            # the entry already exists or cannot be written;
+            # either way, the mesh itself is unaffected
+            pass
+        finally:
+            if os.path.exists(scratch):
+                shutil.rmtree(scratch)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -13,13 +13,13 @@ import sys
 import tempfile
 from textwrap import dedent
 import warnings
-from distutils.version import StrictVersion
 
 from fipy.tools import numerix as nx
 from fipy.tools import parallelComm
 from fipy.tools import serialComm
 from fipy.tests.doctestPlus import register_skipper
 
+from fipy.meshes.gmshCache import _GmshCache
 from fipy.meshes.mesh import Mesh
 from fipy.meshes.mesh2D import Mesh2D
 from fipy.meshes.topologies.meshTopology import _MeshTopology
@@ -32,13 +32,22 @@ __all__ = ["openMSHFile", "openPOSFile",
 from future.utils import text_to_native_str
 __all__ = [text_to_native_str(n) for n in __all__]
 
+def _StrictVersion(vstring):
+    """`distutils.version.StrictVersion`, imported on first use
+
+    Importing :mod:`distutils` drags in :mod:`setuptools`, which takes
+    longer than the rest of ``import fipy``.
+    """
+    from distutils import version
+    return version.StrictVersion(vstring)
+
 DEBUG = False
 
 def _checkForGmsh():
     hasGmsh = True
     try:
         version = _gmshVersion(communicator=parallelComm)
-        hasGmsh = version >= StrictVersion("2.0")
+        hasGmsh = version >= _StrictVersion("2.0")
     except Exception:
         hasGmsh = False
     return hasGmsh
@@ -93,12 +102,12 @@ def gmshVersion(communicator=parallelComm):
 def _gmshVersion(communicator=parallelComm):
     version = gmshVersion(communicator) or "0.0"
     try:
-        version = StrictVersion(version)
+        version = _StrictVersion(version)
     except ValueError:
         # gmsh returns the version string in stderr,
         # which means it's often unparsable due to irrelevant warnings
         # assume it's OK and move on
-        version = StrictVersion("3.0")
+        version = _StrictVersion("3.0")
 
     return version
 
@@ -133,7 +142,7 @@ def openMSHFile(name, dimensions=None, coordDimensions=None, communicator=parall
 
     # Enforce gmsh version to be either >= 2 or 2.5, based on Nproc.
     version = _gmshVersion(communicator=communicator)
-    if version < StrictVersion("2.0"):
+    if version < _StrictVersion("2.0"):
         raise EnvironmentError("Gmsh version must be >= 2.0.")
 
     # If we're being passed a .msh file, leave it be. Otherwise,
@@ -176,8 +185,8 @@ def openMSHFile(name, dimensions=None, coordDimensions=None, communicator=parall
             gmshFlags = ["-%d" % dimensions, "-nopopup"]
 
             if communicator.Nproc > 1:
-                if  ((version < StrictVersion("2.5"))
-                     or (StrictVersion("4.0") <= version < StrictVersion("4.5.2"))):
+                if  ((version < _StrictVersion("2.5"))
+                     or (_StrictVersion("4.0") <= version < _StrictVersion("4.5.2"))):
                     warnstr = ("Cannot partition with Gmsh version < 2.5 "
                                "or 4.0 <= version < 4.5.2. "
                                "Reverting to serial.")
@@ -190,7 +199,7 @@ def openMSHFile(name, dimensions=None, coordDimensions=None, communicator=parall
                         raise ValueError("'dimensions' must be specified to generate a mesh from a geometry script")
                 else: # gmsh version is adequate for partitioning
                     gmshFlags += ["-part", "%d" % communicator.Nproc]
-                    if version >= StrictVersion("4.0"):
+                    if version >= _StrictVersion("4.0"):
                         # Gmsh 4.x needs to be told to generate ghost cells
                         # Unfortunately, the ghosts are broken in Gmsh 4.0--4.5.1
                         # https://gitlab.onelab.info/gmsh/gmsh/issues/733
@@ -592,117 +601,102 @@ class MSHFile(GmshFile):
         """
         Uses element information obtained from `_parseElementFile` to deliver
         `facesToVertices` and `cellsToFaces`.
-        """
 
+        Faces are numbered in the order they are first encountered,
+        cell by cell.  Also returns the sorted vertex IDs of each face,
+        for matching against the faces named in the Gmsh file.
+        """
         allShapes  = nx.unique(shapeTypes).tolist()
         maxFaces   = max([self.numFacesPerCell[x] for x in allShapes])
+        numVerts   = (cellsToVertIDs >= 0).sum(axis=1)
+
+        # group cells that share a shape and a vertex count
+        groups = []
+        for shapeType in allShapes:
+            ofType = (shapeTypes == shapeType)
+            for count in nx.unique(numVerts[ofType]):
+                cells = nx.nonzero(ofType & (numVerts == count))[0]
+                groups.append((cells, self._faceOrderings(shapeType, count)))
+
+        faceLength = max([len(ordering)
+                          for cells, orderings in groups
+                          for ordering in orderings])
+
+        # short faces are padded with -1 at the front
+        cellFaces = nx.ones((numCells, maxFaces, faceLength), dtype=nx.INT_DTYPE) * -1
+        hasFace = nx.zeros((numCells, maxFaces), dtype=bool)
+        for cells, orderings in groups:
+            vertIDs = cellsToVertIDs[cells]
+            for faceIdx, ordering in enumerate(orderings):
+                start = faceLength - len(ordering)
+                cellFaces[cells, faceIdx, start:] = vertIDs[:, ordering]
+            hasFace[cells, :len(orderings)] = True
+
+        faces = cellFaces[hasFace]
+        firstFace, faceIDs = _uniqueRows(nx.sort(faces, axis=1))
 
         # `cellsToFaces` must be padded with -1; see mesh.py
-        currNumFaces = 0
         cellsToFaces = nx.ones((numCells, maxFaces), 'l') * -1
-        facesDict    = {}
-        uniqueFaces  = []
-
-        # we now build `cellsToFaces` and `uniqueFaces`,
-        # the latter will result in `facesToVertices`.
-        for cellIdx in range(numCells):
-            shapeType = shapeTypes[cellIdx]
-            cell = cellsToVertIDs[cellIdx]
-
-            if shapeType in [5, 12, 17]: # hexahedron
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2, 3], # ordering of vertices gleaned from
-                                                                 [4, 5, 6, 7], # a one-cube Grid3D example
-                                                                 [0, 1, 5, 4],
-                                                                 [3, 2, 6, 7],
-                                                                 [0, 3, 7, 4],
-                                                                 [1, 2, 6, 5]])
-            elif shapeType in [6, 13, 18]: # prism
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2],
-                                                                 [5, 4, 3],
-                                                                 [3, 4, 1, 0],
-                                                                 [4, 5, 2, 1],
-                                                                 [5, 3, 0, 2]])
-            elif shapeType in [7, 14, 19]: # pyramid
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2, 3],
-                                                                 [0, 1, 4],
-                                                                 [1, 2, 4],
-                                                                 [2, 3, 4],
-                                                                 [3, 0, 4]])
-            else:
-                if shapeType in [2, 9, 20, 21, 22, 23, 24, 25]:
-                    faceLength = 2 # triangle
-                elif shapeType in [3, 10, 16]:
-                    faceLength = 2 # quadrangle
-                elif shapeType in [4, 11, 29, 30, 31]:
-                    faceLength = 3 # tetrahedron
-
-                faces = self._extractRegularFaces(cell=cell,
-                                                  faceLength=faceLength,
-                                                  facesPerCell=self.numFacesPerCell[shapeType])
-
-            for faceIdx in range(len(faces)):
-                # NB: currFace is sorted for the key to spot duplicates
-                currFace = faces[faceIdx]
-                keyStr   = ' '.join([str(x) for x in sorted(currFace)])
-
-                if keyStr in facesDict:
-                    cellsToFaces[cellIdx][faceIdx] = facesDict[keyStr]
-                else: # new face
-                    facesDict[keyStr] = currNumFaces
-                    cellsToFaces[cellIdx][faceIdx] = currNumFaces
-                    uniqueFaces.append(currFace)
-                    currNumFaces += 1
-
-        # pad short faces with -1
-        maxFaceLen = max([len(f) for f in uniqueFaces])
-        uniqueFaces = [[-1] * (maxFaceLen - len(f)) + f for f in uniqueFaces]
-
-        facesToVertices = nx.array(uniqueFaces, dtype=nx.INT_DTYPE)
-
-        return facesToVertices.swapaxes(0, 1)[::-1], cellsToFaces.swapaxes(0, 1).copy('C'), facesDict
+        cellsToFaces[hasFace] = faceIDs
+
+        facesToVertices = faces[firstFace]
+
+        return (facesToVertices.swapaxes(0, 1)[::-1],
+                cellsToFaces.swapaxes(0, 1).copy('C'),
+                nx.sort(facesToVertices, axis=1))
 
     def _translateNodesToVertices(self, entitiesNodes, vertexMap):
-        """Translates e`ntitiesNodes` from Gmsh node IDs to `vertexCoords` indices.
-        """
-        entitiesVertices = []
+        """Translates `entitiesNodes` from Gmsh node IDs to `vertexCoords` indices.
 
-        for entity in entitiesNodes:
-            try:
-                vertIndices = vertexMap[nx.array(entity)]
-            except IndexError:
-                vertIndices = nx.ones((len(entity),), 'l') * -1
-            entitiesVertices.append(vertIndices)
+        `entitiesNodes` is padded with -1, as is the result.  Entities with
+        nodes outside of `vertexMap` are entirely -1.
+        """
+        isNode = (entitiesNodes >= 0)
+        isMapped = entitiesNodes < len(vertexMap)
+        isVertex = isNode & isMapped
+        entitiesVertices = nx.where(isVertex,
+                                    vertexMap[nx.where(isVertex, entitiesNodes, 0)],
+                                    -1)
+        entitiesVertices[(isNode & ~isMapped).any(axis=1)] = -1
 
         return entitiesVertices
 
-    def _extractRegularFaces(self, cell, faceLength, facesPerCell):
-        """Return faces for a regular poly(gon|hedron)
+    def _faceOrderings(self, shapeType, numVertices):
+        """Positions, within the cell, of the vertices of each face of a cell
 
-        Given `cell`, defined by node IDs, returns an array of
-        `facesPerCell` faces of length `faceLength` in terms of nodes.
-        """
-        faces = []
-        for i in range(facesPerCell):
-            aFace = []
-            for j in range(faceLength):
-                aVertex = (i + j) % len(cell) # we may wrap
-                aFace.append(int(cell[aVertex]))
-            faces.append(aFace)
-        return faces
-
-    def _extractOrderedFaces(self, cell, faceOrderings):
-        """Return faces for a 8-node hexahedron cell.
+        Gives the faces of a cell of Gmsh element type `shapeType` with
+        `numVertices` nodes.
         """
-        def orderingToFace(vertList):
-            aFace = []
-            for i in vertList:
-                aFace.append(int(cell[i]))
-            return aFace
+        if shapeType in [5, 12, 17]: # hexahedron
+            return [[0, 1, 2, 3], # ordering of vertices gleaned from
+                    [4, 5, 6, 7], # a one-cube Grid3D example
+                    [0, 1, 5, 4],
+                    [3, 2, 6, 7],
+                    [0, 3, 7, 4],
+                    [1, 2, 6, 5]]
+        elif shapeType in [6, 13, 18]: # prism
+            return [[0, 1, 2],
+                    [5, 4, 3],
+                    [3, 4, 1, 0],
+                    [4, 5, 2, 1],
+                    [5, 3, 0, 2]]
+        elif shapeType in [7, 14, 19]: # pyramid
+            return [[0, 1, 2, 3],
+                    [0, 1, 4],
+                    [1, 2, 4],
+                    [2, 3, 4],
+                    [3, 0, 4]]
+        else:
+            if shapeType in [2, 9, 20, 21, 22, 23, 24, 25]:
+                faceLength = 2 # triangle
+            elif shapeType in [3, 10, 16]:
+                faceLength = 2 # quadrangle
+            elif shapeType in [4, 11, 29, 30, 31]:
+                faceLength = 3 # tetrahedron
 
-        return [orderingToFace(o) for o in faceOrderings]
+            # a regular poly(gon|hedron); we may wrap
+            return [[(i + j) % numVertices for j in range(faceLength)]
+                    for i in range(self.numFacesPerCell[shapeType])]
 
     def read(self):
         """
@@ -730,23 +724,15 @@ class MSHFile(GmshFile):
             self.namesPath = None
 
         try:
-            if self.dimensions is None:
-                nodesFile = open(self.nodesPath, 'r')
-                nodesFile.readline() # skip number of nodes
+            nodeIDs, nodeCoords = self._parseNodesFile()
 
+            if self.dimensions is None:
                 # We assume we have a 2D file unless we find a node
                 # with a non-zero Z coordinate
-                self.dimensions = 2
-                for node in nodesFile:
-                    line   = node.split()
-
-                    newVert = [float(x) for x in line]
-
-                    if newVert[2] != 0.0:
-                        self.dimensions = 3
-                        break
-
-                nodesFile.close()
+                if (nodeCoords[..., 2] != 0.0).any():
+                    self.dimensions = 3
+                else:
+                    self.dimensions = 2
 
             self.coordDimensions = self.coordDimensions or self.dimensions
 
@@ -799,15 +785,13 @@ class MSHFile(GmshFile):
              ghostsData,
              facesData) = self._parseElementFile()
 
-            cellsToGmshVerts = cellsData.nodes + ghostsData.nodes
-            numCellsTotal    = len(cellsData.nodes) + len(ghostsData.nodes)
-            allShapeTypes    = cellsData.shapes + ghostsData.shapes
-            allShapeTypes    = nx.array(allShapeTypes)
-            allShapeTypes    = nx.delete(allShapeTypes, nx.s_[numCellsTotal:])
-            self.physicalCellMap = nx.array(cellsData.physicalEntities
-                                            + ghostsData.physicalEntities)
-            self.geometricalCellMap = nx.array(cellsData.geometricalEntities
-                                               + ghostsData.geometricalEntities)
+            cellsToGmshVerts = _concatenatePadded(cellsData.nodes, ghostsData.nodes)
+            numCellsTotal    = len(cellsToGmshVerts)
+            allShapeTypes    = nx.concatenate((cellsData.shapes, ghostsData.shapes))
+            self.physicalCellMap = nx.concatenate((cellsData.physicalEntities,
+                                                   ghostsData.physicalEntities))
+            self.geometricalCellMap = nx.concatenate((cellsData.geometricalEntities,
+                                                      ghostsData.geometricalEntities))
 
             if numCellsTotal < 1:
                 errStr = "Gmsh hasn't produced any cells! Check your Gmsh code."
@@ -816,7 +800,9 @@ class MSHFile(GmshFile):
 
             parprint("Recovering coords.")
             parprint("numcells %d" % numCellsTotal)
-            vertexCoords, vertIDtoIdx = self._vertexCoordsAndMap(cellsToGmshVerts)
+            vertexCoords, vertIDtoIdx = self._vertexCoordsAndMap(cellsToGmshVerts,
+                                                                 nodeIDs,
+                                                                 nodeCoords)
 
             # translate Gmsh IDs to `vertexCoord` indices
             cellsToVertIDs = self._translateNodesToVertices(cellsToGmshVerts,
@@ -825,32 +811,42 @@ class MSHFile(GmshFile):
             parprint("Building cells and faces.")
             (facesToV,
              cellsToF,
-             facesDict) = self._deriveCellsAndFaces(cellsToVertIDs,
-                                                    allShapeTypes,
-                                                    numCellsTotal)
+             faceKeys) = self._deriveCellsAndFaces(cellsToVertIDs,
+                                                   allShapeTypes,
+                                                   numCellsTotal)
 
             # cell entities were easy to record on parsing
             # but we don't use Gmsh faces, so we need to correlate the nodes
             # that make up the Gmsh faces with the vertex IDs of the FiPy faces
             # so that we can check if any are named
-            faceEntitiesDict = dict()
+            self.physicalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
+            self.geometricalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
 
             # translate Gmsh IDs to `vertexCoord` indices
             facesToVertIDs = self._translateNodesToVertices(facesData.nodes,
                                                             vertIDtoIdx)
 
-            for face, physicalEntity, geometricalEntity in zip(facesToVertIDs,
-                                                               facesData.physicalEntities,
-                                                               facesData.geometricalEntities):
-                faceEntitiesDict[' '.join([str(x) for x in sorted(face)])] = (physicalEntity, geometricalEntity)
-
-            self.physicalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
-            self.geometricalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
-            for face in list(facesDict.keys()):
-                # not all faces are necessarily tagged
-                if face in faceEntitiesDict:
-                    self.physicalFaceMap[facesDict[face]] = faceEntitiesDict[face][0]
-                    self.geometricalFaceMap[facesDict[face]] = faceEntitiesDict[face][1]
+            # faces with vertices that are not part of any cell,
+            # or with more vertices than any cell face, cannot match
+            numFaceVerts = (facesData.nodes >= 0).sum(axis=1)
+            faceLength = faceKeys.shape[-1]
+            candidates = ((numFaceVerts <= faceLength)
+                          & ((facesToVertIDs >= 0).sum(axis=1) == numFaceVerts))
+            candidates = nx.nonzero(candidates)[0]
+            taggedKeys = nx.sort(_padColumns(facesToVertIDs[candidates, :faceLength],
+                                             faceLength),
+                                 axis=1)
+
+            # the FiPy faces are all distinct, so they are the first
+            # occurrences of themselves; anything else is not a FiPy face
+            _, matches = _uniqueRows(nx.concatenate((faceKeys, taggedKeys)))
+            matches = matches[len(faceKeys):]
+            # not all faces are necessarily tagged
+            tagged = matches < len(faceKeys)
+            faces = matches[tagged]
+            candidates = candidates[tagged]
+            self.physicalFaceMap[faces] = facesData.physicalEntities[candidates]
+            self.geometricalFaceMap[faces] = facesData.geometricalEntities[candidates]
 
             self.physicalNames = self._parseNamesFile()
 
@@ -860,10 +856,7 @@ class MSHFile(GmshFile):
             if self.namesPath is not None:
                 os.unlink(self.namesPath)
 
-        # convert lists of cell vertices to a properly oriented masked array
-        maxVerts = max([len(v) for v in cellsToVertIDs])
-        # ticket:539 - NumPy 1.7 casts to array before concatenation and empty array defaults to float
-        cellsToVertIDs = [nx.concatenate((v, nx.array([-1] * (maxVerts-len(v)), dtype=nx.INT_DTYPE))) for v in cellsToVertIDs]
+        # convert padded cell vertices to a properly oriented masked array
         cellsToVertIDs = nx.MA.masked_equal(cellsToVertIDs, value=-1).swapaxes(0, 1)
 
         parprint("Done with cells and faces.")
@@ -998,48 +991,71 @@ class MSHFile(GmshFile):
 
         self.fileobj.write("$EndElementData\n")
 
-    def _vertexCoordsAndMap(self, cellsToGmshVerts):
+    def _vertexCoordsAndMap(self, cellsToGmshVerts, nodeIDs, nodeCoords):
         """
         Returns `vertexCoords` and mapping from Gmsh ID to `vertexCoords`
         indices (same as in `MSHFile`).
 
-        Unlike parent, doesn't use `genfromtxt`
-        because we want to avoid loading the entire `.msh` file into memory.
+        Only the nodes that are vertices of `cellsToGmshVerts` are kept.
         """
-        allVerts     = [v for c in cellsToGmshVerts for v in c] # flatten
-        allVerts     = nx.unique(nx.array(allVerts, dtype=nx.INT_DTYPE)) # remove dups
-        allVerts     = nx.sort(allVerts)
+        allVerts     = nx.unique(cellsToGmshVerts[cellsToGmshVerts >= 0]) # remove dups
         maxVertIdx   = allVerts[-1] + 1 # add one to offset zero
         vertGIDtoIdx = nx.ones(maxVertIdx, 'l') * -1 # gmsh ID -> vertexCoords idx
         vertexCoords = nx.empty((len(allVerts), self.coordDimensions))
-        nodeCount    = 0
 
         # establish map. This works because allVerts is a sorted set.
         vertGIDtoIdx[allVerts] = nx.arange(len(allVerts))
 
+        inRange = nodeIDs < maxVertIdx
+        nodeIdx = vertGIDtoIdx[nodeIDs[inRange]]
+        isVert = nodeIdx >= 0
+        vertexCoords[nodeIdx[isVert]] = nodeCoords[inRange][isVert,
+                                                            :self.coordDimensions]
+
+        # transpose for FiPy
+        transCoords = vertexCoords.swapaxes(0, 1)
+        return transCoords, vertGIDtoIdx
+
+    def _parseNodesFile(self):
+        """
+        Returns the Gmsh IDs of the nodes and their (x, y, z) coordinates.
+        """
         nodesFile = open(self.nodesPath, 'r')
         nodesFile.readline() # skip number of nodes
+        nodes = nx.fromstring(nodesFile.read(), dtype=float, sep=" ")
+        nodesFile.close()
 
-        # now we walk through node file with a sorted unique list of vertices
-        # in hand. When we encounter 0th element in `allVerts`, save it
-        # to `vertexCoords` then pop its ID off `allVerts`.
-        for node in nodesFile:
-            line   = node.split()
-            nodeID = int(line[0])
+        nodes = nodes.reshape((-1, 4))
 
-            if nodeID == allVerts[nodeCount]:
-                newVert = [float(x) for x in line[1:self.coordDimensions+1]]
-                vertexCoords[nodeCount,:] = nx.array(newVert)
-                nodeCount += 1
+        return nodes[..., 0].astype(nx.INT_DTYPE), nodes[..., 1:]
 
-            if len(allVerts) == nodeCount:
-                break
+    def _readElementsFile(self):
+        """
+        Returns every integer of `$Elements`, the index of the first integer
+        of each element, and the number of integers of each element.
 
-        nodesFile.close()
+        The whole section is converted at once; elements are told apart by
+        counting the integers on each line.
+        """
+        elemsFile = open(self.elemsPath, 'rb')
+        elemsFile.readline() # skip number of elements
+        text = elemsFile.read()
+        elemsFile.close()
 
-        # transpose for FiPy
-        transCoords = vertexCoords.swapaxes(0, 1)
-        return transCoords, vertGIDtoIdx
+        chars = nx.frombuffer(text, dtype=nx.uint8)
+        blank = nx.isin(chars, nx.frombuffer(b" \t\r\n", dtype=nx.uint8))
+        # an integer starts wherever a non-blank follows a blank
+        starts = ~blank
+        starts[1:] &= blank[:-1]
+        lines = nx.cumsum(chars == ord("\n"))[starts]
+        lengths = nx.bincount(lines)
+        lengths = lengths[lengths > 0]
+
+        ints = nx.fromstring(text, dtype=nx.INT_DTYPE, sep=" ")
+        if len(ints) != lengths.sum():
+            raise GmshException("Unable to parse `$Elements`.")
+
+        return ints, nx.cumsum(lengths) - lengths, lengths
 
     def _parseElementFile(self):
         """
@@ -1050,91 +1066,77 @@ class MSHFile(GmshFile):
         calculation is consolidated here: if we were ever to need to CALCULATE
         GHOST CELLS OURSELVES, the only code we'd have to change is in here.
         """
-
-        def _parseTags(offset, currLineInts):
-            if offset == -1:
-                # if first valid shape
-                offset = currLineInts[0]
-
-            numTags = currLineInts[2]
-            tags    = currLineInts[3:(3+numTags)]
-
-            # the partition tags for don't seem to always be present
-            # and don't always make much sense when they are
-
-            if len(tags) >= 2:
-                physicalEntity = tags.pop(0)
-                geometricalEntity = tags.pop(0)
+        ints, starts, lengths = self._readElementsFile()
+
+        def _column(offsets):
+            return ints.take(offsets, mode='clip')
+
+        def _columns(offsets, counts, padding=-1):
+            width = counts.max() if len(counts) > 0 else 0
+            columns = nx.arange(width)
+            values = _column(offsets[..., nx.newaxis] + columns)
+            return nx.where(columns < counts[..., nx.newaxis], values, padding)
+
+        elemIDs = ints[starts]
+        elemTypes = ints[starts + 1]
+        numTags = ints[starts + 2]
+
+        # the partition tags for don't seem to always be present
+        # and don't always make much sense when they are
+        hasEntities = numTags >= 2
+        physicalEntities = nx.where(hasEntities, _column(starts + 3), -1)
+        geometricalEntities = nx.where(hasEntities, _column(starts + 4), -1)
+
+        def _elementData(elements, offset):
+            return _ElementData(nodes=_columns((starts + 3 + numTags)[elements],
+                                               (lengths - 3 - numTags)[elements]),
+                                shapes=elemTypes[elements],
+                                idmap=elemIDs[elements] - offset,
+                                physicalEntities=physicalEntities[elements],
+                                geometricalEntities=geometricalEntities[elements])
+
+        def _offset(elements):
+            # this will be subtracted from gmsh ID to obtain global ID
+            if len(elements) > 0:
+                return elemIDs[elements[0]]
             else:
-                physicalEntity = geometricalEntity = -1
-
-            return offset, tags, physicalEntity, geometricalEntity
-
-
-        cellsData = _ElementData()
-        ghostsData = _ElementData()
-        facesData = _ElementData()
-
-        cellOffset = -1 # this will be subtracted from gmsh ID to obtain global ID
-        faceOffset = -1 # this will be subtracted from gmsh ID to obtain global ID
-        pid = self.communicator.procID + 1
+                return -1
+
+        cells = nx.nonzero(nx.isin(elemTypes, list(self.numFacesPerCell.keys())))[0]
+        faces = nx.nonzero(nx.isin(elemTypes, list(self.numVertsPerFace.keys())))[0]
+        cellOffset = _offset(cells)
+
+        # after the entities, the next tag is a count of the partitions
+        partitionTags = (starts + 3 + nx.where(hasEntities, 2, 0))[cells]
+        numPartitionTags = (numTags - nx.where(hasEntities, 2, 0))[cells]
+        counted = numPartitionTags > 0
+        miscounted = counted & (_column(partitionTags) != numPartitionTags - 1)
+        if miscounted.any():
+            first = nx.nonzero(miscounted)[0][0]
+            warnings.warn("Partition count %d does not agree with number of "
+                          "remaining tags %d."
+                          % (_column(partitionTags[first]),
+                             numPartitionTags[first] - 1),
+                          SyntaxWarning, stacklevel=2)
 
-        elemsFile = open(self.elemsPath, 'r')
-
-        elemsFile.readline() # skip number of elements
-        for el in elemsFile:
-            currLineInts = [int(x) for x in el.split()]
-            elemType     = currLineInts[1]
-
-            if elemType in list(self.numFacesPerCell.keys()):
-                # element is a cell
-
-                (cellOffset,
-                 tags,
-                 physicalEntity,
-                 geometricalEntity) = _parseTags(offset=cellOffset,
-                                                 currLineInts=currLineInts)
-                currLineInts[0] -= cellOffset
-
-                if len(tags) > 0:
-                    # next item is a count
-                    if tags[0] != len(tags) - 1:
-                        warnings.warn("Partition count %d does not agree with number of remaining tags %d." % (tags[0], len(tags) - 1),
-                                      SyntaxWarning, stacklevel=2)
-                    tags = tags[1:]
-
-                if self.communicator.Nproc > 1:
-                    for tag in tags:
-                        if -tag == pid:
-                            # if we're collecting ghost cells and this is our ghost cell
-                            ghostsData.add(currLine=currLineInts, elType=elemType,
-                                           physicalEntity=physicalEntity,
-                                           geometricalEntity=geometricalEntity)
-                        elif tag == pid:
-                            # el is in this processor's partition or we collect all cells
-                            cellsData.add(currLine=currLineInts, elType=elemType,
-                                          physicalEntity=physicalEntity,
-                                          geometricalEntity=geometricalEntity)
-                else:
-                    # we collect all cells
-                    cellsData.add(currLine=currLineInts, elType=elemType,
-                                  physicalEntity=physicalEntity,
-                                  geometricalEntity=geometricalEntity)
-            elif elemType in list(self.numVertsPerFace.keys()):
-                # element is a face
-
-                (faceOffset,
-                 tags,
-                 physicalEntity,
-                 geometricalEntity) = _parseTags(offset=faceOffset,
-                                                 currLineInts=currLineInts)
-                currLineInts[0] -= faceOffset
-
-                facesData.add(currLine=currLineInts, elType=elemType,
-                              physicalEntity=physicalEntity,
-                              geometricalEntity=geometricalEntity)
+        if self.communicator.Nproc > 1:
+            pid = self.communicator.procID + 1
+            # -1 is a partition tag, so pad with 0
+            partitions = _columns(partitionTags + 1,
+                                  nx.where(counted, numPartitionTags - 1, 0),
+                                  padding=0)
+            # el is in this processor's partition
+            ours = (partitions == pid).any(axis=1)
+            # or it is our ghost cell
+            ghosts = (partitions == -pid).any(axis=1)
+            cellsData = _elementData(cells[ours], offset=cellOffset)
+            ghostsData = _elementData(cells[ghosts], offset=cellOffset)
+        else:
+            # we collect all cells
+            cellsData = _elementData(cells, offset=cellOffset)
+            ghostsData = _elementData(cells[:0], offset=cellOffset)
 
-        elemsFile.close()
+        facesData = _elementData(faces, offset=_offset(faces))
 
         return cellsData, ghostsData, facesData
 
@@ -1270,31 +1272,180 @@ class MSHFile(GmshFile):
         """
         pass
 
+def _padColumns(a, width):
+    """Pad the rows of a 2D array with -1 up to `width` columns
+    """
+    padded = nx.ones((len(a), width), dtype=nx.INT_DTYPE) * -1
+    padded[..., :a.shape[-1]] = a
+    return padded
+
+def _concatenatePadded(a, b):
+    """Concatenate the rows of two 2D arrays padded with -1
+
+        >>> print(_concatenatePadded(nx.array([[1, 2, 3]]), nx.array([[4, 5]])))
+        [[ 1  2  3]
+         [ 4  5 -1]]
+    """
+    width = max(a.shape[-1], b.shape[-1])
+    return nx.concatenate((_padColumns(a, width), _padColumns(b, width)))
+
+def _uniqueRows(rows):
+    """Find the distinct rows of a 2D array
+
+    Returns the index of the first occurrence of each distinct row, and
+    the index of each row's distinct row among the first occurrences.
+
+        >>> first, inverse = _uniqueRows(nx.array([[3, 4],
+        ...                                        [1, 2],
+        ...                                        [3, 4],
+        ...                                        [0, 5],
+        ...                                        [1, 2]]))
+        >>> print(first)
+        [0 1 3]
+        >>> print(inverse)
+        [0 1 0 2 1]
+    """
+    if len(rows) == 0:
+        return nx.arange(0), nx.arange(0)
+
+    # lexsort is stable, so each run of equal rows
+    # starts with the row's first occurrence
+    order = nx.lexsort(rows.swapaxes(0, 1)[::-1])
+    sortedRows = rows[order]
+    isNew = nx.concatenate(([True], (sortedRows[1:] != sortedRows[:-1]).any(axis=1)))
+    first = order[isNew]
+
+    # number the distinct rows in order of first occurrence
+    byOccurrence = nx.argsort(first)
+    number = nx.empty(len(first), dtype=nx.INT_DTYPE)
+    number[byOccurrence] = nx.arange(len(first))
+
+    inverse = nx.empty(len(rows), dtype=nx.INT_DTYPE)
+    inverse[order] = number[nx.cumsum(isNew) - 1]
+
+    return first[byOccurrence], inverse
+
 class _ElementData(object):
     """
     Bookkeeping for cells. Declared as own class for generality.
 
     :Properties:
-    - `nodes`: A Python list of the vertices that make up this element
-    - `shapes`: A `shapeTypes` Python list
+    - `nodes`: An array of the vertices that make up each element, padded with -1
+    - `shapes`: An array of the `shapeTypes`
     - `idmap`: A Python list which maps `vertexCoords` index to global ID
-    - `physicalEntities`: A Python list of the Gmsh physical entities each element is in
-    - `geometricalEntities`: A Python list of the Gmsh geometrical entities each element is in
+    - `physicalEntities`: An array of the Gmsh physical entities each element
+      is in
+    - `geometricalEntities`: An array of the Gmsh geometrical entities each
+      element is in
+    """
+    def __init__(self, nodes, shapes, idmap, physicalEntities, geometricalEntities):
+        self.nodes = nodes
+        self.shapes = shapes
+        self.idmap = idmap.tolist() # vertexCoords idx -> gmsh ID (global ID)
+        self.physicalEntities = physicalEntities
+        self.geometricalEntities = geometricalEntities
+
+def _openMSHFileOrCache(arg, dimensions, coordDimensions=None,
+                        communicator=parallelComm, overlap=1, background=None):
+    """Open `arg` for reading, from the `FIPY_GMSH_CACHE` cache if possible
     """
-    def __init__(self):
-        self.nodes = []
-        self.shapes = []
-        self.idmap = [] # vertexCoords idx -> gmsh ID (global ID)
-        self.physicalEntities = []
-        self.geometricalEntities = []
-
-    def add(self, currLine, elType, physicalEntity, geometricalEntity):
-        numTags = currLine[2]
-        self.nodes.append(currLine[(numTags+3):])
-        self.shapes.append(elType)
-        self.idmap.append(currLine[0])
-        self.physicalEntities.append(physicalEntity)
-        self.geometricalEntities.append(geometricalEntity)
+    cache = _GmshCache.fromEnvironment()
+    if cache is None or background is not None:
+        return openMSHFile(arg,
+                           dimensions=dimensions,
+                           coordDimensions=coordDimensions,
+                           communicator=communicator,
+                           overlap=overlap,
+                           mode='r',
+                           background=background)
+    else:
+        return _CachedMSHFile(cache, arg,
+                              dimensions=dimensions,
+                              coordDimensions=coordDimensions,
+                              communicator=communicator,
+                              overlap=overlap)
+
+class _CachedMSHFile(MSHFile):
+    """An `MSHFile` that is read from, or saved to, a `_GmshCache`
+
+    Gmsh is only run, and its output parsed, if the cache does not
+    already hold the mesh for every processor.
+    """
+    _arrayNames = ("vertexCoords", "faceVertexIDs", "cellFaceIDs",
+                   "cellGlobalIDs", "ghostCellGlobalIDs", "cellVertexIDs",
+                   "physicalCellMap", "geometricalCellMap",
+                   "physicalFaceMap", "geometricalFaceMap")
+
+    def __init__(self, cache, arg, dimensions, coordDimensions=None,
+                 communicator=parallelComm, overlap=1):
+        if overlap > 1:
+            communicator = serialComm
+
+        self.cache = cache
+        self.dimensions = dimensions
+        self.coordDimensions = coordDimensions
+        self.fileIsTemporary = False
+        self.key = cache.key(arg,
+                             version=_gmshVersion(communicator=communicator),
+                             Nproc=communicator.Nproc,
+                             dimensions=dimensions,
+                             coordDimensions=coordDimensions,
+                             overlap=overlap)
+
+        entry = cache.load(self.key, procID=communicator.procID)
+        if communicator.all(nx.array(entry is not None)):
+            self.mshFile = None
+            self.arrays, metadata = entry
+            physicalNames = metadata["physicalNames"]
+            self.physicalNames = dict((int(dim), names)
+                                      for dim, names in physicalNames.items())
+            self.dimensions = metadata["dimensions"]
+            if metadata["Nproc"] != communicator.Nproc:
+                # Gmsh could not partition the mesh
+                communicator = serialComm
+            self.communicator = communicator
+        else:
+            self.mshFile = openMSHFile(arg,
+                                       dimensions=dimensions,
+                                       coordDimensions=coordDimensions,
+                                       communicator=communicator,
+                                       overlap=overlap,
+                                       mode='r')
+            self.communicator = self.mshFile.communicator
+
+    def read(self):
+        if self.mshFile is not None:
+            data = self.mshFile.read()
+            self.dimensions = self.mshFile.dimensions
+            self.physicalNames = self.mshFile.physicalNames
+            self.arrays = dict(zip(self._arrayNames,
+                                   data + (self.mshFile.physicalCellMap,
+                                           self.mshFile.geometricalCellMap,
+                                           self.mshFile.physicalFaceMap,
+                                           self.mshFile.geometricalFaceMap)))
+            self.cache.save(self.key,
+                            procID=self.communicator.procID,
+                            arrays=self.arrays,
+                            metadata=dict(physicalNames=self.physicalNames,
+                                          dimensions=self.dimensions,
+                                          Nproc=self.communicator.Nproc))
+
+        # needed by `makeMapVariables()`
+        self.physicalCellMap = self.arrays["physicalCellMap"]
+        self.geometricalCellMap = self.arrays["geometricalCellMap"]
+        self.physicalFaceMap = self.arrays["physicalFaceMap"]
+        self.geometricalFaceMap = self.arrays["geometricalFaceMap"]
+
+        return (self.arrays["vertexCoords"],
+                self.arrays["faceVertexIDs"],
+                self.arrays["cellFaceIDs"],
+                nx.asarray(self.arrays["cellGlobalIDs"]).tolist(),
+                nx.asarray(self.arrays["ghostCellGlobalIDs"]).tolist(),
+                self.arrays["cellVertexIDs"])
+
+    def close(self):
+        if self.mshFile is not None:
+            self.mshFile.close()
 
 class _GmshTopology(_MeshTopology):
 
@@ -1599,13 +1750,12 @@ class Gmsh2D(Mesh2D):
                  overlap=1,
                  background=None):
 
-        self.mshFile = openMSHFile(arg,
-                                   dimensions=2,
-                                   coordDimensions=coordDimensions,
-                                   communicator=communicator,
-                                   overlap=overlap,
-                                   mode='r',
-                                   background=background)
+        self.mshFile = _openMSHFileOrCache(arg,
+                                           dimensions=2,
+                                           coordDimensions=coordDimensions,
+                                           communicator=communicator,
+                                           overlap=overlap,
+                                           background=background)
 
         # openMSHFile may have "downgraded" the communicator
         # if, e.g., too many overlaps were requested
@@ -1991,12 +2141,11 @@ class Gmsh3D(Mesh):
         Specifies the desired characteristic lengths of the mesh cells
     """
     def __init__(self, arg, communicator=parallelComm, overlap=1, background=None):
-        self.mshFile  = openMSHFile(arg,
-                                    dimensions=3,
-                                    communicator=communicator,
-                                    overlap=overlap,
-                                    mode='r',
-                                    background=background)
+        self.mshFile  = _openMSHFileOrCache(arg,
+                                            dimensions=3,
+                                            communicator=communicator,
+                                            overlap=overlap,
+                                            background=background)
 
         # openMSHFile may have "downgraded" the communicator
         # if, e.g., too many overlaps were requested
@@ -2217,6 +2366,30 @@ class Gmsh3D(Mesh):
 
         >>> if parallelComm.procID == 0:
         ...     os.remove(posFile)
+
+        When `FIPY_GMSH_CACHE` names a directory, the mesh is only
+        generated and read once
+
+        >>> import shutil
+        >>> cacheDir = (tempfile.mkdtemp() if parallelComm.procID == 0
+        ...             else None)
+        >>> cacheDir = parallelComm.bcast(cacheDir)
+        >>> os.environ["FIPY_GMSH_CACHE"] = cacheDir
+        >>> cached1 = GmshGrid3D(nx=2, ny=3, nz=4) # doctest: +GMSH
+        >>> cached2 = GmshGrid3D(nx=2, ny=3, nz=4) # doctest: +GMSH
+        >>> del os.environ["FIPY_GMSH_CACHE"]
+        >>> print(len(os.listdir(cacheDir))) # doctest: +GMSH
+        1
+        >>> print(numerix.allclose(cached2.cellCenters,
+        ...                        cached1.cellCenters)) # doctest: +GMSH
+        True
+        >>> print(numerix.allequal(cached2.cellFaceIDs,
+        ...                        cached1.cellFaceIDs)) # doctest: +GMSH
+        True
+
+        >>> parallelComm.Barrier()
+        >>> if parallelComm.procID == 0:
+        ...     shutil.rmtree(cacheDir)
         """
 
 class GmshGrid2D(Gmsh2D):
@@ -2242,7 +2415,7 @@ class GmshGrid2D(Gmsh2D):
         width  = nx * dx
         numLayers = int(ny / float(dy))
 
-        if _gmshVersion() < StrictVersion("2.7"):
+        if _gmshVersion() < _StrictVersion("2.7"):
             # kludge: must offset cellSize by `eps` to work properly
             eps = float(dx)/(nx * 10)
         else:
@@ -2316,7 +2489,7 @@ class GmshGrid3D(Gmsh3D):
         width  = nx * dx
         depth  = nz * dz
 
-        if _gmshVersion() < StrictVersion("2.7"):
+        if _gmshVersion() < _StrictVersion("2.7"):
             # kludge: must offset cellSize by `eps` to work properly
             eps = float(dx)/(nx * 10)
         else:
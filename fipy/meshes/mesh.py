@@ -11,6 +11,7 @@ from fipy.tools import numerix
 from fipy.tools.numerix import MA
 from fipy.tools.dimensions.physicalField import PhysicalField
 from fipy.tools import serialComm
+from fipy.tools.spatialIndex import _SpatialIndex
 
 __all__ = ["MeshAdditionError", "Mesh"]
 from future.utils import text_to_native_str
@@ -424,6 +425,7 @@ class Mesh(AbstractMesh):
         self._cellToCellDistances = self._calcCellToCellDist()
         self._faceCellToCellNormals = self._calcFaceCellToCellNormals()
         self._setFaceDependentScaledValues()
+        self._geometryChanged()
 
     """calculate Topology methods"""
 
@@ -544,8 +546,29 @@ class Mesh(AbstractMesh):
            >>> print(m0._getNearestCellID(m1.cellCenters.globalValue))
            [4 5 7 8]
 
+
+        The cell centers are indexed the first time they are searched,
+        and again only if the mesh is rescaled
+
+           >>> index = m0._cellCenterIndex
+           >>> print(m0._getNearestCellID(((0., 20.), (0., 20.))))
+           [0 8]
+           >>> m0._cellCenterIndex is index
+           True
+           >>> m0._setScaledGeometry(1.)
+           >>> m0._cellCenterIndex is index
+           False
+
         """
-        return numerix.nearest(data=self.cellCenters.globalValue, points=points)
+        return self._cellCenterIndex.nearest(points)
+
+    @property
+    def _cellCenterIndex(self):
+        # `_setScaledValues()` replaces `_scaledCellCenters`
+        if getattr(self, "_indexedCellCenters", None) is not self._scaledCellCenters:
+            self._indexedCellCenters = self._scaledCellCenters
+            self.__cellCenterIndex = _SpatialIndex(self.cellCenters.globalValue)
+        return self.__cellCenterIndex
 
     def _test(self):
         """
@@ -16,9 +16,12 @@ def _suite():
         'fipy.meshes.nonUniformGrid3D',
         'fipy.meshes.tri2D',
         'fipy.meshes.gmshMesh',
+        'fipy.meshes.gmshCache',
         'fipy.meshes.periodicGrid1D',
         'fipy.meshes.periodicGrid2D',
         'fipy.meshes.periodicGrid3D',
+        'fipy.meshes.geometryCache',
+        'fipy.meshes.uniformGrid',
         'fipy.meshes.uniformGrid1D',
         'fipy.meshes.uniformGrid2D',
         'fipy.meshes.uniformGrid3D',
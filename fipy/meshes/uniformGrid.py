@@ -2,12 +2,63 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext'
 
 from fipy.meshes.abstractMesh import AbstractMesh
+from fipy.meshes.geometryCache import _GeometryCache, _defaultCache
 
 __all__ = ["UniformGrid"]
 from future.utils import text_to_native_str
 __all__ = [text_to_native_str(n) for n in __all__]
 
 class UniformGrid(AbstractMesh):
+    def cacheGeometry(self, budget=None):
+        """Keep derived geometry arrays instead of recomputing them
+
+        The geometry of a uniform grid is normally recomputed from its
+        spacing and number of cells every time it is requested.  Once
+        caching is enabled, each array is computed on first use and held,
+        read-only, until the least recently used arrays must be evicted to
+        stay within `budget`, or until the geometry of the mesh changes.
+        The `FIPY_GEOMETRY_CACHE` environment variable enables caching,
+        with the given budget in megabytes, for every new uniform grid.
+
+            >>> from fipy import Grid2D
+            >>> mesh = Grid2D(nx=3, ny=2)
+            >>> mesh.cacheGeometry()
+            >>> centers = mesh._cellCenters
+            >>> centers is mesh._cellCenters
+            True
+            >>> mesh._geometryChanged()
+            >>> centers is mesh._cellCenters
+            False
+            >>> mesh.cacheGeometry(budget=0)
+            >>> mesh._cellCenters is mesh._cellCenters
+            False
+
+        Parameters
+        ----------
+        budget : float, optional
+            Maximum memory, in megabytes, to hold.  `None` for no limit
+            and 0 to disable caching.
+        """
+        if budget is None:
+            self.__geometryCache = _GeometryCache(budget=None)
+        elif budget <= 0:
+            self.__geometryCache = None
+        else:
+            self.__geometryCache = _GeometryCache(budget=int(budget * 1024**2))
+
+    def _geometryChanged(self):
+        AbstractMesh._geometryChanged(self)
+        if self._geometryCache is not None:
+            self._geometryCache.clear()
+
+    @property
+    def _geometryCache(self):
+        try:
+            return self.__geometryCache
+        except AttributeError:
+            self.__geometryCache = _defaultCache()
+            return self.__geometryCache
+
     """Wrapped scaled geometry properties"""
     @property
     def _scaledFaceAreas(self):
@@ -51,3 +102,10 @@ class UniformGrid(AbstractMesh):
 
     _faceToCellDistances = property(_getFaceToCellDistances,
                                     _setFaceToCellDistances)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -11,6 +11,7 @@ from fipy.tools import inline
 from fipy.tools import parallelComm
 
 from fipy.meshes.uniformGrid import UniformGrid
+from fipy.meshes.geometryCache import _cachedGeometry
 from fipy.meshes.builders import _UniformGrid2DBuilder
 from fipy.meshes.builders import _Grid2DBuilder
 from fipy.meshes.representations.gridRepresentation import _Grid2DRepresentation
@@ -119,7 +120,7 @@ class UniformGrid2D(UniformGrid):
         return cellFaceOrientations
 
     if inline.doInline:
-        @property
+        @_cachedGeometry
         def _adjacentCellIDs(self):
             faceCellIDs0 =  numerix.zeros(self.numberOfFaces, 'l')
             faceCellIDs1 =  numerix.zeros(self.numberOfFaces, 'l')
@@ -161,7 +162,7 @@ class UniformGrid2D(UniformGrid):
             return (faceCellIDs0, faceCellIDs1)
 
     else:
-        @property
+        @_cachedGeometry
         def _adjacentCellIDs(self):
             Hids = numerix.zeros((self.numberOfHorizontalRows, self.nx, 2), 'l')
             indices = numerix.indices((self.numberOfHorizontalRows, self.nx))
@@ -189,7 +190,7 @@ class UniformGrid2D(UniformGrid):
 
             return (faceCellIDs[:, 0], faceCellIDs[:, 1])
 
-    @property
+    @_cachedGeometry
     def _cellToCellIDs(self):
         ids = MA.zeros((4, self.nx, self.ny), 'l')
         indices = numerix.indices((self.nx, self.ny))
@@ -266,7 +267,7 @@ class UniformGrid2D(UniformGrid):
         faceAreas[self.numberOfHorizontalFaces:] = self.dy
         return faceAreas
 
-    @property
+    @_cachedGeometry
     def faceNormals(self):
         normals = numerix.zeros((2, self.numberOfFaces), 'd')
 
@@ -283,7 +284,7 @@ class UniformGrid2D(UniformGrid):
     def _cellVolumes(self):
         return numerix.ones(self.numberOfCells, 'd') * self.dx * self.dy
 
-    @property
+    @_cachedGeometry
     def _cellCenters(self):
         centers = numerix.zeros((2, self.nx, self.ny), 'd')
         indices = numerix.indices((self.nx, self.ny))
@@ -293,7 +294,7 @@ class UniformGrid2D(UniformGrid):
                                order='F') + self.origin
         return ccs
 
-    @property
+    @_cachedGeometry
     def _cellDistances(self):
         Hdis = numerix.repeat((self.dy,), self.numberOfHorizontalFaces)
         Hdis = numerix.reshape(Hdis, (self.nx, self.numberOfHorizontalRows))
@@ -310,7 +311,7 @@ class UniformGrid2D(UniformGrid):
         return numerix.concatenate((numerix.reshape(numerix.swapaxes(Hdis, 0, 1), (self.numberOfHorizontalFaces,)),
                                     numerix.reshape(numerix.swapaxes(Vdis, 0, 1), (self.numberOfFaces - self.numberOfHorizontalFaces,))))
 
-    @property
+    @_cachedGeometry
     def _faceToCellDistanceRatio(self):
         """how far face is from first to second cell
         
@@ -402,7 +403,7 @@ class UniformGrid2D(UniformGrid):
     def _cellAreaProjections(self):
         return self._cellAreas * self._cellNormals
 
-    @property
+    @_cachedGeometry
     def _faceCenters(self):
         Hcen = numerix.zeros((2, self.nx, self.numberOfHorizontalRows), 'd')
         indices = numerix.indices((self.nx, self.numberOfHorizontalRows))
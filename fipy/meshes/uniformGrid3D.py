@@ -5,6 +5,7 @@ from fipy.tools.numerix import MA
 from fipy.tools import parallelComm
 
 from fipy.meshes.uniformGrid import UniformGrid
+from fipy.meshes.geometryCache import _cachedGeometry
 from fipy.meshes.builders import _UniformGrid3DBuilder
 from fipy.meshes.builders import _Grid3DBuilder
 from fipy.meshes.representations.gridRepresentation import _Grid3DRepresentation
@@ -127,13 +128,13 @@ class UniformGrid3D(UniformGrid):
         tmp = numerix.take(self.faceCellIDs[0], self.cellFaceIDs)
         return (tmp == MA.indices(tmp.shape)[-1]) * 2 - 1
 
-    @property
+    @_cachedGeometry
     def _adjacentCellIDs(self):
         faceCellIDs = self.faceCellIDs
         return (MA.where(MA.getmaskarray(faceCellIDs[0]), faceCellIDs[1], faceCellIDs[0]).filled(),
                 MA.where(MA.getmaskarray(faceCellIDs[1]), faceCellIDs[0], faceCellIDs[1]).filled())
 
-    @property
+    @_cachedGeometry
     def _cellToCellIDs(self):
         ids = MA.zeros((6, self.nx, self.ny, self.nz), 'l')
         indices = numerix.indices((self.nx, self.ny, self.nz))
@@ -177,7 +178,7 @@ class UniformGrid3D(UniformGrid):
                                     numerix.repeat((self.dx * self.dz,), self.numberOfXZFaces),
                                     numerix.repeat((self.dy * self.dz,), self.numberOfYZFaces)))
 
-    @property
+    @_cachedGeometry
     def faceNormals(self):
         XYnor = numerix.zeros((3, self.nx, self.ny, self.nz + 1), 'l')
         XYnor[0,     ...] =  1
@@ -199,7 +200,7 @@ class UniformGrid3D(UniformGrid):
     def _cellVolumes(self):
         return numerix.ones(self.numberOfCells, 'd') * self.dx * self.dy * self.dz
 
-    @property
+    @_cachedGeometry
     def _cellCenters(self):
         centers = numerix.zeros((3, self.nx, self.ny, self.nz), 'd')
         indices = numerix.indices((self.nx, self.ny, self.nz))
@@ -209,7 +210,7 @@ class UniformGrid3D(UniformGrid):
         ccs = numerix.reshape(centers.swapaxes(1, 3), (3, self.numberOfCells)) + self.origin
         return ccs
 
-    @property
+    @_cachedGeometry
     def _cellDistances(self):
         XYdis = numerix.zeros((self.nz + 1, self.ny, self.nx), 'd')
         XYdis[:] = self.dz
@@ -230,7 +231,7 @@ class UniformGrid3D(UniformGrid):
                                     numerix.ravel(XZdis),
                                     numerix.ravel(YZdis)))
 
-    @property
+    @_cachedGeometry
     def _faceToCellDistanceRatio(self):
         """how far face is from first to second cell
         
@@ -338,7 +339,7 @@ class UniformGrid3D(UniformGrid):
 
 ##         from numMesh/mesh
 
-    @property
+    @_cachedGeometry
     def _faceCenters(self):
 
         XYcen = numerix.zeros((3, self.nx, self.ny, self.nz + 1), 'd')
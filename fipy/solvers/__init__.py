@@ -1,14 +1,19 @@
 from __future__ import unicode_literals
 from builtins import str
 import os
+import sys
 from importlib import import_module
+try:
+    from importlib.util import find_spec as _find_spec
+except ImportError:
+    from pkgutil import find_loader as _find_spec
 
 from fipy.tools.parser import _parseSolver
 
 from fipy.solvers.solver import *
-__all__ = list(solver.__all__)
+_all = list(solver.__all__)
 from future.utils import text_to_native_str
-__all__ = [text_to_native_str(n) for n in __all__]
+_all = [text_to_native_str(n) for n in _all]
 
 _desired_solver = _parseSolver()
 
@@ -56,7 +61,7 @@ if solver is None and _desired_solver in ["pysparse", None]:
         if _Nproc > 1:
             raise SerialSolverError()
         from fipy.solvers.pysparse import *
-        __all__.extend(pysparse.__all__)
+        _all.extend(pysparse.__all__)
         _mesh_matrices = _import_mesh_matrices(suite="Pysparse")
         solver = "pysparse"
     except Exception as inst:
@@ -68,7 +73,7 @@ if solver is None and _desired_solver in ["petsc", None]:
         petsc4py.init()
 
         from fipy.solvers.petsc import *
-        __all__.extend(petsc.__all__)
+        _all.extend(petsc.__all__)
 
         from fipy.solvers.petsc.comms.serialPETScCommWrapper import SerialPETScCommWrapper
         serialComm = SerialPETScCommWrapper()
@@ -87,7 +92,7 @@ if solver is None and _desired_solver in ["petsc", None]:
 if solver is None and _desired_solver in ["trilinos", "no-pysparse", None]:
     try:
         from fipy.solvers.trilinos import *
-        __all__.extend(trilinos.__all__)
+        _all.extend(trilinos.__all__)
         
         from fipy.solvers.trilinos.comms.serialEpetraCommWrapper import SerialEpetraCommWrapper
         serialComm = SerialEpetraCommWrapper()
@@ -112,40 +117,49 @@ if solver is None and _desired_solver in ["trilinos", "no-pysparse", None]:
     except Exception as inst:
         _exceptions["trilinos"] = inst
 
-if solver is None and _desired_solver in ["scipy", None]:
-    try:
-        if _Nproc > 1:
-            raise SerialSolverError()
-        from fipy.solvers.scipy import *
-        __all__.extend(scipy.__all__)
-        _mesh_matrices = _import_mesh_matrices(suite="Scipy")
-        solver = "scipy"
-    except Exception as inst:
-        _exceptions["scipy"] = inst
-
-if solver is None and _desired_solver in ["pyamg", None]:
-    try:
-        if _Nproc > 1:
-            raise SerialSolverError()
-        from fipy.solvers.pyAMG import *
-        __all__.extend(pyAMG.__all__)
-        _mesh_matrices = _import_mesh_matrices(suite="Scipy")
-        solver = "pyamg"
-    except Exception as inst:
-        _exceptions["pyamg"] = inst
-
-if solver is None and _desired_solver in ["pyamgx", None]:
-    try:
-        if _parallelComm.Nproc > 1:
-            raise  SerialSolverError('pyamgx')
-        from fipy.solvers.pyamgx import *
-        __all__.extend(pyamgx.__all__)
-        _mesh_matrices = _import_mesh_matrices(suite="Scipy")
-        solver = "pyamgx"
-    except Exception as inst:
-        _exceptions["pyamgx"] = inst
+# The scipy-based suites supply no communicators, so they are only
+# located here.  Importing them, which costs more than the rest of
+# `import fipy`, is deferred to the first use of one of their names.
+_lazy_suites = []
+for (_name, _module, _package) in [("scipy", "scipy", "scipy"),
+                                   ("pyamg", "pyAMG", "pyamg"),
+                                   ("pyamgx", "pyamgx", "pyamgx")]:
+    if solver is None and _desired_solver in [_name, None]:
+        if _find_spec(_package) is None:
+            _exceptions[_name] = ImportError("No module named %s" % _package)
+        else:
+            _lazy_suites.append((_name, _module, "Scipy"))
 
-if solver is None:
+def _bind_suite():
+    """`from fipy.solvers.suite import *` for the first lazy suite that
+    imports, unless a suite is already bound
+    """
+    global __all__, solver, _RowMeshMatrix, _ColMeshMatrix, _MeshMatrix
+
+    while _lazy_suites:
+        name, module, matrices = _lazy_suites[0]
+        try:
+            if _Nproc > 1:
+                raise SerialSolverError()
+            suite = import_module("fipy.solvers." + module)
+            _mesh_matrices = _import_mesh_matrices(suite=matrices)
+        except Exception as inst:
+            _exceptions[name] = inst
+            del _lazy_suites[0]
+            continue
+
+        globals().update((n, getattr(suite, n)) for n in suite.__all__)
+        _all.extend(suite.__all__)
+        _RowMeshMatrix, _ColMeshMatrix, _MeshMatrix = _mesh_matrices
+        __all__ = _all
+        solver = name
+        del _lazy_suites[:]
+        return
+
+    solver = None
+    _raiseNoSolver()
+
+def _raiseNoSolver():
     if _desired_solver is None:
         raise ImportError('Unable to load a solver: %s' % str(_exceptions))
     else:
@@ -154,18 +168,43 @@ if solver is None:
         else:
             raise ImportError('Unknown solver package %s' % _desired_solver)
 
-# don't unpack until here in order to keep code above more succinct
-_RowMeshMatrix, _ColMeshMatrix, _MeshMatrix = _mesh_matrices
+def __getattr__(name):
+    """Bind the lazy solver suite on first use of one of its names
+    """
+    if _lazy_suites:
+        _bind_suite()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+def _solverName():
+    """Name of the solver suite, binding a lazy suite if need be
+    """
+    return getattr(sys.modules[__name__], "solver")
+
+if solver is not None:
+    # don't unpack until here in order to keep code above more succinct
+    _RowMeshMatrix, _ColMeshMatrix, _MeshMatrix = _mesh_matrices
+    __all__ = _all
+elif not _lazy_suites:
+    _raiseNoSolver()
+elif sys.version_info < (3, 7):
+    # no module `__getattr__`
+    _bind_suite()
+else:
+    # `solver` and `__all__` are only defined once the suite is bound,
+    # on first use of one of their names
+    del solver
 
 from fipy.tests.doctestPlus import register_skipper
 
 register_skipper(flag='PYSPARSE_SOLVER',
-                 test=lambda: solver == 'pysparse',
+                 test=lambda: _solverName() == 'pysparse',
                  why="the Pysparse solvers are not being used.",
                  skipWarning=True)
 
 register_skipper(flag='NOT_PYAMGX_SOLVER',
-                 test=lambda: solver != 'pyamgx',
+                 test=lambda: _solverName() != 'pyamgx',
                  why="the PyAMGX solver is being used.",
                  skipWarning=True)
 del register_skipper
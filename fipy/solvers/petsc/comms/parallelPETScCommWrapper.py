@@ -80,6 +80,12 @@ class ParallelPETScCommWrapper(PETScCommWrapper):
     def allgather(self, sendobj=None):
         return self.mpi4py_comm.allgather(sendobj=sendobj)
 
+    def gather(self, sendobj=None, root=0):
+        return self.mpi4py_comm.gather(sendobj=sendobj, root=root)
+
+    def scatter(self, sendobj=None, root=0):
+        return self.mpi4py_comm.scatter(sendobj=sendobj, root=root)
+
     def sum(self, a, axis=None):
         return self.mpi4py_comm.allreduce(numerix.array(a).sum(axis=axis), op=MPI.SUM)
 
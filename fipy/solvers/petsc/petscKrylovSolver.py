@@ -1,6 +1,7 @@
 __docformat__ = 'restructuredtext'
 
 import os
+import time
 
 from petsc4py import PETSc
 
@@ -35,33 +36,145 @@ class PETScKrylovSolver(PETScSolver):
     .. attention:: This class is abstract, always create one of its subclasses.
        It provides the code to call all Krylov solvers from the PETSc package.
 
+    The `PETSc.KSP` object, and its preconditioner, are kept from one
+    solve to the next.  Setting up the preconditioner, e.g., computing
+    incomplete factors or an algebraic multigrid hierarchy, can cost
+    more than the solve itself, so, depending on `rebuild`, the
+    preconditioner of an earlier matrix may be applied to later matrices
+    with the same sizes and number of nonzeros.  The cumulative times spent setting
+    up and applying the solver are kept in `timings`.
+
     """
-      
-    def __init__(self, tolerance=1e-10, iterations=1000, precon=None):
+
+    def __init__(self, tolerance=1e-10, iterations=1000, precon=None,
+                 rebuild="always", iterationGrowth=1.5):
         """
         :Parameters:
           - `tolerance`: The required error tolerance.
           - `iterations`: The maximum number of iterative steps to perform.
-          - `precon`: Preconditioner to use (string). 
+          - `precon`: Preconditioner to use (string).
+          - `rebuild`: When to set up the preconditioner again for a
+            matrix with the same nonzero pattern as the last one: `"always"`,
+            every `N` solves if an integer `N`, or `"iterations"` when the
+            number of iterations exceeds `iterationGrowth` times the
+            number taken just after the last setup.  The preconditioner is
+            always set up for a matrix with different sizes or a different
+            number of nonzeros.
+          - `iterationGrowth`: Growth in the number of iterations that
+            triggers a new setup when `rebuild` is `"iterations"`.
 
         """
         if self.__class__ is PETScKrylovSolver:
             raise NotImplementedError("can't instantiate abstract base class")
-            
+
+        if not (rebuild in ("always", "iterations")
+                or (isinstance(rebuild, int) and rebuild > 0)):
+            raise ValueError("`rebuild` must be 'always', 'iterations' or a "
+                             "positive integer, not %r" % (rebuild,))
+
         PETScSolver.__init__(self, tolerance=tolerance,
                              iterations=iterations, precon=precon)
 
-    def _solve_(self, L, x, b):
+        self.rebuild = rebuild
+        self.iterationGrowth = iterationGrowth
+        self.timings = dict(setup=0., solve=0., setups=0, solves=0)
+
+        self._ksp = None
+        self._pattern = None
+        self._solvesSinceSetup = 0
+        self._iterationsAfterSetup = None
+        self._growthExceeded = False
+
+    def _createKSP(self, L):
+        if self._ksp is not None:
+            self._ksp.destroy()
+
         ksp = PETSc.KSP()
         ksp.create(L.comm)
         ksp.setType(self.solver)
         if self.preconditioner is not None:
             ksp.getPC().setType(self.preconditioner)
+        ksp.setFromOptions()
+
+        self._ksp = ksp
+        self._kspKey = self._getKSPKey(L)
+        self._pattern = None
+
+        return ksp
+
+    def _getKSPKey(self, L):
+        """What the `PETSc.KSP` must be created anew for
+        """
+        return (self.solver, self.preconditioner, L.getSizes())
+
+    def _samePattern(self, L):
+        """Whether `L` has the same sizes and number of nonzeros as the
+        matrix the preconditioner was last set up for, on every processor
+
+        The entries themselves are not compared, which would cost a copy
+        of the matrix structure on every solve.  A preconditioner set up
+        for another pattern with the same number of nonzeros only slows
+        the solver down, which the `"iterations"` setting of `rebuild`
+        guards against.
+        """
+        info = L.getInfo(PETSc.Mat.InfoType.LOCAL)
+        pattern = (L.getSizes(), info["nz_used"])
+        previous, self._pattern = self._pattern, pattern
+
+        same = (pattern == previous)
+
+        if L.comm.size > 1:
+            from mpi4py import MPI
+            same = L.comm.tompi4py().allreduce(same, op=MPI.LAND)
+
+        return same
+
+    def _reusePreconditioner(self, L):
+        """Decide whether to keep the preconditioner for matrix `L`
+        """
+        if self.rebuild == "always":
+            return False
+
+        same = self._samePattern(L)
+
+        if self.rebuild == "iterations":
+            return same and not self._growthExceeded
+        else:
+            return same and self._solvesSinceSetup < self.rebuild
+
+    def _solve_(self, L, x, b):
+        ksp = self._ksp
+        if (ksp is None
+            or self._kspKey != self._getKSPKey(L)
+            or ksp.comm != L.comm):
+            ksp = self._createKSP(L)
+
         ksp.setTolerances(rtol=self.tolerance, max_it=self.iterations)
         L.assemble()
+
+        reuse = self._reusePreconditioner(L)
         ksp.setOperators(L)
-        ksp.setFromOptions()
+        ksp.setReusePreconditioner(reuse)
+
+        start = time.time()
+        ksp.setUp()
+        if not reuse:
+            self.timings["setups"] += 1
+            self._solvesSinceSetup = 0
+            self._iterationsAfterSetup = None
+            self._growthExceeded = False
+        self.timings["setup"] += time.time() - start
+
+        start = time.time()
         ksp.solve(b, x)
+        self.timings["solve"] += time.time() - start
+        self.timings["solves"] += 1
+        self._solvesSinceSetup += 1
+
+        if self._iterationsAfterSetup is None:
+            self._iterationsAfterSetup = max(ksp.its, 1)
+        elif ksp.its > self.iterationGrowth * self._iterationsAfterSetup:
+            self._growthExceeded = True
 
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
@@ -69,7 +182,13 @@ class PETScKrylovSolver(PETScSolver):
 #             b.view()
             PRINT('solver:', ksp.type)
             PRINT('precon:', ksp.getPC().type)
+            PRINT('preconditioner reused:', reuse)
             PRINT('convergence: %s' % _reason[ksp.reason])
             PRINT('iterations: %d / %d' % (ksp.its, self.iterations))
             PRINT('norm:', ksp.norm)
             PRINT('norm_type:', ksp.norm_type)
+
+    def __del__(self):
+        if getattr(self, "_ksp", None) is not None:
+            self._ksp.destroy()
+        PETScSolver.__del__(self)
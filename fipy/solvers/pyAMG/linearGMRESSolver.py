@@ -13,7 +13,9 @@ class LinearGMRESSolver(ScipyLinearGMRESSolver):
     default.
     """
 
-    def __init__(self, tolerance=1e-15, iterations=2000, precon=SmoothedAggregationPreconditioner()):
+    def __init__(self, tolerance=1e-15, iterations=2000,
+                 precon=SmoothedAggregationPreconditioner(),
+                 rebuild="always", iterationGrowth=1.5, residualHistory=False):
         """
         Parameters
         ----------
@@ -22,6 +24,19 @@ class LinearGMRESSolver(ScipyLinearGMRESSolver):
         iterations : int
             Maximum number of iterative steps to perform.
         precon : ~fipy.solvers.pyAMG.preconditioners.smoothedAggregationPreconditioner.SmoothedAggregationPreconditioner, optional
+        rebuild : {"always", "iterations"} or int
+            When to set up the preconditioner again for a matrix with the
+            same nonzero pattern as the last one.
+        iterationGrowth : float
+            Growth in the number of iterations that triggers a new setup
+            when `rebuild` is `"iterations"`.
+        residualHistory : bool
+            Whether to record the residual norm of every iteration.
         """
 
-        super(LinearGMRESSolver, self).__init__(tolerance=tolerance, iterations=iterations, precon=precon)
+        super(LinearGMRESSolver, self).__init__(tolerance=tolerance,
+                                                iterations=iterations,
+                                                precon=precon,
+                                                rebuild=rebuild,
+                                                iterationGrowth=iterationGrowth,
+                                                residualHistory=residualHistory)
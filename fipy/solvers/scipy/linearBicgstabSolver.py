@@ -14,7 +14,8 @@ class LinearBicgstabSolver(_ScipyKrylovSolver):
     Scipy, with no preconditioning by default.
     """
 
-    def __init__(self, tolerance=1e-15, iterations=2000, precon=None):
+    def __init__(self, tolerance=1e-15, iterations=2000, precon=None,
+                 rebuild="always", iterationGrowth=1.5, residualHistory=False):
         """
         Parameters
         ----------
@@ -24,7 +25,20 @@ class LinearBicgstabSolver(_ScipyKrylovSolver):
             Maximum number of iterative steps to perform.
         precon
             Preconditioner to use.
+        rebuild : {"always", "iterations"} or int
+            When to set up the preconditioner again for a matrix with the
+            same nonzero pattern as the last one.
+        iterationGrowth : float
+            Growth in the number of iterations that triggers a new setup
+            when `rebuild` is `"iterations"`.
+        residualHistory : bool
+            Whether to record the residual norm of every iteration.
         """
 
-        super(LinearBicgstabSolver, self).__init__(tolerance=tolerance, iterations=iterations, precon=precon)
+        super(LinearBicgstabSolver, self).__init__(tolerance=tolerance,
+                                                   iterations=iterations,
+                                                   precon=precon,
+                                                   rebuild=rebuild,
+                                                   iterationGrowth=iterationGrowth,
+                                                   residualHistory=residualHistory)
         self.solveFnc = bicgstab
@@ -19,8 +19,57 @@ class LinearLUSolver(_ScipySolver):
     The `LinearLUSolver` solves a linear system of equations using
     LU-factorization.  The `LinearLUSolver` is a wrapper class for the
     the Scipy `scipy.sparse.linalg.splu` module.
+
+    The factorization is kept between solutions. If the matrix has not
+    changed, e.g., for implicit diffusion with constant coefficients and a
+    fixed time step, the factors are reused and each solution only costs a
+    pair of triangular solves. If only the values have changed, the
+    fill-reducing column ordering of the previous factorization is reused.
+
+        >>> from fipy import Grid1D, CellVariable, TransientTerm, DiffusionTerm
+        >>> mesh = Grid1D(nx=10)
+        >>> var = CellVariable(mesh=mesh, value=0.)
+        >>> var.constrain(1., mesh.facesLeft)
+        >>> eq = TransientTerm() == DiffusionTerm(coeff=1.)
+        >>> solver = LinearLUSolver()
+        >>> eq.solve(var=var, dt=1., solver=solver)
+        >>> LU = solver._LU
+        >>> eq.solve(var=var, dt=1., solver=solver)
+        >>> solver._LU is LU
+        True
+        >>> eq.solve(var=var, dt=2., solver=solver)
+        >>> solver._LU is LU
+        False
+
+    The result does not depend on whether the factors were reused
+
+        >>> var2 = CellVariable(mesh=mesh, value=0.)
+        >>> var2.constrain(1., mesh.facesLeft)
+        >>> for dt in (1., 1., 2.):
+        ...     eq.solve(var=var2, dt=dt, solver=LinearLUSolver())
+        >>> print(numerix.allclose(var, var2))
+        True
     """
 
+    _LU = None
+
+    def _factorize(self, A):
+        """LU factorization of the CSC matrix `A`, reusing what is still valid
+        """
+        LU = self._LU
+        if (LU is not None
+            and A.shape == LU.shape
+            and numerix.array_equal(A.indptr, LU.indptr)
+            and numerix.array_equal(A.indices, LU.indices)):
+            if numerix.array_equal(A.data, LU.data):
+                return LU
+            LU = _PermutedLU(A, perm_c=LU.perm_c)
+        else:
+            LU = _PermutedLU(A)
+
+        self._LU = LU
+        return LU
+
     def _solve_(self, L, x, b):
         diag = L.takeDiagonal()
         maxdiag = max(numerix.absolute(diag))
@@ -28,10 +77,7 @@ class LinearLUSolver(_ScipySolver):
         L = L * (1 / maxdiag)
         b = b * (1 / maxdiag)
 
-        LU = splu(L.matrix.asformat("csc"), diag_pivot_thresh=1.,
-                                            relax=1,
-                                            panel_size=10,
-                                            permc_spec=3)
+        LU = self._factorize(L.matrix.asformat("csc"))
 
         error0 = numerix.sqrt(numerix.sum((L * x - b)**2))
 
@@ -50,3 +96,48 @@ class LinearLUSolver(_ScipySolver):
             PRINT('residual:', numerix.sqrt(numerix.sum(errorVector**2)))
 
         return x
+
+class _PermutedLU(object):
+    """`splu` factorization that can be given its column ordering
+
+    `splu` cannot be handed a column permutation, so a known ordering is
+    applied to the columns of the matrix before a factorization with
+    natural ordering, and undone on each solution.
+    """
+    def __init__(self, A, perm_c=None):
+        """
+        Parameters
+        ----------
+        A : ~scipy.sparse.csc_matrix
+            The matrix to factor.
+        perm_c : ndarray of int, optional
+            The column ordering of an earlier factorization of a matrix
+            with the same structure. If `None`, a new ordering is found.
+        """
+        self.shape = A.shape
+        # keep the values and structure that were factored
+        self.indptr = A.indptr.copy()
+        self.indices = A.indices.copy()
+        self.data = A.data.copy()
+
+        if perm_c is None:
+            self._LU = splu(A, diag_pivot_thresh=1.,
+                               relax=1,
+                               panel_size=10,
+                               permc_spec=3)
+            self.perm_c = self._LU.perm_c
+            self._order = None
+        else:
+            # column `i` of `A` is column `perm_c[i]` of the ordered matrix
+            self.perm_c = perm_c
+            self._order = numerix.argsort(perm_c)
+            self._LU = splu(A[:, self._order], diag_pivot_thresh=1.,
+                                               relax=1,
+                                               panel_size=10,
+                                               permc_spec="NATURAL")
+
+    def solve(self, b):
+        x = self._LU.solve(b)
+        if self._order is not None:
+            x = x[self.perm_c]
+        return x
@@ -3,32 +3,288 @@ __docformat__ = 'restructuredtext'
 
 __all__ = []
 
+import inspect
 import os
+import time
 
 from fipy.solvers.scipy.scipySolver import _ScipySolver
+from fipy.tools import numerix
+
+def _toleranceArgs(solveFnc, tolerance):
+    """Relative `tolerance` as understood by the installed :mod:`scipy`
+
+    :mod:`scipy` 1.12 renamed `tol` to `rtol` and 1.14 removed `tol` and
+    the "legacy" absolute tolerance, which for these solvers was also
+    relative to the norm of the right-hand side.
+    """
+    if "rtol" in inspect.signature(solveFnc).parameters:
+        return dict(rtol=tolerance, atol=0.)
+    else:
+        return dict(tol=tolerance, atol='legacy')
+
+class _KrylovResult(object):
+    """Outcome of one solve of a `_ScipyKrylovSolver`
+    """
+    def __init__(self, info, iterations, residual, residuals,
+                 preconditionerReused, setupTime, solveTime):
+        """
+        Parameters
+        ----------
+        info : int
+            Exit code of the :mod:`scipy` solver: `0` on convergence,
+            positive if the iterations ran out and negative on breakdown.
+        iterations : int
+            Number of iterations taken.
+        residual : float or None
+            Norm of the final residual, relative to the norm of the
+            right-hand side.  `None` unless the solver was created with
+            `residualHistory`.
+        residuals : list of float
+            Relative residual norms of each iteration, of the
+            preconditioned system for GMRES.  Empty unless GMRES was used
+            or the solver was created with `residualHistory`.
+        preconditionerReused : bool
+            Whether the preconditioner of an earlier solve was applied.
+        setupTime, solveTime : float
+            Seconds spent setting up the preconditioner and iterating.
+        """
+        self.info = info
+        self.iterations = iterations
+        self.residual = residual
+        self.residuals = residuals
+        self.preconditionerReused = preconditionerReused
+        self.setupTime = setupTime
+        self.solveTime = solveTime
+
+    @property
+    def converged(self):
+        return self.info == 0
+
+    def __repr__(self):
+        return ("%s(converged=%s, iterations=%d, residual=%s, "
+                "preconditionerReused=%s, setupTime=%g, solveTime=%g)"
+                % (self.__class__.__name__, self.converged, self.iterations,
+                   self.residual, self.preconditionerReused,
+                   self.setupTime, self.solveTime))
 
 class _ScipyKrylovSolver(_ScipySolver):
     """
     The base `ScipyKrylovSolver` class.
 
+    The preconditioner operator is kept from one solve to the next.
+    Depending on `rebuild`, the preconditioner of an earlier matrix may be
+    applied to later matrices with the same nonzero pattern, which saves
+    setting it up, e.g., building an algebraic multigrid hierarchy, on
+    every sweep.  The outcome of the last solve is kept in `result` and
+    the cumulative times spent setting up and applying the solver are
+    kept in `timings`.
+
+        >>> from fipy import Grid1D, CellVariable, TransientTerm, DiffusionTerm
+        >>> from fipy.solvers.scipy import LinearPCGSolver
+        >>> class JacobiPreconditioner(object):
+        ...     def _applyToMatrix(self, A):
+        ...         from scipy.sparse.linalg import LinearOperator
+        ...         inverseDiagonal = 1. / A.diagonal()
+        ...         return LinearOperator(A.shape,
+        ...                               matvec=lambda x: inverseDiagonal * x.ravel())
+        >>> mesh = Grid1D(nx=100)
+        >>> var = CellVariable(mesh=mesh, value=0.)
+        >>> var.constrain(1., mesh.facesLeft)
+        >>> eq = TransientTerm() == DiffusionTerm(coeff=1.)
+        >>> solver = LinearPCGSolver(tolerance=1e-10, precon=JacobiPreconditioner(),
+        ...                          rebuild=2, residualHistory=True)
+        >>> for sweep in range(5):
+        ...     eq.solve(var=var, dt=1., solver=solver)
+        >>> print(solver.result.converged)
+        True
+        >>> print(solver.result.iterations == len(solver.result.residuals))
+        True
+        >>> print(solver.result.residual < 1e-10)
+        True
+        >>> print(solver.timings["solves"], solver.timings["setups"])
+        5 3
+
+    Without `residualHistory`, the final residual is not computed
+
+        >>> solver = LinearPCGSolver(tolerance=1e-10)
+        >>> eq.solve(var=var, dt=1., solver=solver)
+        >>> print(solver.result.converged, solver.result.residual)
+        True None
+
+    A matrix with a different nonzero pattern always gets a new
+    preconditioner
+
+        >>> var2 = CellVariable(mesh=Grid1D(nx=50), value=0.)
+        >>> var2.constrain(1., var2.mesh.facesLeft)
+        >>> eq2 = TransientTerm() == DiffusionTerm(coeff=1.)
+        >>> eq2.solve(var=var2, dt=1., solver=solver)
+        >>> print(solver.result.preconditionerReused)
+        False
+
+    The `rebuild` policy is checked
+
+        >>> LinearPCGSolver(rebuild="sometimes") # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+            ...
+        ValueError: `rebuild` must be 'always', 'iterations' or a positive integer, ...
+
     .. attention:: This class is abstract. Always create one of its subclasses.
     """
 
+    def __init__(self, tolerance=1e-10, iterations=1000, precon=None,
+                 rebuild="always", iterationGrowth=1.5, residualHistory=False):
+        """
+        Parameters
+        ----------
+        tolerance : float
+            Required error tolerance.
+        iterations : int
+            Maximum number of iterative steps to perform.
+        precon
+            Preconditioner to use.
+        rebuild : {"always", "iterations"} or int
+            When to set up the preconditioner again for a matrix with the
+            same nonzero pattern as the last one: `"always"`, every `N`
+            solves if an integer `N`, or `"iterations"` when the number of
+            iterations exceeds `iterationGrowth` times the number taken
+            just after the last setup.
+        iterationGrowth : float
+            Growth in the number of iterations that triggers a new setup
+            when `rebuild` is `"iterations"`.
+        residualHistory : bool
+            Whether to record the residual norm of every iteration and of
+            the solution, which costs a matrix-vector product per
+            iteration.  GMRES always records its (preconditioned) residual
+            norms.
+        """
+        if not (rebuild in ("always", "iterations")
+                or (isinstance(rebuild, int) and rebuild > 0)):
+            raise ValueError("`rebuild` must be 'always', 'iterations' or a "
+                             "positive integer, not %r" % (rebuild,))
+
+        super(_ScipyKrylovSolver, self).__init__(tolerance=tolerance,
+                                                 iterations=iterations,
+                                                 precon=precon)
+
+        self.rebuild = rebuild
+        self.iterationGrowth = iterationGrowth
+        self.residualHistory = residualHistory
+        self.timings = dict(setup=0., solve=0., setups=0, solves=0)
+        self.result = None
+
+        self._M = None
+        self._pattern = None
+        self._solvesSinceSetup = 0
+        self._iterationsAfterSetup = None
+        self._growthExceeded = False
+
+    def _samePattern(self, A):
+        """Whether `A` has the nonzero pattern of the matrix the
+        preconditioner was last set up for
+        """
+        previous = self._pattern
+        same = (previous is not None
+                and previous[0] == A.shape
+                and numerix.array_equal(previous[1], A.indptr)
+                and numerix.array_equal(previous[2], A.indices))
+        if not same:
+            self._pattern = (A.shape, A.indptr.copy(), A.indices.copy())
+
+        return same
+
+    def _reusePreconditioner(self, A):
+        """Decide whether to keep the preconditioner for matrix `A`
+        """
+        if self.rebuild == "always":
+            return False
+
+        same = self._samePattern(A)
+
+        if self._M is None and self.preconditioner is not None:
+            return False
+        elif self.rebuild == "iterations":
+            return same and not self._growthExceeded
+        else:
+            return same and self._solvesSinceSetup < self.rebuild
+
+    def _callback(self, A, b, residuals):
+        """Function for the :mod:`scipy` solver to call on each iteration
+        """
+        if self.solveFnc.__name__ == "gmres":
+            return dict(callback=residuals.append, callback_type='pr_norm')
+        elif self.residualHistory:
+            bnorm = numerix.L2norm(b) or 1.
+            def record(xk):
+                residuals.append(numerix.L2norm(b - A * xk) / bnorm)
+            return dict(callback=record)
+        else:
+            return dict(callback=lambda xk: residuals.append(None))
+
     def _solve_(self, L, x, b):
         A = L.matrix
-        if self.preconditioner is None:
-            M = None
-        else:
-            M = self.preconditioner._applyToMatrix(A)
 
+        start = time.time()
+        reuse = self._reusePreconditioner(A)
+        if not reuse:
+            if self.preconditioner is None:
+                self._M = None
+            else:
+                self._M = self.preconditioner._applyToMatrix(A)
+            self.timings["setups"] += 1
+            self._solvesSinceSetup = 0
+            self._iterationsAfterSetup = None
+            self._growthExceeded = False
+        setupTime = time.time() - start
+
+        residuals = []
+        start = time.time()
         x, info = self.solveFnc(A, b, x,
-                                tol=self.tolerance,
                                 maxiter=self.iterations,
-                                M=M,
-                                atol='legacy')
+                                M=self._M,
+                                **dict(_toleranceArgs(self.solveFnc, self.tolerance),
+                                       **self._callback(A, b, residuals)))
+        solveTime = time.time() - start
+
+        iterations = len(residuals)
+        if not (self.residualHistory or self.solveFnc.__name__ == "gmres"):
+            residuals = []
+
+        self.timings["setup"] += setupTime
+        self.timings["solve"] += solveTime
+        self.timings["solves"] += 1
+        self._solvesSinceSetup += 1
+
+        if self._iterationsAfterSetup is None:
+            self._iterationsAfterSetup = max(iterations, 1)
+        elif iterations > self.iterationGrowth * self._iterationsAfterSetup:
+            self._growthExceeded = True
+
+        if self.residualHistory or 'FIPY_VERBOSE_SOLVER' in os.environ:
+            residual = numerix.L2norm(b - A * x) / (numerix.L2norm(b) or 1.)
+        else:
+            residual = None
+
+        self.result = _KrylovResult(info=info,
+                                    iterations=iterations,
+                                    residual=residual,
+                                    residuals=residuals,
+                                    preconditionerReused=reuse,
+                                    setupTime=setupTime,
+                                    solveTime=solveTime)
 
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
+            from fipy.tools.debug import PRINT
+            PRINT('preconditioner reused:', reuse)
+            PRINT('iterations: %d / %d' % (iterations, self.iterations))
+            PRINT('residual:', self.result.residual)
             if info < 0:
-                PRINT('failure', self._warningList[info].__class__.__name__)
+                PRINT('failure', self._warningList[info].__name__)
 
         return x
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
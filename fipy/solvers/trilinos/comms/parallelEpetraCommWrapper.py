@@ -50,6 +50,22 @@ class ParallelEpetraCommWrapper(EpetraCommWrapper):
         """
         return self.mpi4py_comm.allgather(sendobj=obj)
 
+    def gather(self, obj, root=0):
+        """mpi4py `gather`
+
+        Communicates copies of each `obj` to processor `root`, creating a
+        rank-dimensional list of `obj` objects there, and `None` elsewhere.
+        """
+        return self.mpi4py_comm.gather(sendobj=obj, root=root)
+
+    def scatter(self, objs, root=0):
+        """mpi4py `scatter`
+
+        Communicates element `i` of the list `objs` of processor `root` to
+        rank `i`.
+        """
+        return self.mpi4py_comm.scatter(sendobj=objs, root=root)
+
     def MaxAll(self, obj):
         """return max across all processes
         """
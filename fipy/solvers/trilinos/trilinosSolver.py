@@ -18,6 +18,7 @@ class TrilinosSolver(Solver):
             raise NotImplementedError("can't instantiate abstract base class")
         else:
             Solver.__init__(self, *args, **kwargs)
+        self._epetraVectors = {}
 
     def _storeMatrix(self, var, matrix, RHSvector):
         self.var = var
@@ -27,6 +28,24 @@ class TrilinosSolver(Solver):
             self.matrix = matrix
         self.RHSvector = RHSvector
 
+    def _epetraVector(self, key, map, values=None):
+        """`Epetra.Vector` on `map`, holding `values`
+
+        The vector is kept between solves and only refilled, as long as
+        `map` is the same (cached) map of the mesh.
+        """
+        vectorMap, vector = self._epetraVectors.get(key, (None, None))
+        if vectorMap is not map:
+            if values is None:
+                vector = Epetra.Vector(map)
+            else:
+                vector = Epetra.Vector(map, values)
+            self._epetraVectors[key] = (map, vector)
+        elif values is not None:
+            vector[:] = numerix.ravel(values)
+
+        return vector
+
     @property
     def _globalMatrixAndVectors(self):
         if not hasattr(self, 'globalVectors'):
@@ -43,8 +62,9 @@ class TrilinosSolver(Solver):
             else:
                 s = (localNonOverlappingCellIDs,)
 
-            nonOverlappingVector = Epetra.Vector(globalMatrix.domainMap,
-                                                 self.var[s].ravel())
+            nonOverlappingVector = self._epetraVector("nonOverlapping",
+                                                      globalMatrix.domainMap,
+                                                      self.var[s].ravel())
             from fipy.variables.coupledCellVariable import _CoupledCellVariable
 
             if isinstance(self.RHSvector, _CoupledCellVariable):
@@ -53,12 +73,15 @@ class TrilinosSolver(Solver):
                 RHSvector = numerix.reshape(numerix.array(self.RHSvector), self.var.shape)[s].ravel()
 
 
-            nonOverlappingRHSvector = Epetra.Vector(globalMatrix.rangeMap,
-                                                    RHSvector)
+            nonOverlappingRHSvector = self._epetraVector("nonOverlappingRHS",
+                                                         globalMatrix.rangeMap,
+                                                         RHSvector)
 
             del RHSvector
 
-            overlappingVector = Epetra.Vector(globalMatrix.colMap, self.var)
+            overlappingVector = self._epetraVector("overlapping",
+                                                   globalMatrix.colMap,
+                                                   self.var)
 
             self.globalVectors = (globalMatrix, nonOverlappingVector, nonOverlappingRHSvector, overlappingVector)
 
@@ -83,8 +106,7 @@ class TrilinosSolver(Solver):
                      nonOverlappingRHSvector)
 
         overlappingVector.Import(nonOverlappingVector,
-                                 Epetra.Import(globalMatrix.colMap,
-                                               globalMatrix.domainMap),
+                                 globalMatrix._colMapImport,
                                  Epetra.Insert)
 
         self.var.value = numerix.reshape(numerix.array(overlappingVector), self.var.shape)
@@ -107,8 +129,7 @@ class TrilinosSolver(Solver):
 
             overlappingResidual = Epetra.Vector(globalMatrix.colMap)
             overlappingResidual.Import(residual,
-                                       Epetra.Import(globalMatrix.colMap,
-                                                     globalMatrix.domainMap),
+                                       globalMatrix._colMapImport,
                                        Epetra.Insert)
 
             return overlappingResidual
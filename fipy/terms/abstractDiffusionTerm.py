@@ -15,6 +15,8 @@ from fipy.variables.faceVariable import FaceVariable
 
 class _AbstractDiffusionTerm(_UnaryTerm):
 
+    _usesGeomCoeffs = False
+
     def __init__(self, coeff = (1.,), var=None):
         if self.__class__ is _AbstractDiffusionTerm:
             raise AbstractBaseClassError
@@ -324,6 +326,23 @@ class _AbstractDiffusionTerm(_UnaryTerm):
 
         return (var, L, b)
 
+    def _getBuildDependencies(self, var):
+        if (self.order != 2
+            or not hasattr(self, 'coeffDict')
+            or not hasattr(self, 'constraintL')
+            or hasattr(self, 'anisotropySource')):
+            return None
+
+        dependencies = [self.coeffDict['cell 1 diag'], self.constraintL]
+
+        # `constraintB` depends on `var`, but only through the values
+        # `var` is constrained to. `Term` watches the constraints of `var`
+        # itself.
+        for constraint in var.faceGrad.constraints:
+            dependencies += [constraint, constraint.value, constraint.where]
+
+        return dependencies
+
     def __higherOrderbuildMatrix(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
         mesh = var.mesh
 
@@ -0,0 +1,176 @@
+from __future__ import unicode_literals
+from builtins import zip
+from builtins import object
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+import numbers
+import weakref
+
+from fipy.tools import numerix
+from fipy.variables.variable import Variable
+
+def _same(a, b):
+    if isinstance(a, numbers.Number) and isinstance(b, numbers.Number):
+        return a == b
+    elif isinstance(a, _Values) and isinstance(b, _Values):
+        return a == b
+    else:
+        return a is b
+
+def _versions(variables):
+    """Each of `variables` and every `Variable` they depend on, with its
+    version
+    """
+    versions = []
+    seen = set()
+    stack = list(variables)
+    while stack:
+        var = stack.pop()
+        if id(var) not in seen:
+            seen.add(id(var))
+            versions.append((var, var._version))
+            stack.extend(var.requiredVariables)
+    return versions
+
+class _Values(object):
+    """A copy of the current value of `obj`, a `Variable` or array, or a
+    sequence of them, which is compared by value
+
+    For objects that are made anew for every assembly.
+
+        >>> a = Variable(value=(1., 2.))
+        >>> _Values([a * 2, None]) == _Values([a * 2, None])
+        True
+        >>> _Values([a * 2, None]) == _Values([a * 3, None])
+        False
+        >>> _Values(None) == _Values(a)
+        False
+    """
+    def __init__(self, obj):
+        if isinstance(obj, (list, tuple)):
+            self.value = [_Values(element) for element in obj]
+        elif obj is None:
+            self.value = None
+        else:
+            self.value = numerix.array(obj)
+
+    def __eq__(self, other):
+        if isinstance(self.value, list) and isinstance(other.value, list):
+            return (len(self.value) == len(other.value)
+                    and all(a == b for a, b in zip(self.value, other.value)))
+        elif self.value is None or other.value is None:
+            return self.value is other.value
+        elif isinstance(self.value, list) or isinstance(other.value, list):
+            return False
+        else:
+            return (self.value.shape == other.value.shape
+                    and numerix.array_equal(self.value, other.value))
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+class _AssemblyCache(object):
+    """The last matrix and RHS vector assembled by a `Term`
+
+    The result stays valid as long as the objects it was assembled from
+    are unchanged: every `Variable` among them, and every `Variable` they
+    depend on, must not have been set since, and every other object must
+    be the same object (or an equal number).
+
+        >>> a = Variable(value=1.)
+        >>> b = a * 2
+        >>> cache = _AssemblyCache(key=(b, 0.1), result="result")
+        >>> cache.isValid(key=(b, 0.1))
+        True
+        >>> cache.isValid(key=(b, 0.2))
+        False
+        >>> a.value = 3.
+        >>> cache.isValid(key=(b, 0.1))
+        False
+
+    The `Variable` objects are not subscribed to, so they are no more
+    likely to hold their values than before
+
+        >>> len(b.subscribedVariables)
+        0
+
+    Objects that the result is only tied to by identity, such as the
+    solution `Variable` that the result was assembled for, are not
+    watched, nor kept alive
+
+        >>> cache = _AssemblyCache(key=(b,), result="result", identities=(a,))
+        >>> a.value = 4.
+        >>> cache.isValid(key=(b,), identities=(a,))
+        False
+        >>> cache = _AssemblyCache(key=(), result="result", identities=(a,))
+        >>> a.value = 5.
+        >>> cache.isValid(key=(), identities=(a,))
+        True
+        >>> cache.isValid(key=(), identities=(b,))
+        False
+        >>> cache.isAlive()
+        True
+        >>> del a, b
+        >>> cache.isAlive()
+        False
+
+    A change to a `Variable` that has not been evaluated since the cache
+    was created is still seen
+
+        >>> a = Variable(value=1.)
+        >>> b = a * 2
+        >>> cache = _AssemblyCache(key=(b,), result="result")
+        >>> a.value = 4.
+        >>> a.value = 5.
+        >>> cache.isValid(key=(b,))
+        False
+    """
+    def __init__(self, key, result, identities=()):
+        """
+        Parameters
+        ----------
+        key : sequence
+            The objects the assembly depends on.
+        result : object
+            Whatever was assembled from them.
+        identities : sequence
+            Objects that must be the same objects for `result` to be
+            reused, but whose values do not matter.
+        """
+        self.key = tuple(key)
+        self.result = result
+        self.identities = tuple(weakref.ref(obj) for obj in identities)
+        self.versions = _versions(obj for obj in self.key if isinstance(obj, Variable))
+
+    def isAlive(self):
+        """Whether all of the `identities` still exist
+        """
+        return all(ref() is not None for ref in self.identities)
+
+    def isValid(self, key, identities=()):
+        """Whether `result` was assembled from `key` and `identities`
+        and is still current
+        """
+        key = tuple(key)
+        identities = tuple(identities)
+        if not (len(identities) == len(self.identities)
+                and all(a is ref() for a, ref in zip(identities, self.identities))
+                and len(key) == len(self.key)
+                and all(_same(a, b) for a, b in zip(key, self.key))):
+            return False
+
+        versions = _versions(obj for obj in key if isinstance(obj, Variable))
+        return (len(versions) == len(self.versions)
+                and all(a is b and u == v
+                        for (a, u), (b, v) in zip(versions, self.versions)))
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -18,6 +18,66 @@ class _BinaryTerm(_AbstractBinaryTerm):
 
         Only called at top-level by `_prepareLinearSystem()`
 
+        Constituent terms whose matrix and RHS vector cannot have changed
+        since the last call are not rebuilt.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=3)
+        >>> v = CellVariable(mesh=m, value=1., hasOld=True)
+        >>> D = Variable(1.)
+        >>> S = Variable(0.)
+        >>> diffTerm = DiffusionTerm(coeff=D)
+        >>> eq = TransientTerm() + diffTerm + S
+        >>> SparseMatrix = DefaultSolver()._matrixClass
+        >>> _, matrix, RHSvector = eq._buildAndAddMatrices(
+        ...     var=v, SparseMatrix=SparseMatrix, dt=1.)
+        >>> assembly = diffTerm._assemblies[id(v)]
+
+        Changing the source does not rebuild the diffusion matrix
+
+        >>> S.value = 1.
+        >>> _, matrix, RHSvector = eq._buildAndAddMatrices(
+        ...     var=v, SparseMatrix=SparseMatrix, dt=1.)
+        >>> print(RHSvector)
+        [ 0.  0.  0.]
+        >>> diffTerm._assemblies[id(v)] is assembly
+        True
+
+        but changing its coefficient does
+
+        >>> D.value = 2.
+        >>> _, matrix, RHSvector = eq._buildAndAddMatrices(
+        ...     var=v, SparseMatrix=SparseMatrix, dt=1.)
+        >>> diffTerm._assemblies[id(v)] is assembly
+        False
+        >>> print(numerix.allequal(matrix.numpyArray, [[-1,  2,  0],
+        ...                                            [ 2, -3,  2],
+        ...                                            [ 0,  2, -1]]))
+        True
+
+        Solving changes the solution variable, but not the assemblies of
+        terms that do not depend on its value, so repeated sweeps reuse
+        them
+
+        >>> transient = TransientTerm()
+        >>> eq = transient + diffTerm + S
+        >>> res = eq.sweep(var=v, dt=1.)
+        >>> assemblies = [term._assemblies[id(v)] for term in (transient, diffTerm)]
+        >>> for sweep in range(3):
+        ...     res = eq.sweep(var=v, dt=1.)
+        ...     print([term._assemblies[id(v)] is assembly
+        ...            for term, assembly in zip((transient, diffTerm), assemblies)])
+        [True, True]
+        [True, True]
+        [True, True]
+
+        until a coefficient changes
+
+        >>> D.value = 3.
+        >>> res = eq.sweep(var=v, dt=1.)
+        >>> print([term._assemblies[id(v)] is assembly
+        ...        for term, assembly in zip((transient, diffTerm), assemblies)])
+        [True, False]
         """
 
         matrix = SparseMatrix(mesh=var.mesh)
@@ -25,13 +85,14 @@ class _BinaryTerm(_AbstractBinaryTerm):
 
         for term in (self.term, self.other):
 
-            tmpVar, tmpMatrix, tmpRHSvector = term._buildAndAddMatrices(var,
-                                                                        SparseMatrix,
-                                                                        boundaryConditions=boundaryConditions,
-                                                                        dt=dt,
-                                                                        transientGeomCoeff=transientGeomCoeff,
-                                                                        diffusionGeomCoeff=diffusionGeomCoeff,
-                                                                        buildExplicitIfOther=buildExplicitIfOther)
+            tmpVar, tmpMatrix, tmpRHSvector = term._reuseOrBuildAndAddMatrices(
+                var,
+                SparseMatrix,
+                boundaryConditions=boundaryConditions,
+                dt=dt,
+                transientGeomCoeff=transientGeomCoeff,
+                diffusionGeomCoeff=diffusionGeomCoeff,
+                buildExplicitIfOther=buildExplicitIfOther)
 
             matrix += tmpMatrix
             RHSvector += tmpRHSvector
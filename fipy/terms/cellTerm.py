@@ -87,6 +87,12 @@ class CellTerm(_NonDiffusionTerm):
 
         return self.coeffVectors
 
+    def _getBuildDependencies(self, var):
+        if self.coeffVectors is None or var is not self._var:
+            return None
+        else:
+            return list(self.coeffVectors.values()) + [var.old]
+
     def _buildMatrixInline_(self, L, oldArray, b, dt, coeffVectors):
         oldArray = oldArray.value.ravel()
         N = len(oldArray)
@@ -79,13 +79,15 @@ class _CoupledBinaryTerm(_AbstractBinaryTerm):
 
                 SparseMatrix.varIndex = varIndex
 
-                tmpVar, tmpMatrix, tmpRHSvector = uncoupledTerm._buildAndAddMatrices(tmpVar,
-                                                                                     SparseMatrix,
-                                                                                     boundaryConditions=(),
-                                                                                     dt=dt,
-                                                                                     transientGeomCoeff=uncoupledTerm._getTransientGeomCoeff(tmpVar),
-                                                                                     diffusionGeomCoeff=uncoupledTerm._getDiffusionGeomCoeff(tmpVar),
-                                                                                     buildExplicitIfOther=buildExplicitIfOther)
+                build = uncoupledTerm._reuseOrBuildAndAddMatrices
+                tmpVar, tmpMatrix, tmpRHSvector = build(
+                    tmpVar,
+                    SparseMatrix,
+                    boundaryConditions=(),
+                    dt=dt,
+                    transientGeomCoeff=uncoupledTerm._getTransientGeomCoeff(tmpVar),
+                    diffusionGeomCoeff=uncoupledTerm._getDiffusionGeomCoeff(tmpVar),
+                    buildExplicitIfOther=buildExplicitIfOther)
 
                 termMatrix += tmpMatrix
                 termRHSvector += tmpRHSvector
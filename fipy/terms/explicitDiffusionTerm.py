@@ -33,6 +33,10 @@ class ExplicitDiffusionTerm(_AbstractDiffusionTerm):
 
         return (var, SparseMatrix(mesh=var.mesh), b - L * var.value)
 
+    def _getBuildDependencies(self, var):
+        # the RHS vector depends on the current value of `var`
+        return None
+
     def _getNormals(self, mesh):
         return mesh._faceCellToCellNormals
 
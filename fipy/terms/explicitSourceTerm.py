@@ -19,6 +19,8 @@ class _ExplicitSourceTerm(SourceTerm):
 
     """
 
+    _usesGeomCoeffs = False
+
     def _getWeight(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
         return {
             'b vector': -1,
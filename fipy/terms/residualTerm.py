@@ -36,3 +36,8 @@ class ResidualTerm(_ExplicitSourceTerm):
         self.coeffVectors = None
 
         return _ExplicitSourceTerm._buildMatrix(self, var=var, SparseMatrix=SparseMatrix, boundaryConditions=boundaryConditions, dt=dt, transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+
+    def _getBuildDependencies(self, var):
+        # the coefficient is the residual of `equation`, recomputed on
+        # every build
+        return None
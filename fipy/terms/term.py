@@ -19,6 +19,10 @@ class Term(object):
     .. attention:: This class is abstract. Always create one of its subclasses.
     """
 
+    # whether the matrix and RHS vector depend on the geometric
+    # coefficients of the transient and diffusion terms of the equation
+    _usesGeomCoeffs = True
+
     def __init__(self, coeff=1., var=None):
         """
         Create a `Term`.
@@ -39,6 +43,7 @@ class Term(object):
         self._matrix = None
         self._cacheRHSvector = False
         self._RHSvector = None
+        self._assemblies = {}
         self.var = var
 
     def _calcVars(self):
@@ -56,6 +61,89 @@ class Term(object):
     def _buildAndAddMatrices(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None, buildExplicitIfOther=False):
         raise NotImplementedError
 
+    def _getAssemblyDependencies(self, var, buildExplicitIfOther=False):
+        """Objects that the matrix and RHS vector built for `var` depend on
+
+        `Variable` objects are watched for changes. Anything else must
+        be the same object, or an equal number, for an earlier assembly
+        to be reused. Returns `None` if the dependencies are not known,
+        in which case the matrix and RHS vector are always rebuilt.
+        """
+        return None
+
+    def _reuseOrBuildAndAddMatrices(self, var, SparseMatrix, boundaryConditions=(),
+                                    dt=None, transientGeomCoeff=None,
+                                    diffusionGeomCoeff=None,
+                                    buildExplicitIfOther=False):
+        """Return the last result of `_buildAndAddMatrices()` for `var` if
+        nothing it depends on has changed, otherwise rebuild it
+
+        The matrix and RHS vector may be returned again by later calls, so
+        they must not be modified.
+        """
+        geomCoeffs = (transientGeomCoeff, diffusionGeomCoeff)
+
+        assembly = self._assemblies.get(id(var))
+        if assembly is not None:
+            key = self.__assemblyKey(var, SparseMatrix, boundaryConditions, dt,
+                                     geomCoeffs, buildExplicitIfOther)
+            if key is not None and assembly.isValid(key, identities=(var,)):
+                return assembly.result
+
+        result = self._buildAndAddMatrices(var,
+                                           SparseMatrix,
+                                           boundaryConditions=boundaryConditions,
+                                           dt=dt,
+                                           transientGeomCoeff=transientGeomCoeff,
+                                           diffusionGeomCoeff=diffusionGeomCoeff,
+                                           buildExplicitIfOther=buildExplicitIfOther)
+
+        # forget the assemblies for solution variables that no longer exist
+        self._assemblies = dict((k, assembly)
+                                for k, assembly in self._assemblies.items()
+                                if k != id(var) and assembly.isAlive())
+
+        # building may create the `Variable` objects the term depends on
+        key = self.__assemblyKey(var, SparseMatrix, boundaryConditions, dt,
+                                 geomCoeffs, buildExplicitIfOther)
+        if key is not None:
+            from fipy.terms.assemblyCache import _AssemblyCache
+            self._assemblies[id(var)] = _AssemblyCache(key=key, result=result,
+                                                       identities=(var,))
+
+        return result
+
+    def __assemblyKey(self, var, SparseMatrix, boundaryConditions, dt,
+                      geomCoeffs, buildExplicitIfOther):
+        if len(boundaryConditions) > 0:
+            return None
+
+        dependencies = self._getAssemblyDependencies(
+            var, buildExplicitIfOther=buildExplicitIfOther)
+        if dependencies is None:
+            return None
+
+        # `var` is written by every solve, so its value is not watched.
+        # It only enters the assembly through the values it is
+        # constrained to.
+        constraints = (list(getattr(var, 'constraints', []))
+                       + list(getattr(var, 'faceConstraints', [])))
+        for constraint in constraints:
+            dependencies = (list(dependencies)
+                            + [constraint, constraint.value, constraint.where])
+
+        # the geometric coefficients of the whole equation are made anew
+        # for every assembly, so they are compared by value
+        if self._usesGeomCoeffs:
+            from fipy.terms.assemblyCache import _Values
+            geomCoeffs = _Values(geomCoeffs)
+        else:
+            geomCoeffs = None
+
+        return ((dt, buildExplicitIfOther, geomCoeffs)
+                + SparseMatrix._assemblyKey()
+                + tuple(dependencies))
+
     def _checkVar(self, var):
         raise NotImplementedError
 
@@ -25,7 +25,8 @@ def _suite():
             'binaryTerm',
             'firstOrderAdvectionTerm',
             'advectionTerm',
-            'vanLeerConvectionTerm'
+            'vanLeerConvectionTerm',
+            'assemblyCache'
             ), base = __name__)
 
 if __name__ == '__main__':
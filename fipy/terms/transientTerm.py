@@ -72,6 +72,8 @@ class TransientTerm(CellTerm):
     1
     """
 
+    _usesGeomCoeffs = False
+
     def _getWeight(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
         return {
             'b vector':  0,
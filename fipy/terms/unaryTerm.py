@@ -86,6 +86,24 @@ class _UnaryTerm(Term):
 
         return (var, matrix, RHSvector)
 
+    def _getAssemblyDependencies(self, var, buildExplicitIfOther=False):
+        if var is self.var or self.var is None:
+            return self._getBuildDependencies(var)
+        elif buildExplicitIfOther:
+            dependencies = self._getBuildDependencies(self.var)
+            if dependencies is not None:
+                dependencies = dependencies + [self.var]
+            return dependencies
+        else:
+            return []
+
+    def _getBuildDependencies(self, var):
+        """Objects that the result of `_buildMatrix()` for `var` depends on
+
+        See `Term._getAssemblyDependencies()`.
+        """
+        return None
+
     def _reshapeIDs(self, var, ids):
         shape = (self._vectorSize(var), self._vectorSize(var), ids.shape[-1])
         ids = numerix.resize(ids, shape)
@@ -14,6 +14,7 @@ def _suite():
         'variables.test',
         'viewers.test',
         'boundaryConditions.test',
+        'benchmarks.test',
     ), base = __name__)
 
 if __name__ == '__main__':
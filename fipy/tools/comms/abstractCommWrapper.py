@@ -48,6 +48,18 @@ class AbstractCommWrapper(object):
     def allgather(self, obj):
         return obj
 
+    def gather(self, obj, root=0):
+        """List of `obj` of every processor, on processor `root` only
+
+        Other processors get `None`.
+        """
+        return [obj]
+
+    def scatter(self, objs, root=0):
+        """Element `procID` of the list `objs` of processor `root`
+        """
+        return objs[0]
+
     def sum(self, a, axis=None):
         return a.sum(axis=axis)
 
@@ -3,15 +3,18 @@ from future import standard_library
 standard_library.install_aliases()
 __docformat__ = 'restructuredtext'
 
+import hashlib
 import io
+import json
 import pickle
 import os
 import sys
 import gzip
 
+from fipy.tools import numerix
 from fipy.tools import parallelComm
 
-__all__ = ["write", "read"]
+__all__ = ["write", "read", "writeCheckpoint", "readCheckpoint"]
 from future.utils import text_to_native_str
 __all__ = [text_to_native_str(n) for n in __all__]
 
@@ -124,6 +127,282 @@ def read(filename, fileobject=None, communicator=parallelComm, mesh_unmangle=Fal
 
     return unpickler.load()
 
+def _checkpointPath(dirname, tag):
+    if tag is None:
+        return dirname
+    else:
+        return os.path.join(dirname, "%s" % tag)
+
+def _meshFingerprint(mesh):
+    """Digest of the pickled `mesh`, which is only pickled the first time
+
+    Returns the digest and the pickle, if it was made.
+    """
+    fingerprint = getattr(mesh, "_checkpointFingerprint", None)
+    if fingerprint is None:
+        pickled = pickle.dumps(mesh, pickle.HIGHEST_PROTOCOL)
+        fingerprint = hashlib.sha256(pickled).hexdigest()
+        mesh._checkpointFingerprint = fingerprint
+    else:
+        pickled = None
+    return fingerprint, pickled
+
+def _elementKind(var):
+    from fipy.variables.cellVariable import CellVariable
+    from fipy.variables.faceVariable import FaceVariable
+
+    if isinstance(var, CellVariable):
+        return "cell"
+    elif isinstance(var, FaceVariable):
+        return "face"
+    else:
+        raise TypeError("Only `CellVariable` and `FaceVariable` objects can be "
+                        "checkpointed, not %s" % var.__class__.__name__)
+
+def writeCheckpoint(dirname, variables, tag=None, compress=False, chunkSize=2**20):
+    """
+    Write the values of `MeshVariable` objects, and their mesh, to a
+    checkpoint directory.
+
+    Unlike :func:`write`, which pickles an entire object graph, the mesh
+    is pickled only once, to ``mesh.pickle`` in `dirname`, and each value
+    is written as a raw binary array.  Later checkpoints are checked
+    against a digest of the pickled mesh, which each mesh only computes
+    once.  In parallel, each processor writes
+    only its own, non-overlapping, cells or faces.  A series of
+    checkpoints of the same mesh can share `dirname` with different
+    `tag` values.
+
+        >>> import shutil
+        >>> import tempfile
+        >>> from fipy import Grid2D, CellVariable, FaceVariable
+        >>> mesh = Grid2D(nx=3, ny=2)
+        >>> phi = CellVariable(mesh=mesh, value=mesh.x * mesh.y, unit="m")
+        >>> flux = FaceVariable(mesh=mesh, rank=1, value=mesh.faceNormals)
+        >>> dirname = tempfile.mkdtemp() if parallelComm.procID == 0 else None
+        >>> dirname = parallelComm.bcast(dirname)
+        >>> writeCheckpoint(dirname, {"phi": phi, "flux": flux}, tag=10)
+        >>> psi = CellVariable(mesh=mesh, value=2 * phi.value)
+        >>> writeCheckpoint(dirname, {"psi": psi}, tag=20, compress=True, chunkSize=2)
+
+    The variables can be read back on to a new mesh (unpickled from the
+    checkpoint)
+
+        >>> newMesh, values = readCheckpoint(dirname, tag=10)
+        >>> print(values["phi"].unit)
+        <PhysicalUnit m>
+        >>> print(numerix.allclose(values["phi"].numericValue, phi.numericValue))
+        True
+        >>> print(numerix.allclose(values["flux"].globalValue, flux.globalValue))
+        True
+
+    or on to the mesh already in use, without unpickling it
+
+        >>> sameMesh, values = readCheckpoint(dirname, tag=20, mesh=mesh)
+        >>> sameMesh is mesh
+        True
+        >>> print(numerix.allclose(values["psi"].numericValue, 2 * phi.numericValue))
+        True
+
+    Checkpoints of a different mesh cannot share `dirname`
+
+        >>> other = CellVariable(mesh=Grid2D(nx=2, ny=2))
+        >>> writeCheckpoint(dirname, {"other": other}, tag=30)
+        Traceback (most recent call last):
+            ...
+        ValueError: The checkpoints in `dirname` are of a different mesh
+
+        >>> parallelComm.Barrier()
+        >>> if parallelComm.procID == 0:
+        ...     shutil.rmtree(dirname)
+
+    Parameters
+    ----------
+    dirname : str
+        Directory to hold the checkpoint.  It is created if necessary.
+        If it already holds checkpoints, they must be of the same mesh.
+    variables : dict
+        The `CellVariable` and `FaceVariable` objects to write, by name.
+        They must all share a mesh.
+    tag : str or int, optional
+        If given, the values are written to the `tag` subdirectory of
+        `dirname`, e.g., to keep the checkpoints of several time steps.
+    compress : bool
+        Whether to compress the values, in chunks of `chunkSize`
+        elements.  Compressed values cannot be memory-mapped on reading.
+    chunkSize : int
+        Number of elements per compressed chunk.
+    """
+    meshes = set([id(var.mesh) for var in variables.values()])
+    if len(meshes) != 1:
+        raise ValueError("Checkpointed variables must share exactly one mesh")
+
+    mesh = list(variables.values())[0].mesh
+    communicator = mesh.communicator
+    path = _checkpointPath(dirname, tag)
+
+    sameMesh = True
+    if communicator.procID == 0:
+        meshFile = os.path.join(dirname, "mesh.pickle")
+        fingerprintFile = os.path.join(dirname, "mesh.sha256")
+        fingerprint, pickled = _meshFingerprint(mesh)
+        if os.path.exists(meshFile):
+            with open(fingerprintFile, 'r') as f:
+                sameMesh = (f.read() == fingerprint)
+        else:
+            if not os.path.isdir(dirname):
+                os.makedirs(dirname)
+            if pickled is None:
+                pickled = pickle.dumps(mesh, pickle.HIGHEST_PROTOCOL)
+            with open(meshFile, 'wb') as f:
+                f.write(pickled)
+            with open(fingerprintFile, 'w') as f:
+                f.write(fingerprint)
+        if sameMesh and not os.path.isdir(path):
+            os.makedirs(path)
+    if not communicator.bcast(sameMesh, root=0):
+        raise ValueError("The checkpoints in `dirname` are of a different mesh")
+
+    procID = communicator.procID
+    manifest = dict(Nproc=communicator.Nproc, variables={})
+    kinds = set()
+    for name, var in variables.items():
+        kind = _elementKind(var)
+        localIDs = var._localNonOverlappingIDs
+        if kind not in kinds:
+            numerix.save(os.path.join(path, "%s.%d.ids.npy" % (kind, procID)),
+                         numerix.asarray(var._globalOverlappingIDs)[localIDs])
+            kinds.add(kind)
+
+        value = numerix.asarray(var.numericValue)[..., localIDs]
+        base = os.path.join(path, "%s.%d" % (name, procID))
+        if compress:
+            chunks = [value[..., start:start + chunkSize]
+                      for start in range(0, max(value.shape[-1], 1), chunkSize)]
+            numerix.savez_compressed(base + ".npz",
+                                     **dict(("chunk%d" % i, chunk)
+                                            for i, chunk in enumerate(chunks)))
+        else:
+            numerix.save(base + ".npy", value)
+
+        unit = var.unit
+        manifest["variables"][name] = dict(kind=kind,
+                                           name=var.name,
+                                           elementshape=list(var.elementshape),
+                                           dtype=value.dtype.str,
+                                           unit=(None if unit.isDimensionless()
+                                                 else unit.name()),
+                                           compressed=compress)
+
+    # the manifest is written last, so that it marks a complete checkpoint
+    communicator.Barrier()
+    if procID == 0:
+        with open(os.path.join(path, "manifest.json"), 'w') as f:
+            json.dump(manifest, f)
+    communicator.Barrier()
+
+def _readCheckpointValues(path, name, kind, compressed, Nproc, globalIDs, shape, dtype):
+    """Gather the values of `globalIDs` from each processor's file
+
+    An uncompressed file that holds exactly the values of `globalIDs`,
+    e.g., one written and read by a single processor, is memory-mapped
+    and returned as is, to be copied only into the new variable.
+    """
+    if not compressed:
+        for procID in range(Nproc):
+            ids = numerix.load(os.path.join(path, "%s.%d.ids.npy" % (kind, procID)),
+                               mmap_mode='r')
+            if numerix.array_equal(ids, globalIDs):
+                return numerix.load(os.path.join(path, "%s.%d.npy" % (name, procID)),
+                                    mmap_mode='r')
+
+    value = numerix.empty(shape + (len(globalIDs),), dtype=dtype)
+
+    if len(globalIDs) > 0:
+        localIDs = numerix.zeros(max(globalIDs) + 1, dtype=int) - 1
+        localIDs[globalIDs] = numerix.arange(len(globalIDs))
+
+    for procID in range(Nproc):
+        ids = numerix.load(os.path.join(path, "%s.%d.ids.npy" % (kind, procID)),
+                           mmap_mode='r')
+        base = os.path.join(path, "%s.%d" % (name, procID))
+        if compressed:
+            with numerix.load(base + ".npz") as chunks:
+                values = numerix.concatenate([chunks["chunk%d" % i]
+                                              for i in range(len(chunks.files))],
+                                             axis=-1)
+        else:
+            values = numerix.load(base + ".npy", mmap_mode='r')
+
+        if len(globalIDs) == 0:
+            continue
+
+        inRange = ids < len(localIDs)
+        local = numerix.where(inRange, localIDs[numerix.where(inRange, ids, 0)], -1)
+        wanted = local >= 0
+        value[..., local[wanted]] = values[..., wanted]
+
+    return value
+
+def readCheckpoint(dirname, tag=None, mesh=None):
+    """
+    Read the variables written by :func:`writeCheckpoint`.
+
+    The values are memory-mapped from the checkpoint, so each processor
+    only reads the cells or faces it needs, and a checkpoint written by
+    one number of processors can be read by any other.
+
+    Parameters
+    ----------
+    dirname : str
+        Directory holding the checkpoint.
+    tag : str or int, optional
+        The `tag` the values were written with.
+    mesh : ~fipy.meshes.mesh.Mesh, optional
+        Mesh to define the variables on.  It must be equivalent to the
+        mesh that was written.  If `None`, the mesh is unpickled from the
+        checkpoint.
+
+    Returns
+    -------
+    mesh : ~fipy.meshes.mesh.Mesh
+    variables : dict
+        New `CellVariable` and `FaceVariable` objects, by name.
+    """
+    from fipy.variables.cellVariable import CellVariable
+    from fipy.variables.faceVariable import FaceVariable
+
+    if mesh is None:
+        with open(os.path.join(dirname, "mesh.pickle"), 'rb') as f:
+            mesh = pickle.load(f)
+
+    path = _checkpointPath(dirname, tag)
+    with open(os.path.join(path, "manifest.json"), 'r') as f:
+        manifest = json.load(f)
+
+    variables = {}
+    for name, info in manifest["variables"].items():
+        if info["kind"] == "cell":
+            klass = CellVariable
+            globalIDs = mesh._globalOverlappingCellIDs
+        else:
+            klass = FaceVariable
+            globalIDs = mesh._globalOverlappingFaceIDs
+
+        value = _readCheckpointValues(path, name,
+                                      kind=info["kind"],
+                                      compressed=info["compressed"],
+                                      Nproc=manifest["Nproc"],
+                                      globalIDs=numerix.asarray(globalIDs),
+                                      shape=tuple(info["elementshape"]),
+                                      dtype=info["dtype"])
+
+        variables[name] = klass(mesh=mesh, name=info["name"], value=value,
+                                elementshape=tuple(info["elementshape"]),
+                                unit=info["unit"])
+
+    return mesh, variables
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
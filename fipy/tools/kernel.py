@@ -0,0 +1,361 @@
+"""Fused evaluation of `_OperatorVariable` expression trees
+
+Each node of an expression like ``(a * b + 2) / (1 + a)`` is an
+`_OperatorVariable` that, when evaluated on its own, allocates a
+temporary array for its result.  A kernel backend instead collapses
+every element-wise node of the tree into a single function of the
+tree's leaves, which is generated once per tree structure and reused for
+every other tree with the same structure.
+
+The backend is selected with the `FIPY_KERNEL` environment variable or
+the ``--kernel`` command line flag:
+
+``numpy``
+    the fused function is evaluated with plain NumPy operations, which
+    avoids the bookkeeping of intermediate `Variable` objects but still
+    allocates one temporary per node.
+``numba``
+    the fused function is compiled by :func:`numba.vectorize` into a
+    single loop, with no intermediate temporaries.  One specialization
+    is compiled (and cached) for each combination of leaf dtypes.  If
+    :mod:`numba` cannot be imported, the ``numpy`` backend is used
+    instead.
+
+The ``--inline`` flag (or `FIPY_INLINE` environment variable), which
+used to select the `weave` evaluation of `_OperatorVariable` objects,
+now selects the ``numba`` backend unless another backend is requested
+explicitly.  If no backend is selected, each node is evaluated
+individually.
+
+Nodes that cannot be fused (nodes created with ``canInline=False``,
+nodes whose value is cached because other variables depend on them, and
+nodes with constraints) are evaluated normally and enter the fused
+function as leaves.  Values that are merely held by the operator cache
+(see :mod:`fipy.variables.operatorCache`) are fused, and released.
+
+    >>> from fipy import Grid1D, CellVariable
+    >>> m = Grid1D(nx=5)
+    >>> a = CellVariable(mesh=m, value=m.cellCenters[0])
+    >>> b = CellVariable(mesh=m, value=2.)
+    >>> expr = (a * b + 2) / (1 + a) - numerix.sin(b) * abs(a - 3)
+
+    >>> backend = _NumpyKernelBackend()
+    >>> print(numerix.allclose(backend(expr), expr._calcValue_()))
+    True
+
+Trees that share a structure share a fused kernel
+
+    >>> c = CellVariable(mesh=m, value=3.)
+    >>> other = (c * a + 2) / (1 + c) - numerix.sin(a) * abs(c - 3)
+    >>> print(numerix.allclose(backend(other), other._calcValue_()))
+    True
+    >>> print(len(backend._kernels))
+    1
+
+The ``numba`` backend gives the same results
+
+    >>> backend = _NumbaKernelBackend() # doctest: +NUMBA
+    >>> print(numerix.allclose(backend(expr), expr._calcValue_())) # doctest: +NUMBA
+    True
+    >>> compared = a * 2 > b
+    >>> fused = backend(compared) # doctest: +NUMBA
+    >>> print(numerix.allequal(fused, compared._calcValue_())) # doctest: +NUMBA
+    True
+
+including for boolean and integer operands, whose arithmetic follows
+NumPy's rules, not Python's
+
+    >>> i = CellVariable(mesh=m, value=numerix.arange(5))
+    >>> for expr in (((i > 2) + (i > 3)) * 2,
+    ...              (i > 1) * (i > 2) - i,
+    ...              (i + i) * 3 / (i + 1)):
+    ...     fused = backend(expr) # doctest: +NUMBA
+    ...     unfused = expr._calcValue_()
+    ...     print(fused.dtype == unfused.dtype,
+    ...           numerix.allequal(fused, unfused)) # doctest: +NUMBA
+    True True
+    True True
+    True True
+
+Trees with a single fusible node are left to the normal evaluation
+
+    >>> print(backend(a * b)) # doctest: +NUMBA
+    None
+
+Non-contiguous leaves, such as a single component of
+`mesh.cellCenters`, are handled correctly
+
+    >>> from fipy import Grid2D
+    >>> mesh = Grid2D(dx=1., dy=1., nx=2, ny=2)
+    >>> var = CellVariable(mesh=mesh, value=0.)
+    >>> Y =  mesh.cellCenters[1]
+    >>> var.value = (Y + 1.0)
+    >>> print(_NumpyKernelBackend()(var - Y + 0.))
+    [ 1.  1.  1.  1.]
+    >>> print(backend(var - Y + 0.)) # doctest: +NUMBA
+    [ 1.  1.  1.  1.]
+"""
+from __future__ import unicode_literals
+from builtins import object
+from builtins import range
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+import os
+
+from fipy.tools import inline
+from fipy.tools import numerix
+from fipy.tools import parser
+from fipy.tests.doctestPlus import register_skipper
+
+def _checkForNumba():
+    hasNumba = True
+    try:
+        import numba
+    except Exception:
+        hasNumba = False
+    return hasNumba
+
+register_skipper(flag="NUMBA",
+                 test=_checkForNumba,
+                 why="the `numba` package cannot be imported")
+
+def _opKey(op):
+    """Hashable identity of an operator function
+
+    Lambdas created by the same expression share their code object, so
+    operators that only differ by identity map to the same key.  Returns
+    `None` for operators that cannot be identified this way.
+    """
+    if isinstance(op, numerix.ufunc):
+        return op
+
+    code = getattr(op, "__code__", None)
+    if code is None:
+        return None
+
+    try:
+        cells = tuple(cell.cell_contents for cell in (op.__closure__ or ()))
+        hash(cells)
+    except (TypeError, ValueError):
+        return None
+
+    return (code, cells)
+
+class _KernelBackend(object):
+    """Base class for the evaluation of fused `_OperatorVariable` trees
+    """
+    name = None
+
+    def __init__(self):
+        self._kernels = {}
+
+    def __call__(self, var):
+        """Evaluate the expression tree rooted at `var`
+
+        Returns `None` if the tree cannot be fused, in which case `var`
+        should be evaluated normally.
+        """
+        leaves = []
+        fused = []
+        tree = var._getKernelTree(leaves=leaves, fused=fused, root=True)
+
+        if len(fused) < 2:
+            return None
+
+        values = [leaf.value for leaf in leaves]
+        plain = (numerix.ndarray, numerix.generic, int, float, bool)
+        for value in values:
+            if (isinstance(value, numerix.MA.MaskedArray)
+                or not isinstance(value, plain)):
+                return None
+
+        casts = self._casts(tree, fused, values)
+        key = (tree, len(leaves), casts)
+        if key not in self._kernels:
+            source = self._source(tree, fused, len(leaves), casts)
+            self._kernels[key] = self._compile(source)
+
+        kernel = self._kernels[key]
+        if kernel is None:
+            return None
+
+        try:
+            result = kernel(*values)
+        except Exception:
+            # give up on this structure and let numpy report any real error
+            self._kernels[key] = None
+            return None
+
+        # the intermediate nodes were never evaluated, but they are no longer
+        # stale with respect to their own dependencies. Any value they held
+        # from an earlier, cached, evaluation is out of date. Freshening a
+        # node marks its subscribers stale, so work from the leaves up.
+        from fipy.variables import operatorCache
+        for node in reversed(fused[1:]):
+            if operatorCache._cache is not None:
+                operatorCache._cache._release(node)
+            node._value = None
+            node._markFresh(changed=False)
+
+        return result
+
+    def _casts(self, tree, fused, values):
+        """Types to cast the result of each fused node to, in the order
+        of `fused`, or `None` if the operators already give the types
+        NumPy would
+        """
+        return None
+
+    @staticmethod
+    def _source(tree, fused, nleaves, casts=None):
+        """Generate the Python source of the fused function
+
+        Returns
+        -------
+        source : str
+            Definition of a function `_kernel` of the leaf values
+        globals : dict
+            The operators, and the types in `casts`, referred to by
+            `source`
+        """
+        ops = {}
+
+        def expression(node):
+            if isinstance(node, int):
+                return "x%d" % node
+            index = len(ops) // (1 if casts is None else 2)
+            name = "op%d" % index
+            ops[name] = fused[index].op
+            if casts is not None:
+                ops["cast%d" % index] = casts[index].type
+            call = "%s(%s)" % (name, ", ".join(expression(child) for child in node[1]))
+            if casts is None:
+                return call
+            else:
+                return "cast%d(%s)" % (index, call)
+
+        args = ", ".join("x%d" % i for i in range(nleaves))
+        source = "def _kernel(%s):\n    return %s\n" % (args, expression(tree))
+
+        return source, ops
+
+    def _compile(self, definition):
+        raise NotImplementedError
+
+class _NumpyKernelBackend(_KernelBackend):
+    """Evaluate fused trees with plain NumPy operations
+    """
+    name = "numpy"
+
+    def _compile(self, definition):
+        source, ops = definition
+        namespace = dict(ops)
+        exec(source, namespace)
+        return namespace["_kernel"]
+
+class _NumbaKernelBackend(_KernelBackend):
+    """Compile fused trees into a single loop with :func:`numba.vectorize`
+    """
+    name = "numba"
+
+    def __init__(self):
+        import numba
+        self._numba = numba
+        super(_NumbaKernelBackend, self).__init__()
+
+    def _casts(self, tree, fused, values):
+        """Result types of each fused node under NumPy's rules
+
+        Compiled operators follow Python's rules instead, e.g., `True +
+        True` is `2`, where NumPy gives `True`.  The types are found by
+        applying the tree to one element of each leaf.
+        """
+        samples = []
+        for value in values:
+            if isinstance(value, numerix.ndarray):
+                if value.ndim == 0:
+                    value = value[()]
+                elif value.size > 0:
+                    value = value.reshape(-1)[:1]
+                else:
+                    value = numerix.ones(1, dtype=value.dtype)
+            samples.append(value)
+
+        types = []
+
+        def evaluate(node):
+            if isinstance(node, int):
+                return samples[node]
+            index = len(types)
+            types.append(None)
+            args = [evaluate(child) for child in node[1]]
+            result = numerix.asarray(fused[index].op(*args))
+            types[index] = result.dtype
+            return result
+
+        with numerix.errstate(all='ignore'):
+            evaluate(tree)
+
+        return tuple(types)
+
+    def _compile(self, definition):
+        source, ops = definition
+        namespace = {}
+        for name, op in ops.items():
+            if not (isinstance(op, numerix.ufunc) or name.startswith("cast")):
+                op = self._numba.njit(op, error_model="numpy")
+            namespace[name] = op
+        exec(source, namespace)
+        return self._numba.vectorize(nopython=True)(namespace["_kernel"])
+
+_backends = {
+    "numpy": _NumpyKernelBackend,
+    "numba": _NumbaKernelBackend
+}
+
+def _parseKernel():
+    name = parser.parse("--kernel", action="store", type="string", default=None)
+    if name is None:
+        name = os.environ.get("FIPY_KERNEL", None)
+    if not name and inline.doInline:
+        name = "numba"
+    if not name:
+        # an empty `FIPY_KERNEL` selects the default
+        return None
+    return name.lower()
+
+def _getBackend(name):
+    """Instantiate the kernel backend called `name`
+
+    Falls back to the ``numpy`` backend if the requested backend
+    cannot be imported.
+
+        >>> print(_getBackend(None))
+        None
+        >>> print(_getBackend("numpy").name)
+        numpy
+        >>> _getBackend("fortran")
+        Traceback (most recent call last):
+            ...
+        ValueError: Unknown kernel backend: fortran
+    """
+    if name is None:
+        return None
+    elif name not in _backends:
+        raise ValueError("Unknown kernel backend: %s" % name)
+
+    try:
+        return _backends[name]()
+    except ImportError:
+        return _NumpyKernelBackend()
+
+backend = _getBackend(_parseKernel())
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -0,0 +1,133 @@
+"""Counter-based random numbers
+
+A counter-based generator computes each random number directly from a
+`counter` and a `key`, without any state that must be advanced from one
+number to the next.  Random numbers for any subset of a set of
+counters, such as the cells held by one processor, can therefore be
+drawn independently, and the result does not depend on how the set was
+divided up.
+
+This module implements the Philox4x32-10 generator of
+
+    John K. Salmon, Mark A. Moraes, Ron O. Dror and David E. Shaw,
+    "Parallel Random Numbers: As Easy as 1, 2, 3", Proceedings of the
+    International Conference for High Performance Computing, Networking,
+    Storage and Analysis (SC11), 2011.
+
+with NumPy operations on arrays of counters.  Its output matches the
+known-answer tests of the Random123 library
+
+    >>> def show(counter, key):
+    ...     counter = numerix.array(counter, dtype=numerix.uint64)[:, numerix.newaxis]
+    ...     key = numerix.array(key, dtype=numerix.uint64)[:, numerix.newaxis]
+    ...     return " ".join("%08x" % word for word in _philox4x32(counter, key)[:, 0])
+    >>> print(show((0, 0, 0, 0), (0, 0)))
+    6627e8d5 e169c58d bc57ac4c 9b00dbd8
+    >>> print(show((0xffffffff,) * 4, (0xffffffff,) * 2))
+    408f276d 41c83b0e a20bc7c6 6d5451fd
+    >>> print(show((0x243f6a88, 0x85a308d3, 0x13198a2e, 0x03707344),
+    ...            (0xa4093822, 0x299f31d0)))
+    d16cfe09 94fdcceb 5001e420 24126ea1
+
+The uniform random numbers drawn for an element do not depend on which
+other elements are drawn
+
+    >>> u = _uniform(seed=42, step=3, ids=numerix.arange(10))
+    >>> print(u.shape)
+    (2, 10)
+    >>> v = _uniform(seed=42, step=3, ids=numerix.array([7, 2]))
+    >>> print(numerix.allequal(v[..., 0], u[..., 7]))
+    True
+    >>> print((0 <= u).all() and (u < 1).all())
+    True
+
+but do depend on the seed and the step
+
+    >>> print(numerix.allequal(_uniform(seed=43, step=3, ids=numerix.arange(10)), u))
+    False
+    >>> print(numerix.allequal(_uniform(seed=42, step=4, ids=numerix.arange(10)), u))
+    False
+"""
+from __future__ import unicode_literals
+from builtins import range
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+from fipy.tools import numerix
+
+_MASK = numerix.uint64(0xffffffff)
+_M0 = numerix.uint64(0xD2511F53)
+_M1 = numerix.uint64(0xCD9E8D57)
+_W0 = numerix.uint64(0x9E3779B9)
+_W1 = numerix.uint64(0xBB67AE85)
+_SHIFT = numerix.uint64(32)
+
+def _philox4x32(counter, key, rounds=10):
+    """Philox4x32 of a (4, N) array of 32-bit `counter` words and a (2, N)
+    array of 32-bit `key` words, both held in `uint64` arrays
+
+    Returns
+    -------
+    ndarray
+        (4, N) array of random 32-bit words, held in `uint64`.
+    """
+    c0, c1, c2, c3 = [numerix.array(c, dtype=numerix.uint64) & _MASK for c in counter]
+    k0, k1 = [numerix.array(k, dtype=numerix.uint64) & _MASK for k in key]
+
+    for i in range(rounds):
+        if i > 0:
+            k0 = (k0 + _W0) & _MASK
+            k1 = (k1 + _W1) & _MASK
+        p0 = _M0 * c0
+        p1 = _M1 * c2
+        c0, c1, c2, c3 = ((p1 >> _SHIFT) ^ c1 ^ k0,
+                          p1 & _MASK,
+                          (p0 >> _SHIFT) ^ c3 ^ k1,
+                          p0 & _MASK)
+
+    return numerix.array((c0, c1, c2, c3))
+
+def _uniform(seed, step, ids):
+    """Two uniform random numbers in [0, 1) for each of `ids` at `step`
+
+    The counter of each element is its id and the `step`, and the key is
+    the `seed`, so the same `seed`, `step` and id always give the same
+    numbers.
+
+    Parameters
+    ----------
+    seed : int
+        Non-negative integer of up to 64 bits.
+    step : int
+        Non-negative integer of up to 32 bits, e.g., the number of times
+        the numbers have been redrawn.
+    ids : array_like of int
+        Non-negative integers of up to 64 bits identifying the elements,
+        e.g., global cell IDs.
+
+    Returns
+    -------
+    ndarray
+        (2, N) array of doubles.
+    """
+    ids = numerix.asarray(ids).astype(numerix.uint64)
+    zeros = numerix.zeros(ids.shape, dtype=numerix.uint64)
+    seed = numerix.uint64(seed)
+
+    words = _philox4x32(counter=(ids & _MASK, ids >> _SHIFT,
+                                 zeros + numerix.uint64(step), zeros),
+                        key=(zeros + (seed & _MASK), zeros + (seed >> _SHIFT)))
+
+    # 53 random bits from each pair of words
+    high = (words[0::2] >> numerix.uint64(5)).astype(float)
+    low = (words[1::2] >> numerix.uint64(6)).astype(float)
+
+    return (high * 67108864. + low) / 9007199254740992.
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -0,0 +1,81 @@
+"""Nearest-neighbor queries against a fixed set of points
+
+:func:`~fipy.tools.numerix.nearest` compares every point with every
+datum, which takes time proportional to their product.  A
+`_SpatialIndex` builds a KD-tree of the data once, with
+:class:`scipy.spatial.cKDTree`, and then answers each query in
+logarithmic time.  If :mod:`scipy` cannot be imported, the index falls
+back to :func:`~fipy.tools.numerix.nearest`.
+
+    >>> from fipy import Grid2D
+    >>> m0 = Grid2D(dx=(.1, 1., 10.), dy=(.1, 1., 10.))
+    >>> m1 = Grid2D(nx=2, ny=2, dx=5., dy=5.)
+    >>> index = _SpatialIndex(m0.cellCenters.globalValue)
+    >>> print(index.nearest(m1.cellCenters.globalValue))
+    [4 5 7 8]
+
+As with :func:`~fipy.tools.numerix.nearest`, a point that is equally
+close to several data is assigned to the first of them
+
+    >>> m = Grid2D(nx=3, ny=3)
+    >>> index = _SpatialIndex(m.cellCenters.globalValue)
+    >>> print(index.nearest(((0., 1., 1., 3.), (0., 1., 2., 3.))))
+    [0 0 3 8]
+    >>> print(numerix.nearest(m.cellCenters.globalValue,
+    ...                       ((0., 1., 1., 3.), (0., 1., 2., 3.))))
+    [0 0 3 8]
+
+A single point gives a single index
+
+    >>> print(index.nearest((2.9, 0.1)))
+    2
+"""
+from __future__ import unicode_literals
+from builtins import object
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+from fipy.tools import numerix
+
+class _SpatialIndex(object):
+    """KD-tree of a (D, N) array of `data`
+    """
+    def __init__(self, data):
+        self.data = data
+        self.tree = None
+
+        if isinstance(data, numerix.ndarray) and data.shape[-1] > 0:
+            try:
+                from scipy.spatial import cKDTree
+            except ImportError:
+                pass
+            else:
+                self.tree = cKDTree(data.swapaxes(0, 1))
+
+    def nearest(self, points):
+        """Indices of the data closest to (D, M) `points`
+        """
+        if self.tree is None:
+            return numerix.nearest(data=self.data, points=points)
+
+        points = numerix.asarray(points, dtype=float).swapaxes(0, -1)
+        D, N = self.data.shape
+
+        # examine enough neighbors to find every datum that is exactly as
+        # close as the nearest one, e.g., the cells around a vertex of a grid
+        k = min(N, 2**D)
+        distances, indices = self.tree.query(points, k=k)
+        if k == 1:
+            return indices
+
+        # break ties in favor of the lowest index
+        tied = distances <= distances[..., :1] * (1 + 1e-12)
+        return numerix.where(tied, indices, N).min(axis=-1)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -8,6 +8,10 @@ def _suite():
     theSuite = _LateImportDocTestSuite(docTestModuleNames = (
             'dimensions.physicalField',
             'numerix',
+            'kernel',
+            'unitResolution',
+            'spatialIndex',
+            'philox',
             'dump',
             'vector',
             'sharedtempfile'
@@ -0,0 +1,343 @@
+"""Evaluation of dimensional `_OperatorVariable` trees on raw arrays
+
+Each node of an expression like ``(a + b) * c / d``, where the leaves
+carry units, normally computes a
+:class:`~fipy.tools.dimensions.physicalField.PhysicalField`, checking
+and converting units as it goes, every time the expression is
+evaluated.  When the units of a model never change, this work only
+needs to be done once.
+
+With the ``--resolve-units`` command line flag (or the
+`FIPY_RESOLVE_UNITS` environment variable), each tree is instead
+evaluated on the magnitudes of its leaves in SI base units, with
+element-wise operations whose results do not depend on the scale of
+their arguments (arithmetic, comparisons, powers and functions of
+dimensionless arguments) evaluated directly on NumPy arrays.  The unit
+of the result, and the scale factor that takes the magnitude back to
+that unit, are resolved on the first evaluation, which is also checked
+against the normal evaluation.  The tree is evaluated normally if that
+check fails, if an operation is not known to be scale-independent, or
+if a leaf has a unit with an offset, such as ``degC``.
+
+    >>> from fipy import Grid1D, CellVariable
+    >>> m = Grid1D(nx=3)
+    >>> a = CellVariable(mesh=m, value=(1., 2., 3.), unit="m")
+    >>> b = CellVariable(mesh=m, value=50., unit="cm")
+    >>> t = CellVariable(mesh=m, value=2., unit="s")
+    >>> expr = (a + b) ** 2 / t - numerix.sqrt(a * b) * a / t
+    >>> print(expr._calcValue_())
+    [ 0.77144661  2.125       4.28788269] m**2/s
+
+    >>> resolved = _ResolvedUnits()
+    >>> print(resolved(expr))
+    [ 0.77144661  2.125       4.28788269] m**2/s
+    >>> print(expr._unitResolution)
+    <PhysicalUnit m**2/s>
+
+Later evaluations, even of different values, reuse the resolved unit
+
+    >>> a.value = (4., 5., 6.)
+    >>> print(numerix.allclose(resolved(expr).value, expr._calcValue_().value))
+    True
+
+Dimensionless results, including results of comparisons, are plain
+arrays, as they would be otherwise
+
+    >>> print(resolved(a / b))
+    [  8.  10.  12.]
+    >>> print(resolved(numerix.sin(b / a) > 0.1))
+    [ True False False]
+
+Intermediate values held by the operator cache (see
+:mod:`fipy.variables.operatorCache`) are recomputed as part of the tree,
+and released
+
+    >>> from fipy.variables.operatorCache import cacheOperators
+    >>> cache = cacheOperators(budget=1)
+    >>> ratio = b / a
+    >>> print(ratio.value)
+    [ 0.125       0.1         0.08333333]
+    >>> print(cache._holds(ratio))
+    True
+    >>> print(resolved(numerix.sin(ratio) > 0.1))
+    [ True False False]
+    >>> print(cache._holds(ratio))
+    False
+    >>> print(cacheOperators(budget=0))
+    None
+
+Operations that depend on the scale of their arguments are left to the
+normal evaluation
+
+    >>> expr = numerix.floor(b)
+    >>> print(resolved(expr))
+    None
+    >>> print(expr._unitResolution)
+    False
+"""
+from __future__ import unicode_literals
+from builtins import object
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+import os
+
+from fipy.tools import numerix
+from fipy.tools import parser
+from fipy.tools.dimensions import physicalField
+
+# operations whose results, in SI base units, do not depend on the units
+# of their arguments; functions of dimensionless arguments qualify, as
+# their arguments reduce to pure numbers
+_scaleFree = frozenset([
+    "add", "subtract", "multiply", "divide", "true_divide",
+    "negative", "positive", "absolute", "fabs", "sqrt", "square", "power",
+    "less", "less_equal", "greater", "greater_equal", "equal", "not_equal",
+    "maximum", "minimum", "hypot", "arctan2",
+    "exp", "log", "log10", "sin", "cos", "tan", "arcsin", "arccos", "arctan",
+    "sinh", "cosh", "tanh", "arcsinh", "arccosh", "arctanh"
+])
+
+class _Unresolvable(Exception):
+    pass
+
+class _Tracer(object):
+    """Stand-in argument that records the operations applied to it
+    """
+    def __init__(self, ops):
+        self._ops = ops
+
+    def _record(name):
+        def method(self, *args):
+            self._ops.add(name)
+            return self
+        return method
+
+    __add__ = __radd__ = _record("add")
+    __sub__ = __rsub__ = _record("subtract")
+    __mul__ = __rmul__ = _record("multiply")
+    __truediv__ = __rtruediv__ = __div__ = __rdiv__ = _record("divide")
+    __pow__ = __rpow__ = _record("power")
+    __neg__ = _record("negative")
+    __pos__ = _record("positive")
+    __abs__ = _record("absolute")
+    __lt__ = _record("less")
+    __le__ = _record("less_equal")
+    __gt__ = _record("greater")
+    __ge__ = _record("greater_equal")
+    __eq__ = _record("equal")
+    __ne__ = _record("not_equal")
+
+    del _record
+
+    __hash__ = object.__hash__
+
+class _ResolvedUnits(object):
+    """Evaluate dimensional `_OperatorVariable` trees on raw arrays
+    """
+    def __init__(self):
+        self._scaleFreeOps = {}
+
+    def _isScaleFree(self, op, nargs):
+        """Whether the operator function `op` only applies operations in
+        `_scaleFree`
+        """
+        if isinstance(op, numerix.ufunc):
+            return op.__name__ in _scaleFree
+
+        from fipy.tools import kernel
+        key = kernel._opKey(op)
+        if key is None:
+            return False
+
+        if key not in self._scaleFreeOps:
+            ops = set()
+            try:
+                op(*[_Tracer(ops) for i in range(nargs)])
+                scaleFree = ops <= _scaleFree
+            except Exception:
+                scaleFree = False
+            self._scaleFreeOps[key] = scaleFree
+
+        return self._scaleFreeOps[key]
+
+    @staticmethod
+    def _isKept(node):
+        """Whether the value of the intermediate `node` must be kept
+
+        A value that the operator cache merely holds, see
+        :mod:`fipy.variables.operatorCache`, is not kept, as it could be
+        recomputed.  It is released when `node` is inlined.
+        """
+        return node._keepsValue() or len(node.constraints) > 0
+
+    def _isInlined(self, node, root=False):
+        """Whether `node` is evaluated as part of the tree, rather than as
+        a leaf
+        """
+        from fipy.variables.constant import _Constant
+        from fipy.variables.variable import Variable
+
+        # `_OperatorVariable` classes are made on demand for each base class
+        if not (hasattr(node, "op") and hasattr(node, "valueMattersForUnit")
+                and (root or not self._isKept(node))
+                and all(isinstance(v, Variable) for v in node.var)):
+            return False
+
+        for v, valueMatters in zip(node.var, node.valueMattersForUnit):
+            if valueMatters and not isinstance(v, _Constant):
+                # e.g., the unit of `a**b` depends on the value of `b`
+                return False
+
+        return self._isScaleFree(node.op, len(node.var))
+
+    def _plan(self, node, leaves, inlined, root=False):
+        """Structure of the tree rooted at `node`
+
+        Returns the index in `leaves` of a leaf or the operator and the
+        structure of the arguments of an evaluated node.  Each evaluated
+        intermediate node is recorded in `inlined`.
+        """
+        if not self._isInlined(node, root=root):
+            leaves.append(node)
+            return len(leaves) - 1
+
+        if not root:
+            inlined.append(node)
+
+        return (node.op, [self._plan(v, leaves, inlined) for v in node.var])
+
+    @staticmethod
+    def _evaluate(plan, magnitudes):
+        if isinstance(plan, int):
+            return magnitudes[plan]
+        else:
+            op, args = plan
+            return op(*[_ResolvedUnits._evaluate(arg, magnitudes) for arg in args])
+
+    @staticmethod
+    def _magnitudes(leaves):
+        """Values of `leaves` in SI base units, and their units
+        """
+        magnitudes = []
+        units = []
+        for leaf in leaves:
+            value = leaf.value
+            if isinstance(value, physicalField.PhysicalField):
+                unit = value.unit
+                if unit.offset != 0:
+                    raise _Unresolvable()
+                value = value.value
+                if unit.factor != 1:
+                    value = value * unit.factor
+            else:
+                unit = None
+
+            if isinstance(value, numerix.MA.MaskedArray):
+                raise _Unresolvable()
+
+            magnitudes.append(value)
+            units.append(unit)
+
+        return magnitudes, units
+
+    @staticmethod
+    def _resolve(expected, magnitude):
+        """Unit of the normal evaluation `expected`, if `magnitude`
+        agrees with it, and `False` otherwise
+        """
+        if isinstance(expected, physicalField.PhysicalField):
+            unit = expected.unit
+            expected = expected.value
+            magnitude = magnitude / unit.factor
+        else:
+            unit = None
+
+        expected = numerix.asarray(expected)
+        magnitude = numerix.asarray(magnitude)
+        if expected.shape != magnitude.shape:
+            return False
+        elif expected.dtype == bool or magnitude.dtype == bool:
+            return unit if numerix.array_equal(expected, magnitude) else False
+
+        difference = abs(expected - magnitude)
+        tolerance = 1e-10 * max(abs(expected).max(initial=0.),
+                                abs(magnitude).max(initial=0.))
+        agree = ((difference <= tolerance)
+                 | (numerix.isnan(expected) & numerix.isnan(magnitude)))
+        return unit if agree.all() else False
+
+    def __call__(self, var):
+        """Evaluate the expression tree rooted at `var`
+
+        Returns `None` if the tree cannot be evaluated this way, in which
+        case `var` should be evaluated normally.
+        """
+        resolution = getattr(var, "_unitResolution", None)
+        if resolution is False:
+            return None
+
+        plan = getattr(var, "_unitResolutionPlan", None)
+        if plan is not None and any(self._isKept(node) for node in plan[2]):
+            # an intermediate result must now be kept
+            plan = None
+
+        if plan is None:
+            if not self._isInlined(var, root=True):
+                var._unitResolution = False
+                return None
+            leaves = []
+            inlined = []
+            plan = (self._plan(var, leaves, inlined, root=True), leaves, inlined)
+            var._unitResolutionPlan = plan
+
+        tree, leaves, inlined = plan
+
+        try:
+            magnitudes, units = self._magnitudes(leaves)
+        except _Unresolvable:
+            var._unitResolution = False
+            return None
+
+        if all(unit is None for unit in units):
+            # nothing to resolve
+            var._unitResolution = False
+            return None
+
+        magnitude = self._evaluate(tree, magnitudes)
+
+        if resolution is None or units != var._unitResolutionLeaves:
+            resolution = self._resolve(var._calcValue_(), magnitude)
+            var._unitResolution = resolution
+            var._unitResolutionLeaves = units
+            if resolution is False:
+                return None
+
+        # as for fused kernels, the intermediate nodes are no longer
+        # stale, but hold no value
+        from fipy.variables import operatorCache
+        for node in reversed(inlined):
+            if operatorCache._cache is not None:
+                operatorCache._cache._release(node)
+            node._value = None
+            node._markFresh(changed=False)
+
+        if resolution is None:
+            return magnitude
+        else:
+            return physicalField.PhysicalField(value=magnitude / resolution.factor,
+                                               unit=resolution)
+
+def _parseResolveUnits():
+    return (parser.parse("--resolve-units", action="store_true", default=False)
+            or "FIPY_RESOLVE_UNITS" in os.environ)
+
+resolver = _ResolvedUnits() if _parseResolveUnits() else None
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
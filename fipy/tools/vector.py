@@ -3,62 +3,132 @@
 from __future__ import unicode_literals
 
 from builtins import range
-from builtins import zip
-from fipy.tools import inline, numerix
+from fipy.tools import numerix
 
 __all__ = ["putAdd", "prune"]
 from future.utils import text_to_native_str
 __all__ = [text_to_native_str(n) for n in __all__]
 
+def _scatterAdd(vector, ids, values):
+    """Add `values` to the elements `ids` of the flattened `vector`,
+    accumulating repeated `ids`
+    """
+    ids = numerix.asarray(ids, dtype=numerix.INT_DTYPE)
+    # negative indices count from the end, as for `vector.flat[id]`
+    ids = numerix.where(ids < 0, ids + vector.size, ids)
+
+    if vector.dtype.kind == 'f' and values.dtype.kind in 'biuf':
+        # `bincount` is much faster than `add.at`, but only sums doubles
+        increment = numerix.bincount(ids, weights=values, minlength=vector.size)
+        vector += increment.reshape(vector.shape).astype(vector.dtype)
+    else:
+        if not numerix.can_cast(values.dtype, vector.dtype, casting='same_kind'):
+            # `add.at` refuses, e.g., to add floats to integers, which
+            # `vector.flat[id] += value` truncated
+            values = values.astype(vector.dtype)
+        flat = vector.ravel()
+        numerix.add.at(flat, ids, values)
+        if not numerix.may_share_memory(flat, vector):
+            vector[...] = flat.reshape(vector.shape)
+
+def _putAddFlat(vector, ids, additionVector, mask=None):
+    """`vector.flat[id] += value` for each `id` and `value`, unless `masked`
+    """
+    ids = numerix.MA.filled(ids, 0).ravel()
+    values = numerix.asarray(additionVector).ravel()
+    if mask is None:
+        n = min(len(ids), len(values))
+        ids, values = ids[:n], values[:n]
+    else:
+        mask = numerix.asarray(mask).ravel()
+        n = min(len(ids), len(values), len(mask))
+        keep = ~mask[:n].astype(bool)
+        ids, values = ids[:n][keep], values[:n][keep]
+
+    _scatterAdd(vector, ids, values)
+
 # Factored out for fipy.variables.surfactantConvectionVariable._ConvectionCoeff
 # for some reason
 def _putAdd(vector, ids, additionVector, mask=False):
     """This is a temporary replacement for `Numeric.put` as it was not doing
     what we thought it was doing.
+
+    Repeated `ids` accumulate
+
+        >>> v = numerix.zeros(4)
+        >>> _putAdd(v, numerix.array([0, 2, 2, 3, 0]), [1., 2., 3., 4., 5.])
+        >>> print(v)
+        [ 6.  0.  5.  4.]
+
+    elements of a `mask` that are true are skipped
+
+        >>> v = numerix.zeros(4)
+        >>> _putAdd(v, numerix.array([0, 2, 2, 3, 0]), [1., 2., 3., 4., 5.],
+        ...         mask=numerix.array([0, 1, 0, 0, 1], dtype=bool))
+        >>> print(v)
+        [ 1.  0.  3.  4.]
+
+    and each component of a `vector` with more dimensions than the
+    `ids` receives the corresponding component of `additionVector`
+
+        >>> v = numerix.zeros((2, 3))
+        >>> _putAdd(v, numerix.array([[0, 2], [0, 1]]),
+        ...         [[[1., 2.], [3., 4.]], [[5., 6.], [7., 8.]]])
+        >>> print(v)
+        [[  4.   4.   2.]
+         [ 12.   8.   6.]]
+
+    The result is the same as that of adding one element at a time
+
+        >>> def loopPutAdd(vector, ids, additionVector, mask):
+        ...     for j in range(vector.shape[0]):
+        ...         values = additionVector[j].flat
+        ...         for id, value, masked in zip(ids.flat, values, mask.flat):
+        ...             if not masked:
+        ...                 vector[j].flat[id] += value
+        >>> ids = numerix.random.randint(0, 50, size=(40, 6))
+        >>> additionVector = numerix.random.random((3, 40, 6))
+        >>> mask = numerix.random.random((40, 6)) > 0.7
+        >>> v1 = numerix.random.random((3, 50))
+        >>> v2 = v1.copy()
+        >>> _putAdd(v1, ids, additionVector, mask=mask)
+        >>> loopPutAdd(v2, ids, additionVector, mask=mask)
+        >>> print(numerix.allclose(v1, v2, rtol=1e-13, atol=1e-13))
+        True
+
+    including for integer and non-contiguous vectors
+
+        >>> v = numerix.zeros((3, 4), dtype=int)[:, 1]
+        >>> _putAdd(v, numerix.array([2, 0, 2, -1]), numerix.array([1, 2, 3, 4]))
+        >>> print(v)
+        [2 0 8]
+
+    Values are cast to the type of `vector`, so floats added to an integer
+    `vector` are truncated
+
+        >>> v = numerix.zeros(3, dtype=int)
+        >>> _putAdd(v, numerix.array([0, 0, 1]), numerix.array([1.7, 1.7, 2.5]))
+        >>> print(v)
+        [2 2 0]
     """
     additionVector = numerix.array(additionVector)
 
     if numerix.sometrue(mask):
-        if len(vector.shape) < len(additionVector.shape):
-            for j in range(vector.shape[0]):
-                for id, value, masked in zip(ids.flat, additionVector[j].flat, mask.flat):
-                    if not masked:
-                        vector[j].flat[id] += value
-        else:
-            for id, value, masked in zip(ids.flat, additionVector.flat, mask.flat):
-                if not masked:
-                    vector.flat[id] += value
+        mask = numerix.asarray(mask)
+    else:
+        mask = None
 
+    if len(vector.shape) < len(additionVector.shape):
+        for j in range(vector.shape[0]):
+            _putAddFlat(vector[j], ids, additionVector[j], mask=mask)
     else:
-        if len(vector.shape) < len(additionVector.shape):
-            for j in range(vector.shape[0]):
-                for id, value in zip(ids.flat, additionVector[j].flat):
-                    vector[j].flat[id] += value
-        else:
-            for id, value in zip(ids.flat, additionVector.flat):
-                vector.flat[id] += value
-
-if inline.doInline:
-    ## FIXME: inline version doesn't account for all of the conditions that Python
-    ## version does.
-    def putAdd(vector, ids, additionVector):
-        """ This is a temporary replacement for `Numeric.put` as it was not doing
-        what we thought it was doing.
-        """
-        inline._runInline("""
-                              int ID = ids[i];
-                              vector[ID] += additionVector[i];
-                          """,
-                          vector=vector,
-                          ids=ids,
-                          additionVector=numerix.array(additionVector),
-        ni = len(ids.flat))
-else:
-    def putAdd(vector, ids, additionVector):
-        """ This is a temporary replacement for `Numeric.put` as it was not doing
-        what we thought it was doing.
-        """
-        _putAdd(vector, ids, additionVector)
+        _putAddFlat(vector, ids, additionVector, mask=mask)
+
+def putAdd(vector, ids, additionVector):
+    """ This is a temporary replacement for `Numeric.put` as it was not doing
+    what we thought it was doing.
+    """
+    _putAdd(vector, ids, additionVector)
 
 def prune(array, shift, start=0, axis=0):
     """
@@ -82,7 +82,7 @@ class BetaNoiseVariable(NoiseVariable):
       :alt: histogram of random values with a beta distribution
 
     """
-    def __init__(self, mesh, alpha, beta, name = '', hasOld = 0):
+    def __init__(self, mesh, alpha, beta, name = '', hasOld = 0, seed = None):
         r"""
         Parameters
         ----------
@@ -92,8 +92,13 @@ class BetaNoiseVariable(NoiseVariable):
             The parameter :math:`\alpha`.
         beta : float
             The parameter :math:`\beta`.
+        seed : int, optional
+            If given, draw the noise from a counter-based generator with
+            this key.  Requires :mod:`scipy`.
+            See :class:`~fipy.variables.noiseVariable.NoiseVariable`.
         """
-        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld,
+                               seed = seed)
         self.alpha = self._requires(alpha)
         self.beta = self._requires(beta)
 
@@ -101,6 +106,11 @@ class BetaNoiseVariable(NoiseVariable):
         return random.beta(a = self.alpha, b = self.beta,
                            size = [self.mesh.globalNumberOfCells])
 
+    def _counterRandom(self, uniform):
+        from scipy.special import betaincinv
+
+        return betaincinv(self.alpha.value, self.beta.value, uniform[0])
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
@@ -58,12 +58,11 @@ def _BinaryOperatorVariable(operatorClass=None):
             else:
                 return self._unit
 
-        def _getRepresentation(self, style="__repr__", argDict={}, id=id, freshen=False):
-            self.id = id
+        def _getRepresentation(self, style="__repr__"):
             if (style == "__repr__") and hasattr(self, '_name') and len(self._name) > 0:
                 return self._name
             else:
-                return "(" + operatorClass._getRepresentation(self, style=style, argDict=argDict, id=id, freshen=freshen) + ")"
+                return "(" + operatorClass._getRepresentation(self, style=style) + ")"
 
     return binOp
 
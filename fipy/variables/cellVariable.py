@@ -40,6 +40,9 @@ class CellVariable(_MeshVariable):
         else:
             self._old = None
 
+    # as in `mesh._globalNonOverlappingCellIDs`
+    _element = "Cell"
+
     @property
     def _variableClass(self):
         return CellVariable
@@ -127,18 +130,19 @@ class CellVariable(_MeshVariable):
         When running on a single processor, the result is identical to
         :attr:`~fipy.variables.variable.Variable.value`.
         """
-        return self._getGlobalValue(self.mesh._localNonOverlappingCellIDs,
-                                    self.mesh._globalNonOverlappingCellIDs)
+        return self._getGlobalValue()
 
     def setValue(self, value, unit = None, where = None):
         _MeshVariable.setValue(self, value=self._globalToLocalValue(value), unit=unit, where=where)
 
     def __call__(self, points=None, order=0, nearestCellIDs=None):
         r"""
-        Interpolates the `CellVariable` to a set of points using a
-        method that has a memory requirement on the order of `Ncells` by
-        `Npoints` in general, but uses only `Ncells` when the
-        `CellVariable`'s mesh is a `UniformGrid` object.
+        Interpolates the `CellVariable` to a set of points.  The nearest
+        cells are found with a KD-tree of the cell centers, built on the
+        first call, so each call takes a time on the order of `Npoints`
+        log `Ncells` (only `Npoints` when the `CellVariable`'s mesh is a
+        `UniformGrid` object).  Without :mod:`scipy`, the memory
+        requirement is on the order of `Ncells` by `Npoints`.
 
         Tests
 
@@ -257,6 +261,10 @@ class CellVariable(_MeshVariable):
            \vec{n}_{AP} \cdot \nabla \phi - d_{AP} \left( \vec{n}_{AP} \cdot
            \nabla \phi \right)_{AP} \right)^2 }
 
+        The inverse of the matrix on the left only depends on the mesh and
+        can be kept, see
+        :meth:`~fipy.meshes.abstractMesh.AbstractMesh.cacheLeastSquaresGrad`.
+
         Tests
 
         >>> from fipy import Grid2D
@@ -270,6 +278,25 @@ class CellVariable(_MeshVariable):
         >>> print(numerix.allclose(CellVariable(mesh=Grid1D(dx=(2.0, 1.0, 0.5)),
         ...                                     value=(0, 1, 2)).leastSquaresGrad.globalValue, [[0.461538461538, 0.8, 1.2]]))
         True
+
+        The gradient of a linear field is exact in the interior of a 3D
+        mesh
+
+        >>> from fipy import Grid3D
+        >>> m = Grid3D(nx=3, ny=3, nz=3, dx=0.5, dy=2.0, dz=1.0)
+        >>> x, y, z = m.cellCenters
+        >>> grad = CellVariable(mesh=m, value=x - 2 * y + 3 * z).leastSquaresGrad
+        >>> print(numerix.allclose(grad.globalValue[..., 13], [1., -2., 3.]))
+        True
+
+        as is the gradient in the triangles of a mixed mesh
+
+        >>> from fipy import Tri2D
+        >>> m = Grid2D(nx=2, ny=2) + (Tri2D(nx=2, ny=2) + ((2,), (0,)))
+        >>> x, y = m.cellCenters
+        >>> grad = CellVariable(mesh=m, value=2 * x + 3 * y).leastSquaresGrad
+        >>> print(numerix.allclose(grad.globalValue[..., 12:16], [[2.], [3.]]))
+        True
         """
 
         if not hasattr(self, '_leastSquaresGrad'):
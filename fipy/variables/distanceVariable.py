@@ -248,16 +248,35 @@ class DistanceVariable(CellVariable):
     def _calcValue(self):
         return self._value
 
-    def extendVariable(self, extensionVariable, order=2):
+    def extendVariable(self, extensionVariable, order=2, narrowBand=None):
         """
 
         Calculates the extension of `extensionVariable` from the zero
         level set.
 
+        With a `narrowBand`, only the cells in the band are extended
+
+        >>> from fipy.meshes import Grid1D
+        >>> mesh = Grid1D(dx=0.1, nx=20)
+        >>> x = mesh.cellCenters[0]
+        >>> var = DistanceVariable(mesh=mesh, value=x - 0.52)
+        >>> extension = CellVariable(mesh=mesh, value=x**2)
+        >>> var.extendVariable(extension, narrowBand=2.5) # doctest: +LSM
+        >>> print(numerix.allclose(extension[3:8], 0.3025)) # doctest: +LSM
+        True
+        >>> print(numerix.allclose(extension[8:], x[8:]**2)) # doctest: +LSM
+        True
+
         Parameters
         ----------
         extensionVariable : ~fipy.variables.cellVariable.CellVariable
             The variable to extend from the zero level set.
+        order : {`1`, `2`}
+            The order of accuracy of the extension
+        narrowBand : float, optional
+            If not `None`, the half width, in cells, of the band about the
+            zero level set to extend into.  Values outside the band are
+            left as they are.
         """
 
         dx, shape = self.getLSMshape()
@@ -271,8 +290,19 @@ class DistanceVariable(CellVariable):
         else:
             raise Exception("Neither `lsmlib` nor `skfmm` can be found on the $PATH")
 
-        tmp, extensionValue = extension_velocities(phi, extensionValue, ext_mask=phi < 0., dx=dx, order=order)
-        extensionVariable[:] = extensionValue.flatten()
+        if narrowBand is None:
+            tmp, extensionValue = extension_velocities(phi, extensionValue,
+                                                       ext_mask=phi < 0., dx=dx,
+                                                       order=order)
+            extensionVariable[:] = extensionValue.flatten()
+        else:
+            width = self._bandWidth(dx, narrowBand)
+            tmp, extended = extension_velocities(phi, extensionValue,
+                                                 ext_mask=phi < 0., dx=dx, order=order,
+                                                 **self._narrowArgs(width))
+            inBand = self._inBand(tmp, width)
+            extended = numerix.where(inBand, MA.getdata(extended), extensionValue)
+            extensionVariable[:] = extended.flatten()
 
     def getLSMshape(self):
         mesh = self.mesh
@@ -290,14 +320,41 @@ class DistanceVariable(CellVariable):
 
         return dx, shape
 
-    def calcDistanceFunction(self, order=2):
+    def calcDistanceFunction(self, order=2, narrowBand=None):
         """
         Calculates the `distanceVariable` as a distance function.
 
+        Level-set methods only need the distance near the zero level set.
+        With a `narrowBand`, distances are only calculated in a band of
+        that many cells on either side, and cells farther away are set to
+        the distance to the edge of the band
+
+        >>> from fipy.meshes import Grid1D
+        >>> mesh = Grid1D(dx=0.1, nx=20)
+        >>> var = DistanceVariable(mesh=mesh, value=mesh.cellCenters[0] - 0.52)
+        >>> var.calcDistanceFunction(narrowBand=2.5) # doctest: +LSM
+        >>> print(var.narrowBandIDs) # doctest: +LSM
+        [3 4 5 6 7]
+        >>> expected = (-0.25, -0.17, -0.07, 0.03, 0.13, 0.23, 0.25)
+        >>> print(numerix.allclose(var[2:9], expected)) # doctest: +LSM
+        True
+        >>> print(numerix.allclose(var[:3], -0.25)
+        ...       and numerix.allclose(var[8:], 0.25)) # doctest: +LSM
+        True
+
+        Without a band, every cell is in it
+
+        >>> var.calcDistanceFunction() # doctest: +LSM
+        >>> print(len(var.narrowBandIDs)) # doctest: +LSM
+        20
+
         Parameters
         ----------
         order : {`1`, `2`}
             The order of accuracy for the distance function calculation
+        narrowBand : float, optional
+            If not `None`, the half width, in cells, of the band about the
+            zero level set to calculate distances in.
         """
 
         dx, shape = self.getLSMshape()
@@ -309,9 +366,57 @@ class DistanceVariable(CellVariable):
         else:
             raise Exception("Neither `lsmlib` nor `skfmm` can be found on the $PATH")
 
-        self._value = distance(numerix.reshape(self._value, shape), dx=dx, order=order).flatten()
+        phi = numerix.reshape(self._value, shape)
+
+        if narrowBand is None:
+            self._value = distance(phi, dx=dx, order=order).flatten()
+            self._narrowBandIDs = None
+        else:
+            width = self._bandWidth(dx, narrowBand)
+            tmp = distance(phi, dx=dx, order=order, **self._narrowArgs(width))
+            inBand = self._inBand(tmp, width)
+            self._value = numerix.where(inBand,
+                                        MA.getdata(tmp),
+                                        numerix.where(phi < 0, -width, width)).flatten()
+            self._narrowBandIDs = numerix.nonzero(inBand.flatten())[0]
+
         self._markFresh()
 
+    @property
+    def narrowBandIDs(self):
+        """IDs of the cells in the narrow band of the last call to
+        `calcDistanceFunction`, or of all cells, if it had no band
+        """
+        if getattr(self, "_narrowBandIDs", None) is None:
+            return numerix.arange(self.mesh.numberOfCells)
+        else:
+            return self._narrowBandIDs
+
+    @staticmethod
+    def _bandWidth(dx, narrowBand):
+        """Half width of a band `narrowBand` cells wide
+        """
+        return narrowBand * max(dx)
+
+    @staticmethod
+    def _narrowArgs(width):
+        """Arguments to restrict fast marching to a band of `width`
+
+        `lsmlib` has no narrow band, so it marches over all cells.
+        """
+        if LSM_SOLVER == 'skfmm':
+            return dict(narrow=width)
+        else:
+            return dict()
+
+    @staticmethod
+    def _inBand(distance, width):
+        """Whether each element of `distance`, as returned by fast
+        marching, lies in a band of `width`
+        """
+        return (~MA.getmaskarray(distance)
+                & (abs(numerix.asarray(MA.getdata(distance))) <= width))
+
     @property
     def cellInterfaceAreas(self):
         """
@@ -4,7 +4,7 @@ from __future__ import unicode_literals
 
 __docformat__ = 'restructuredtext'
 
-from fipy.tools.numerix import random
+from fipy.tools.numerix import random, log
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["ExponentialNoiseVariable"]
@@ -76,7 +76,7 @@ class ExponentialNoiseVariable(NoiseVariable):
       :alt: histogram of random values with an exponential distribution
 
     """
-    def __init__(self, mesh, mean=0.0, name = '', hasOld = 0):
+    def __init__(self, mesh, mean=0.0, name = '', hasOld = 0, seed = None):
         r"""
         Parameters
         ----------
@@ -84,14 +84,21 @@ class ExponentialNoiseVariable(NoiseVariable):
             The mesh on which to define the noise.
         mean : float
             The mean of the distribution :math:`\mu`.
+        seed : int, optional
+            If given, draw the noise from a counter-based generator with
+            this key.  See :class:`~fipy.variables.noiseVariable.NoiseVariable`.
         """
-        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld,
+                               seed = seed)
         self.mean = self._requires(mean)
 
     def random(self):
         return random.exponential(scale = self.mean,
                                   size = [self.mesh.globalNumberOfCells])
 
+    def _counterRandom(self, uniform):
+        return -self.mean.value * log(1 - uniform[0])
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
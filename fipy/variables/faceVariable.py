@@ -7,6 +7,9 @@ from future.utils import text_to_native_str
 __all__ = [text_to_native_str(n) for n in __all__]
 
 class FaceVariable(_MeshVariable):
+    # as in `mesh._globalNonOverlappingFaceIDs`
+    _element = "Face"
+
     @property
     def _variableClass(self):
         return FaceVariable
@@ -35,8 +38,7 @@ class FaceVariable(_MeshVariable):
 
     @property
     def globalValue(self):
-        return self._getGlobalValue(self.mesh._localNonOverlappingFaceIDs,
-                                    self.mesh._globalNonOverlappingFaceIDs)
+        return self._getGlobalValue()
 
     def setValue(self, value, unit = None, where = None):
         _MeshVariable.setValue(self, value=self._globalToLocalValue(value), unit=unit, where=where)
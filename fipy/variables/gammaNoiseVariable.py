@@ -81,7 +81,7 @@ class GammaNoiseVariable(NoiseVariable):
       :alt: histogram of random values with a gamma distribution
 
     """
-    def __init__(self, mesh, shape, rate, name = '', hasOld = 0):
+    def __init__(self, mesh, shape, rate, name = '', hasOld = 0, seed = None):
         r"""
         Parameters
         ----------
@@ -91,9 +91,14 @@ class GammaNoiseVariable(NoiseVariable):
             The shape parameter, :math:`\alpha`.
         rate : float
             The rate or inverse scale parameter, :math:`\beta`.
+        seed : int, optional
+            If given, draw the noise from a counter-based generator with
+            this key.  Requires :mod:`scipy`.
+            See :class:`~fipy.variables.noiseVariable.NoiseVariable`.
 
         """
-        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld,
+                               seed = seed)
         self.shapeParam = self._requires(shape)
         self.rate = self._requires(rate)
 
@@ -101,6 +106,12 @@ class GammaNoiseVariable(NoiseVariable):
         return random.gamma(shape=self.shapeParam, scale=self.rate,
                             size=[self.mesh.globalNumberOfCells])
 
+    def _counterRandom(self, uniform):
+        from scipy.special import gammaincinv
+
+        # the same scale as `random()`
+        return gammaincinv(self.shapeParam.value, uniform[0]) * self.rate.value
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
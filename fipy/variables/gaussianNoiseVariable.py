@@ -1,7 +1,7 @@
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext'
 
-from fipy.tools.numerix import random, sqrt
+from fipy.tools.numerix import random, sqrt, log, cos, pi
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["GaussianNoiseVariable"]
@@ -106,7 +106,8 @@ class GaussianNoiseVariable(NoiseVariable):
       :alt: histogram of random values with a Gaussian distribution
 
     """
-    def __init__(self, mesh, name = '', mean = 0., variance = 1., hasOld = 0):
+    def __init__(self, mesh, name = '', mean = 0., variance = 1., hasOld = 0,
+                 seed = None):
         """
         Parameters
         ----------
@@ -116,10 +117,14 @@ class GaussianNoiseVariable(NoiseVariable):
             The mean of the noise distribution, :math:`\mu`.
         variance : float
             The variance of the noise distribution, :math:`\sigma^2`.
+        seed : int, optional
+            If given, draw the noise from a counter-based generator with
+            this key.  See :class:`~fipy.variables.noiseVariable.NoiseVariable`.
         """
         self.mean = mean
         self.variance = variance
-        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld,
+                               seed = seed)
 
     def parallelRandom(self):
 
@@ -134,6 +139,14 @@ class GaussianNoiseVariable(NoiseVariable):
         else:
             return None
 
+    def _counterRandom(self, uniform):
+        # Box-Muller transform
+        normal = sqrt(-2 * log(1 - uniform[0])) * cos(2 * pi * uniform[1])
+
+        variance = getattr(self.variance, 'value', self.variance)
+
+        return self.mean + sqrt(variance) * normal
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
@@ -5,13 +5,61 @@ __docformat__ = 'restructuredtext'
 from fipy.variables.cellVariable import CellVariable
 from fipy.meshes import Grid1D
 from fipy.tools import numerix
+from fipy.tools import serialComm
 
 __all__ = ["HistogramVariable"]
 from future.utils import text_to_native_str
 __all__ = [text_to_native_str(n) for n in __all__]
 
 class HistogramVariable(CellVariable):
-    def __init__(self, distribution, dx = 1., nx = None, offset = 0.):
+    r"""
+    Histogram of the values of a distribution
+
+    The probability density of each bin is the fraction of the values
+    that lie between its center and the center of the next bin, divided
+    by the bin size
+
+    >>> histogram = HistogramVariable(distribution=(0.2, 0.7, 1.6, 1.7, 2.9, 4.1, -1.),
+    ...                               dx=1., nx=3)
+    >>> print(histogram.mesh.cellCenters[0])
+    [ 0.5  1.5  2.5]
+    >>> print(histogram * 7)
+    [ 1.  2.  2.]
+
+    The values are counted in one pass, without sorting them.  If the
+    distribution is a :class:`~fipy.variables.cellVariable.CellVariable`
+    on a mesh distributed over several processes, each process counts
+    the cells it owns and the counts are summed, so every process holds
+    the histogram of the whole distribution
+
+    >>> from fipy.meshes import Grid1D
+    >>> mesh = Grid1D(nx=1000)
+    >>> x = mesh.cellCenters[0]
+    >>> distribution = CellVariable(mesh=mesh, value=x / 1000.)
+    >>> histogram = HistogramVariable(distribution=distribution, dx=0.1, nx=10)
+    >>> print(numerix.allclose(histogram.globalValue,
+    ...                        [1.] * 9 + [0.5]))
+    True
+
+    With `incremental`, only the values that changed since the last
+    evaluation are counted again
+
+    >>> histogram = HistogramVariable(distribution=distribution, dx=0.1, nx=10,
+    ...                               incremental=True)
+    >>> print(numerix.allclose(histogram.globalValue,
+    ...                        [1.] * 9 + [0.5]))
+    True
+    >>> distribution.setValue(0.97, where=x < 100)
+    >>> print(numerix.allclose(histogram.globalValue,
+    ...                        [0.5] + [1.] * 8 + [1.5]))
+    True
+    >>> print(numerix.allclose(histogram.globalValue,
+    ...                        HistogramVariable(distribution=distribution,
+    ...                                          dx=0.1, nx=10).globalValue))
+    True
+    """
+    def __init__(self, distribution, dx = 1., nx = None, offset = 0.,
+                 incremental=False):
         r"""
         Produces a histogram of the values of the supplied distribution.
 
@@ -25,14 +73,92 @@ class HistogramVariable(CellVariable):
             The number of bins
         offset : float
             The position of the first bin
+        incremental : bool
+            Whether to keep the bin of each value, so that only the values
+            that change need to be counted again.  This needs memory for
+            a copy of the distribution and its bins.
         """
-        CellVariable.__init__(self, mesh = Grid1D(dx = dx, nx = nx) + (offset,))
+        CellVariable.__init__(self, mesh = Grid1D(dx = dx, nx = nx,
+                                                  communicator=serialComm) + (offset,))
         self.distribution = self._requires(distribution)
+        self.incremental = incremental
 
-    def _calcValue(self):
-        l = len(self.distribution)
-        bins = self.mesh.cellCenters[0]
-        n = numerix.searchsorted(numerix.sort(self.distribution), bins)
-        n = numerix.concatenate([n, [l]])
+    def _localDistribution(self):
+        """The values counted by this process and the communicator to sum
+        the counts over
+        """
+        if isinstance(self.distribution, CellVariable):
+            mesh = self.distribution.mesh
+            values = numerix.asarray(self.distribution.value)
+            return (values[..., mesh._localNonOverlappingCellIDs].ravel(),
+                    mesh.communicator)
+        else:
+            return numerix.ravel(self.distribution.value), serialComm
+
+    def _binIDs(self, values):
+        """Index of the bin whose center is the largest not above each of
+        `values`, or -1 for values below the first center
+        """
+        bins = self._bins
         dx = bins[1:] - bins[:-1]
-        return (n[1:] - n[:-1]) / numerix.concatenate([dx, [dx[-1]]]) / float(l)
+        if len(bins) < 2 or not numerix.allclose(dx, dx[0]):
+            return numerix.searchsorted(bins, values, side='right') - 1
+
+        # the bins are uniform, so the bin of each value can be computed
+        # directly, then corrected for round-off in the bin centers
+        last = len(bins) - 1
+        IDs = numerix.floor((values - bins[0]) / dx[0])
+        IDs = numerix.clip(numerix.nan_to_num(IDs), -1, last).astype(int)
+        below = (IDs >= 0) & (values < bins[numerix.maximum(IDs, 0)])
+        IDs[below] -= 1
+        above = (IDs < last) & (values >= bins[numerix.minimum(IDs + 1, last)])
+        IDs[above] += 1
+        # as when searching, NaN lies beyond the last bin
+        IDs[numerix.isnan(values)] = last
+
+        return IDs
+
+    def _count(self, IDs, weight=1):
+        IDs = IDs[IDs >= 0]
+        return weight * numerix.bincount(IDs, minlength=len(self._bins))
+
+    def _localCounts(self, values):
+        if (self.incremental
+            and getattr(self, "_countedValues", None) is not None
+            and self._countedValues.shape == values.shape):
+
+            changed = ~(values == self._countedValues)
+            newIDs = self._binIDs(values[changed])
+            self._counts = (self._counts
+                            + self._count(newIDs)
+                            + self._count(self._countedIDs[changed], weight=-1))
+            self._countedIDs[changed] = newIDs
+            self._countedValues[changed] = values[changed]
+        else:
+            IDs = self._binIDs(values)
+            self._counts = self._count(IDs)
+            if self.incremental:
+                self._countedIDs = IDs
+                self._countedValues = values.copy()
+
+        return self._counts
+
+    def _calcValue(self):
+        self._bins = numerix.asarray(self.mesh.cellCenters.value[0])
+
+        values, comm = self._localDistribution()
+        local = numerix.concatenate([self._localCounts(values), [len(values)]])
+        # one reduction for the counts of all bins and the number of values
+        counts = comm.sum(local[numerix.newaxis], axis=0)
+        l = counts[-1]
+        n = counts[:-1]
+
+        dx = self._bins[1:] - self._bins[:-1]
+        return n / numerix.concatenate([dx, [dx[-1]]]) / float(l)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
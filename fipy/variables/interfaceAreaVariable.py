@@ -20,6 +20,12 @@ class _InterfaceAreaVariable(CellVariable):
         self.distanceVar = self._requires(distanceVar)
 
     def _calcValue(self):
-        normals = numerix.array(MA.filled(self.distanceVar._cellInterfaceNormals, 0))
-        areas = numerix.array(MA.filled(self.mesh._cellAreaProjections, 0))
-        return numerix.sum(abs(numerix.dot(normals, areas)), axis=0)
+        cellIDs, faceIDs, slots = self.mesh._cellFacePairs
+        normals = numerix.asarray(self.distanceVar._interfaceNormals)[:, faceIDs]
+        projections = numerix.asarray(MA.getdata(self.mesh._cellAreaProjections))
+        areas = projections[:, slots, cellIDs]
+        # only cells outside the interface see its normals
+        outside = numerix.asarray(self.distanceVar._value)[cellIDs] >= 0
+        areas = abs(numerix.sum(normals * areas, axis=0)) * outside
+        return numerix.bincount(cellIDs, weights=areas,
+                                minlength=self.mesh.numberOfCells)
@@ -2,7 +2,6 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext'
 
 from fipy.variables.cellVariable import CellVariable
-from fipy.tools.numerix import MA
 from fipy.tools import numerix
 
 __all__ = []
@@ -20,6 +19,9 @@ class _InterfaceFlagVariable(CellVariable):
         self.distanceVar = self._requires(distanceVar)
 
     def _calcValue(self):
-        flag = MA.filled(numerix.take(self.distanceVar._interfaceFlag, self.mesh.cellFaceIDs), 0)
-        flag = numerix.sum(flag, axis=0)
+        cellIDs, faceIDs, slots = self.mesh._cellFacePairs
+        interfaceFlag = numerix.asarray(self.distanceVar._interfaceFlag)
+        flag = numerix.bincount(cellIDs,
+                                weights=interfaceFlag[faceIDs],
+                                minlength=self.mesh.numberOfCells)
         return numerix.where(numerix.logical_and(self.distanceVar.value > 0, flag > 0), 1, 0)
@@ -123,21 +123,95 @@ class _MeshVariable(Variable):
             value = value.value
         return value
 
-    def _getGlobalValue(self, localIDs, globalIDs):
+    def _getGlobalValue(self, root=None):
+        """Values of all processors, on processor `root`, or on all
+        processors if `root` is `None`
+        """
         localValue = self.value
-        if self.mesh.communicator.Nproc > 1:
+        communicator = self.mesh.communicator
+        if communicator.Nproc > 1:
             if localValue.shape[-1] != 0:
-                localValue = localValue[..., localIDs]
-            globalIDs = numerix.concatenate(self.mesh.communicator.allgather(globalIDs))
+                localValue = localValue[..., self._localNonOverlappingIDs]
+            attribute = "_globalNonOverlapping%sIDs" % self._element
+            globalIDs = self.mesh._gatheredIDs(attribute, root=root)
+            if root is None:
+                localValues = communicator.allgather(localValue)
+            else:
+                localValues = communicator.gather(localValue, root=root)
+
+            if localValues is None:
+                return None
 
+            globalIDs = numerix.concatenate(globalIDs)
             globalValue = numerix.empty(localValue.shape[:-1] + (max(globalIDs) + 1,),
                                         dtype=numerix.obj2sctype(localValue))
-            globalValue[..., globalIDs] = numerix.concatenate(self.mesh.communicator.allgather(localValue), axis=-1)
+            globalValue[..., globalIDs] = numerix.concatenate(localValues, axis=-1)
 
             return globalValue
         else:
             return localValue
 
+    def gatherValue(self, root=0):
+        """Concatenate the values from all processors on processor `root`
+
+        Unlike :attr:`globalValue`, which every processor receives, the
+        values of the whole mesh are only held by processor `root`.  The
+        other processors receive `None`.
+
+            >>> from fipy.meshes import Grid1D
+            >>> from fipy.variables.cellVariable import CellVariable
+            >>> mesh = Grid1D(nx=4)
+            >>> var = CellVariable(mesh=mesh, value=mesh.x)
+            >>> value = var.gatherValue()
+            >>> print(value) # doctest: +PROCESSOR_0
+            [ 0.5  1.5  2.5  3.5]
+            >>> print(value is None) # doctest: +PROCESSOR_NOT_0
+            True
+
+        When running on a single processor, the result is identical to
+        :attr:`~fipy.variables.variable.Variable.value`.
+
+        Parameters
+        ----------
+        root : int
+            Processor to gather the values on.
+        """
+        return self._getGlobalValue(root=root)
+
+    def scatterValue(self, value, root=0):
+        """Set the values on all processors from the values of the whole
+        mesh held by processor `root`
+
+        The counterpart of :meth:`gatherValue`.  `value` is ignored on
+        the other processors.
+
+            >>> from fipy.meshes import Grid1D
+            >>> from fipy.variables.cellVariable import CellVariable
+            >>> mesh = Grid1D(nx=4)
+            >>> var = CellVariable(mesh=mesh)
+            >>> value = numerix.arange(4.) if mesh.communicator.procID == 0 else None
+            >>> var.scatterValue(value)
+            >>> print(var.globalValue)
+            [ 0.  1.  2.  3.]
+
+        Parameters
+        ----------
+        value : array_like
+            Values of the whole mesh, in the order of :attr:`globalValue`.
+        root : int
+            Processor holding `value`.
+        """
+        communicator = self.mesh.communicator
+        if communicator.Nproc > 1:
+            attribute = "_globalOverlapping%sIDs" % self._element
+            globalIDs = self.mesh._gatheredIDs(attribute, root=root)
+            if communicator.procID == root:
+                value = numerix.asarray(value)
+                value = [value[..., ids] for ids in globalIDs]
+            value = communicator.scatter(value, root=root)
+
+        _MeshVariable.setValue(self, value=value)
+
     def __str__(self):
         return str(self.globalValue)
 
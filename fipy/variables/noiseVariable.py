@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext'
 
 from fipy.variables.cellVariable import CellVariable
+from fipy.tools import numerix
 
 __all__ = ["NoiseVariable"]
 from future.utils import text_to_native_str
@@ -19,12 +20,74 @@ class NoiseVariable(CellVariable):
 
     The `seed()` and `get_seed()` functions of the
     `fipy.tools.numerix.random` module can be set and query the random
-    number generated used by all `NoiseVariable` objects.
+    number generated used by all `NoiseVariable` objects.  These numbers
+    are drawn for every cell of the mesh on processor 0 and broadcast to
+    the other processors.
+
+    Alternatively, if a `seed` is given to a `NoiseVariable`, each
+    processor draws only the values of its own cells, from a
+    counter-based generator (see :mod:`fipy.tools.philox`) keyed by the
+    `seed`, the global ID of each cell and the number of times the
+    noise has been scrambled.  The noise is then reproducible, does not
+    depend on the number of processors and needs no communication.
+
+    >>> from fipy import Grid1D, UniformNoiseVariable
+    >>> mesh = Grid1D(nx=6)
+    >>> noise = UniformNoiseVariable(mesh=mesh, seed=2021)
+    >>> value = noise.value.copy()
+    >>> print(numerix.allequal(UniformNoiseVariable(mesh=mesh, seed=2021).value, value))
+    True
+    >>> noise.scramble()
+    >>> print(numerix.allequal(noise.value, value))
+    False
+
+    The value of each cell does not depend on the extent of the mesh, or
+    of the part of it held by a processor
+
+    >>> print(numerix.allequal(UniformNoiseVariable(mesh=Grid1D(nx=3), seed=2021).value,
+    ...                        value[:3]))
+    True
+
+    Every distribution can be drawn this way
+
+    >>> from fipy import (Grid2D, GaussianNoiseVariable, ExponentialNoiseVariable,
+    ...                   GammaNoiseVariable, BetaNoiseVariable)
+    >>> mesh = Grid2D(nx=200, ny=200)
+    >>> def hasMoments(noise, mean, variance):
+    ...     return numerix.allclose((noise.value.mean(), noise.value.var()),
+    ...                             (mean, variance), rtol=0.02)
+    >>> noise = UniformNoiseVariable(mesh=mesh, minimum=-1., maximum=2., seed=1)
+    >>> print(hasMoments(noise, mean=0.5, variance=0.75))
+    True
+    >>> print(hasMoments(GaussianNoiseVariable(mesh=mesh, mean=1., variance=4., seed=1),
+    ...                  mean=1., variance=4.))
+    True
+    >>> print(hasMoments(ExponentialNoiseVariable(mesh=mesh, mean=2., seed=1),
+    ...                  mean=2., variance=4.))
+    True
+    >>> print(hasMoments(GammaNoiseVariable(mesh=mesh, shape=2., rate=3., seed=1),
+    ...                  mean=6., variance=18.)) # doctest: +SCIPY
+    True
+    >>> print(hasMoments(BetaNoiseVariable(mesh=mesh, alpha=2., beta=2., seed=1),
+    ...                  mean=0.5, variance=0.05)) # doctest: +SCIPY
+    True
     """
-    def __init__(self, mesh, name = '', hasOld = 0):
+    def __init__(self, mesh, name = '', hasOld = 0, seed = None):
+        """
+        Parameters
+        ----------
+        mesh : ~fipy.meshes.mesh.Mesh
+            The mesh on which to define the noise.
+        seed : int, optional
+            If given, draw the noise from a counter-based generator with
+            this key, instead of from `fipy.tools.numerix.random`.
+        """
         if self.__class__ is NoiseVariable:
             raise NotImplementedError("can't instantiate abstract base class")
 
+        self.seed = seed
+        self._step = -1
+
         CellVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
         self.scramble()
 
@@ -41,11 +104,18 @@ class NoiseVariable(CellVariable):
         """
         Generate a new random distribution.
         """
-        self._markStale()
+        self._step += 1
+        self._markStale(changed=True)
 
     def random(self):
         pass
 
+    def _counterRandom(self, uniform):
+        """Transform a (2, N) array of `uniform` random numbers in [0, 1),
+        drawn for the local cells, into the desired distribution
+        """
+        raise NotImplementedError
+
     def parallelRandom(self):
 
         if self.mesh.communicator.procID == 0:
@@ -56,6 +126,12 @@ class NoiseVariable(CellVariable):
     def _calcValue(self):
         from fipy.tools import parallelComm
 
+        if self.seed is not None:
+            from fipy.tools.philox import _uniform
+            ids = self.mesh._globalOverlappingCellIDs
+            return self._counterRandom(_uniform(seed=self.seed, step=self._step,
+                                                ids=ids))
+
         rnd = self.parallelRandom()
 
         if parallelComm.Nproc > 1:
@@ -0,0 +1,327 @@
+"""Memory-budgeted cache of intermediate `_OperatorVariable` results
+
+By default, the value of a node of an expression like ``(a + b) * c``
+is kept only if more than one other `Variable` depends on it, and then
+it is kept until the node is discarded.  Deep expression graphs either
+recompute their intermediate results several times per sweep, or hold
+large intermediate arrays that are only needed once.
+
+When an operator cache is enabled, with :func:`cacheOperators` or the
+`FIPY_OPERATOR_CACHE` environment variable (a budget in megabytes),
+the value of every node is instead offered to a single cache, which
+weighs the time the node took to compute against the memory it takes
+to hold.  Held values are evicted, least valuable first, to keep within
+the budget, using the GreedyDual-Size policy of
+
+    Pei Cao and Sandy Irani, "Cost-Aware WWW Proxy Caching Algorithms",
+    Proceedings of the USENIX Symposium on Internet Technologies and
+    Systems, 1997.
+
+in which a held value is worth the seconds it took to compute per byte,
+plus an allowance, raised on each eviction, that lets values which
+have not been used recently age out.  Values are released as soon as
+they are out of date.  Variables that were explicitly cached, with
+:meth:`~fipy.variables.variable.Variable.cacheMe` or ``--cache``, are
+held as before.
+
+    >>> from fipy import Grid1D, CellVariable
+    >>> mesh = Grid1D(nx=1000)
+    >>> x = CellVariable(mesh=mesh, value=1.)
+    >>> y = CellVariable(mesh=mesh, value=2.)
+    >>> cache = cacheOperators(budget=1)
+    >>> xy = x * y
+    >>> expr = (xy + 1) * (xy - 1)
+    >>> print(expr.value[0])
+    3.0
+    >>> print(expr.value[0])
+    3.0
+    >>> stats = cache.stats
+    >>> print(stats["hits"] > 0, stats["entries"] > 0)
+    True True
+    >>> print(0 < stats["nbytes"] <= stats["budget"])
+    True
+
+How many values are held depends on whether the expression is evaluated
+node by node or by a fused kernel (see :mod:`fipy.tools.kernel`).
+
+Changing a `Variable` releases the values that depend on it
+
+    >>> y.value = 3.
+    >>> print(cache.stats["entries"], cache.stats["nbytes"])
+    0 0
+    >>> print(expr.value[0])
+    8.0
+
+Disabling the cache restores the default policy
+
+    >>> print(cacheOperators(budget=0))
+    None
+    >>> print(xy._value is None)
+    True
+"""
+from __future__ import unicode_literals
+from builtins import object
+__docformat__ = 'restructuredtext'
+
+import heapq
+import itertools
+import os
+import timeit
+import weakref
+
+from fipy.meshes.geometryCache import _parseBudget
+from fipy.tools.dimensions import physicalField
+
+__all__ = ["cacheOperators"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+def _nbytes(value):
+    if isinstance(value, physicalField.PhysicalField):
+        value = value.value
+    return getattr(value, "nbytes", 0)
+
+class _Entry(object):
+    def __init__(self, ref, nbytes, cost, priority):
+        self.ref = ref
+        self.nbytes = nbytes
+        self.cost = cost
+        self.priority = priority
+
+class _OperatorCache(object):
+    """Cost-aware cache of `_OperatorVariable` values with a memory budget
+
+    Values are admitted only if they are worth more than the values they
+    would evict
+
+        >>> from fipy import Variable, numerix
+        >>> cache = _OperatorCache(budget=1000)
+        >>> cheap = Variable(value=1.) * 1.
+        >>> costly = Variable(value=2.) * 1.
+        >>> cache._offer(cheap, value=numerix.zeros(100), cost=1e-6)
+        >>> cache._offer(costly, value=numerix.zeros(100), cost=1e-3)
+        >>> print(cache._holds(cheap), cache._holds(costly))
+        False True
+        >>> cache._offer(cheap, value=numerix.zeros(100), cost=1e-6)
+        >>> print(cache._holds(cheap), cache._holds(costly))
+        False True
+        >>> print(cache.stats["evictions"], cache.stats["nbytes"])
+        1 800
+
+    and values larger than the whole budget are never held
+
+        >>> cache._offer(costly, value=numerix.zeros(200), cost=1.)
+        >>> print(cache._holds(costly), cache.stats["nbytes"])
+        False 0
+
+    Values of discarded variables are released
+
+        >>> cache._offer(costly, value=numerix.zeros(10), cost=1e-3)
+        >>> print(cache.stats["entries"], cache.stats["nbytes"])
+        1 80
+        >>> del costly
+        >>> print(cache.stats["entries"], cache.stats["nbytes"])
+        0 0
+    """
+    def __init__(self, budget=None):
+        """
+        Parameters
+        ----------
+        budget : int, optional
+            Maximum number of bytes to hold.  `None` for no limit.
+        """
+        self.budget = budget
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._inflation = 0.
+        self._entries = {}
+        # (priority, sequence, key, entry) of the held values, least
+        # valuable first.  Items whose entry has been released, or whose
+        # priority has since changed, are skipped when they come up.
+        self._heap = []
+        self._sequence = itertools.count()
+        # time spent in the calculations nested within each calculation
+        self._nested = [0.]
+
+    @property
+    def stats(self):
+        """Counts of `hits`, `misses` and `evictions`, and the number of
+        `entries` and `nbytes` held, within `budget`
+        """
+        return dict(hits=self.hits,
+                    misses=self.misses,
+                    evictions=self.evictions,
+                    entries=len(self._entries),
+                    nbytes=self.nbytes,
+                    budget=self.budget)
+
+    def _holds(self, var):
+        return id(var) in self._entries
+
+    def _getValue(self, var):
+        """Held value of `var`, or its newly calculated value
+        """
+        entry = self._entries.get(id(var))
+        if entry is not None and not var.stale and var._value is not None:
+            self.hits += 1
+            entry.priority = self._inflation + entry.cost / max(entry.nbytes, 1)
+            self._push(id(var), entry)
+            return var._value
+
+        self.misses += 1
+        self._nested.append(0.)
+        start = timeit.default_timer()
+        try:
+            value = var._calcValue()
+        finally:
+            elapsed = timeit.default_timer() - start
+            nested = self._nested.pop()
+            self._nested[-1] += elapsed
+
+        # time to recompute `var` from its arguments, and to recompute
+        # those arguments that are not held
+        cost = elapsed - nested
+        for arg in var.var:
+            if not self._holds(arg):
+                cost += getattr(arg, "_recomputeCost", 0.)
+        var._recomputeCost = cost
+
+        self._offer(var, value=value, cost=cost)
+        var._markFresh(changed=False)
+
+        return value
+
+    def _offer(self, var, value, cost):
+        """Hold `value` of `var` if it is worth its space
+        """
+        self._release(var)
+
+        nbytes = _nbytes(value)
+        priority = self._inflation + cost / max(nbytes, 1)
+
+        if self.budget is not None:
+            if nbytes > self.budget:
+                return
+
+            victims = self._victims(excess=self.nbytes + nbytes - self.budget,
+                                    priority=priority)
+            if victims is None:
+                return
+
+            for key in victims:
+                self._inflation = max(self._inflation, self._entries[key].priority)
+                self._evict(key)
+                self.evictions += 1
+
+        key = id(var)
+        entry = _Entry(ref=weakref.ref(var, lambda ref, key=key: self._forget(key)),
+                       nbytes=nbytes,
+                       cost=cost,
+                       priority=priority)
+        self._entries[key] = entry
+        self._push(key, entry)
+        self.nbytes += nbytes
+        var._setValueInternal(value=value)
+
+    def _push(self, key, entry):
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            # drop the items that would be skipped
+            self._heap = [item for item in self._heap
+                          if self._entries.get(item[2]) is item[3]
+                          and item[3].priority == item[0]]
+            heapq.heapify(self._heap)
+        heapq.heappush(self._heap, (entry.priority, next(self._sequence), key, entry))
+
+    def _victims(self, excess, priority):
+        """Keys of the least valuable held values that free `excess` bytes,
+        or `None` if any of them is worth at least `priority`
+        """
+        victims = []
+        popped = []
+        while excess > 0 and len(self._heap) > 0:
+            item = heapq.heappop(self._heap)
+            entryPriority, sequence, key, entry = item
+            if self._entries.get(key) is not entry or entry.priority != entryPriority:
+                continue
+            popped.append(item)
+            if entryPriority >= priority:
+                for item in popped:
+                    heapq.heappush(self._heap, item)
+                return None
+            victims.append(key)
+            excess -= entry.nbytes
+
+        return victims
+
+    def _forget(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry.nbytes
+
+    def _evict(self, key):
+        var = self._entries[key].ref()
+        self._forget(key)
+        if var is not None:
+            var._setValueInternal(value=None)
+
+    def _release(self, var):
+        """Stop holding the value of `var`
+        """
+        if id(var) in self._entries:
+            self._evict(id(var))
+
+    def clear(self):
+        for key in list(self._entries.keys()):
+            self._evict(key)
+        self._heap = []
+        self._inflation = 0.
+
+def _defaultCache():
+    """A new cache, if one is requested by `FIPY_OPERATOR_CACHE`, else `None`
+    """
+    budget = _parseBudget(os.environ.get("FIPY_OPERATOR_CACHE", None))
+    if budget is None:
+        return None
+    return _OperatorCache(budget=budget)
+
+_cache = _defaultCache()
+
+def cacheOperators(budget=None):
+    """Keep intermediate `Variable` results within a memory budget
+
+    Parameters
+    ----------
+    budget : float, optional
+        Maximum memory, in megabytes, to hold.  `None` for no limit and 0
+        to restore the default policy of holding the values of variables
+        that more than one other variable depends on.
+
+    Returns
+    -------
+    _OperatorCache
+        The new cache, whose `stats` report its `hits`, `misses`,
+        `evictions`, and the number of `entries` and `nbytes` held, or
+        `None` if `budget` is 0.
+    """
+    global _cache
+
+    if _cache is not None:
+        _cache.clear()
+
+    if budget is None:
+        _cache = _OperatorCache(budget=None)
+    elif budget <= 0:
+        _cache = None
+    else:
+        _cache = _OperatorCache(budget=int(budget * 1024**2))
+
+    return _cache
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
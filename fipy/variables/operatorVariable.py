@@ -10,6 +10,9 @@ import dis
 import sys
 
 from fipy.variables.variable import Variable
+from fipy.variables import operatorCache
+from fipy.tools import kernel
+from fipy.tools import unitResolution
 from fipy.tools import numerix
 
 def _OperatorVariableClass(baseClass=object):
@@ -45,42 +48,72 @@ def _OperatorVariableClass(baseClass=object):
             raise TypeError("The value of an `_OperatorVariable` cannot be assigned")
 
         def _calcValue(self):
-            if not self.canInline:
-                return self._calcValue_()
-            else:
-                from fipy.tools import inline
-                if inline.doInline:
-                    return self._execInline(comment=self.comment)
-                else:
-                    return self._calcValue_()
+            if self.canInline and kernel.backend is not None:
+                value = kernel.backend(self)
+                if value is not None:
+                    return value
+            if unitResolution.resolver is not None:
+                value = unitResolution.resolver(self)
+                if value is not None:
+                    return value
+            return self._calcValue_()
 
         def _calcValue_(self):
             pass
 
-        def _isCached(self):
+        def _keepsValue(self):
+            # whether the value is kept, whether or not the operator
+            # cache happens to hold it
             return (Variable._isCached(self)
                     or (len(self.subscribedVariables) > 1 and not self._cacheNever))
 
-        def _getCstring(self, argDict={}, id="", freshen=False):
-            if self.canInline: # and not self._isCached():
-                s = self._getRepresentation(style="C", argDict=argDict, id=id, freshen=freshen)
-            else:
-                s = baseClass._getCstring(self, argDict=argDict, id=id)
-            if freshen:
-                self._markFresh()
+        def _isCached(self):
+            cache = operatorCache._cache
+            return (self._keepsValue()
+                    or (cache is not None and cache._holds(self)))
+
+        def _getValue(self):
+            cache = operatorCache._cache
+            if cache is None or Variable._isCached(self):
+                return baseClass._getValue(self)
+
+            value = cache._getValue(self)
+
+            constraints = self.constraints
+            if len(constraints) > 0:
+                value = self._constrainedValue(value, constraints)
 
-            return s
+            return value
 
-        def _getRepresentation(self, style="__repr__", argDict={}, id=id, freshen=False):
+        value = property(_getValue, Variable._setValueProperty)
+
+        def _markStale(self, changed=False):
+            if not self.stale and operatorCache._cache is not None:
+                operatorCache._cache._release(self)
+            baseClass._markStale(self, changed=changed)
+
+        def _getKernelTree(self, leaves, fused, root=False):
+            opKey = kernel._opKey(self.op)
+            if (not self.canInline
+                or opKey is None
+                or not all(isinstance(v, Variable) for v in self.var)
+                or (not root and (self._keepsValue() or len(self.constraints) > 0))):
+                return baseClass._getKernelTree(self, leaves=leaves, fused=fused)
+
+            fused.append(self)
+            return (opKey, tuple(v._getKernelTree(leaves=leaves, fused=fused)
+                                 for v in self.var))
+
+        def _getRepresentation(self, style="__repr__"):
             """
 
             Parameters
             ----------
-            style : {'__repr__', 'name', 'TeX', 'C'}
+            style : {'__repr__', 'name', 'TeX'}
                desired formatting for representation
             """
             if isinstance(self.op, numerix.ufunc):
-                return "%s(%s)" % (self.op.__name__, ", ".join([self.__var(i, style, argDict, id, freshen)
+                return "%s(%s)" % (self.op.__name__, ", ".join([self.__var(i, style)
                                                                for i in range(len(self.var))]))
 
             try:
@@ -90,9 +123,9 @@ def _OperatorVariableClass(baseClass=object):
                 instructions = [ord(byte) for byte in self.op.__code__.co_code]
                 parseInstructions = self._py2kInstructions
 
-            return parseInstructions(instructions, style=style, argDict=argDict, id=id, freshen=freshen)
+            return parseInstructions(instructions, style=style)
 
-        def __var(self, i, style, argDict, id, freshen):
+        def __var(self, i, style):
             v = self.var[i]
             if style == "__repr__":
                 result = repr(v)
@@ -114,17 +147,6 @@ def _OperatorVariableClass(baseClass=object):
 
             elif style == "TeX":
                 raise Exception("TeX style not yet implemented")
-            elif style == "C":
-                if not v._isCached():
-                    result = v._getCstring(argDict, id=id + str(i), freshen=freshen)
-                    if isinstance(v, Variable):
-                        v._value = None
-                    else:
-                        v.value = None
-                else:
-                    result = v._variableClass._getCstring(v, argDict,
-                                                               id=id + str(i),
-                                                               freshen=False)
             else:
                 raise SyntaxError("Unknown style: %s" % style)
 
@@ -139,7 +161,7 @@ def _OperatorVariableClass(baseClass=object):
                     62: "<<", 63: ">>", 64: "&", 65: "^", 66: "|", 106: "=="
         }
 
-        def _py2kInstructions(self, bytecodes, style, argDict, id, freshen):
+        def _py2kInstructions(self, bytecodes, style):
             def _popIndex():
                 return bytecodes.pop(0) + bytecodes.pop(0) * 256
 
@@ -154,11 +176,7 @@ def _OperatorVariableClass(baseClass=object):
                 elif dis.opname[bytecode] == 'BINARY_SUBSCR':
                     stack.append(stack.pop(-2) + "[" + stack.pop() + "]")
                 elif dis.opname[bytecode] == 'RETURN_VALUE':
-                    s = stack.pop()
-                    if style == 'C':
-                        return s.replace('numerix.', '').replace('arc', 'a')
-                    else:
-                        return s
+                    return stack.pop()
                 elif dis.opname[bytecode] == 'LOAD_CONST':
                     stack.append(self.op.__code__.co_consts[_popIndex()])
                 elif dis.opname[bytecode] == 'LOAD_ATTR':
@@ -169,7 +187,7 @@ def _OperatorVariableClass(baseClass=object):
                     counter = _popIndex()
                     stack.append(self.op.__code__.co_names[counter])
                 elif dis.opname[bytecode] == 'LOAD_FAST':
-                    stack.append(self.__var(_popIndex(), style=style, argDict=argDict, id=id, freshen=freshen))
+                    stack.append(self.__var(_popIndex(), style=style))
                 elif dis.opname[bytecode] == 'CALL_FUNCTION':
                     args = []
                     for j in range(bytecodes.pop(1)):
@@ -193,7 +211,7 @@ def _OperatorVariableClass(baseClass=object):
                        repr(allbytecodes),
                        repr(stack)))
 
-        def _py3kInstructions(self, instructions, style, argDict, id, freshen):
+        def _py3kInstructions(self, instructions, style):
             stack = []
             
             for ins in instructions:
@@ -202,11 +220,7 @@ def _OperatorVariableClass(baseClass=object):
                 elif ins.opname == 'BINARY_SUBSCR':
                     stack.append(stack.pop(-2) + "[" + stack.pop() + "]")
                 elif ins.opname == 'RETURN_VALUE':
-                    s = stack.pop()
-                    if style == 'C':
-                        return s.replace('numerix.', '').replace('arc', 'a')
-                    else:
-                        return s
+                    return stack.pop()
                 elif ins.opname == 'LOAD_CONST':
                     stack.append(ins.argval)
                 elif ins.opname in ['LOAD_ATTR', 'LOAD_METHOD']:
@@ -216,7 +230,7 @@ def _OperatorVariableClass(baseClass=object):
                 elif ins.opname == 'LOAD_GLOBAL':
                     stack.append(ins.argval)
                 elif ins.opname == 'LOAD_FAST':
-                    stack.append(self.__var(ins.arg, style=style, argDict=argDict, id=id, freshen=freshen))
+                    stack.append(self.__var(ins.arg, style=style))
                 elif ins.opname in ['CALL_FUNCTION', 'CALL_METHOD']:
                     # args are last ins.arg items on stack
                     args, stack = stack[-ins.arg:], stack[:-ins.arg]
@@ -293,27 +307,6 @@ def _testBinOp(self):
         >>> ttns((v1 * v2)._getRepresentation())
         '(Variable(value=array([1, 2, 3, 4])) * Variable(value=array([5, 6, 7, 8])))'
 
-        >>> ttns((v1 * v2)._getRepresentation(style='C', id=""))
-        '(var0[i] * var1[i])'
-
-        >>> ttns((v1 * v2 + v3 * v4)._getRepresentation(style='C', id=""))
-        '((var00[i] * var01[i]) + (var10[i] * var11[i]))'
-
-        >>> ttns((v1 - v2)._getRepresentation(style='C', id=""))
-        '(var0[i] - var1[i])'
-
-        >>> ttns((v1 / v2)._getRepresentation(style='C', id=""))
-        '(var0[i] / var1[i])'
-
-        >>> ttns((v1 - 1)._getRepresentation(style='C', id=""))
-        '(var0[i] - var1)'
-
-        >>> ttns((5 * v2)._getRepresentation(style='C', id=""))
-        '(var0[i] * var1)'
-
-        >>> ttns((v1 / v2 - v3 * v4 + v1 * v4)._getRepresentation(style='C', id=""))
-        '(((var000[i] / var001[i]) - (var010[i] * var011[i])) + (var10[i] * var11[i]))'
-
     Check that unit works for a `binOp`
 
         >>> (Variable(value="1 m") * Variable(value="1 s")).unit == Variable(value="1 s*m").unit
@@ -330,20 +323,9 @@ def _testBinOp(self):
         >>> print(a.getsctype() == numerix.float64)
         1
 
-    The following test is to correct an `--inline` bug that was
-    being thrown by the Cahn-Hilliard example. The fix for this
-    bug was to add the last line to the following code in
-    `_getRepresentation()`.
-
-        >>> ##elif style == "C":
-        >>> ##    counter = _popIndex()
-        >>> ##    if not self.var[counter]._isCached():
-        >>> ##        stack.append(self.var[counter]._getCstring(argDict, id=id + str(counter), freshen=freshen))
-        >>> ##        self.var[counter].value=None
-
-    This is the test that fails if the last line above is removed
-    from `_getRepresentation()`, the `binOp.value` statement
-    below will return `1.0` and not `0.5`.
+    Intermediate values that were not kept must be recalculated, or
+    the `binOp.value` statement below returns `1.0` and not `0.5`, as
+    it once did with `--inline`.
 
         >>> from fipy import numerix
         >>> def doBCs(binOp):
@@ -363,6 +345,29 @@ def _testBinOp(self):
         >>> print(binOp.value)
         0.5
 
+    A `CellVariable` times an array that has a shape, but only one
+    element, as once failed with `--inline`
+
+        >>> from fipy import Grid1D
+        >>> m = Grid1D(nx=3)
+        >>> x = m.cellCenters[0]
+        >>> tmp = m.cellCenters[0] * numerix.array(((0.,), (1.,)))[1]
+        >>> print(numerix.allclose(tmp, x))
+        True
+        >>> print(numerix.allclose(tmp, x))
+        True
+
+    Shapes like `(1, ni)`, as once failed with `--inline`
+
+        >>> from fipy import Tri2D, FaceVariable
+        >>> tri = Tri2D(dx=1., dy=1., nx=1, ny=1)
+        >>> diffCoeff = FaceVariable(mesh=tri, value=1.0)
+        >>> normals = FaceVariable(mesh=tri, rank=1, value=tri._orientedFaceNormals)
+        >>> normalsNthCoeff = diffCoeff[numerix.newaxis] * normals
+        >>> value = normalsNthCoeff.value
+        >>> print((normalsNthCoeff == value).all())
+        True
+
         >>> from fipy.variables.cellVariable import CellVariable
         >>> from fipy.variables.faceVariable import FaceVariable
 
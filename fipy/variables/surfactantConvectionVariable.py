@@ -9,8 +9,6 @@ __all__ = [text_to_native_str(n) for n in __all__]
 from fipy.tools.numerix import MA
 from fipy.tools import numerix
 
-from fipy.tools import vector
-
 from fipy.variables.faceVariable import FaceVariable
 
 class SurfactantConvectionVariable(FaceVariable):
@@ -80,33 +78,27 @@ class SurfactantConvectionVariable(FaceVariable):
     def _calcValue(self):
 
         Nfaces = self.mesh.numberOfFaces
-        M = self.mesh._maxFacesPerCell
-        dim = self.mesh.dim
-        cellFaceIDs = self.mesh.cellFaceIDs
+        Ncells = self.mesh.numberOfCells
+        cellIDs, faceIDs, slots = self.mesh._cellFacePairs
 
         faceNormalAreas = self.distanceVar._levelSetNormals * self.mesh._faceAreas
+        norms = numerix.asarray(MA.getdata(self.mesh._cellNormals))[:, slots, cellIDs]
 
-        cellFaceNormalAreas = numerix.array(MA.filled(numerix.take(faceNormalAreas, cellFaceIDs, axis=-1), 0))
-        norms = numerix.array(MA.filled(MA.array(self.mesh._cellNormals), 0))
-
-        alpha = numerix.dot(cellFaceNormalAreas, norms)
+        alpha = numerix.sum(faceNormalAreas[:, faceIDs] * norms, axis=0)
         alpha = numerix.where(alpha > 0, alpha, 0)
 
-        alphasum = numerix.sum(alpha, axis=0)
+        alphasum = numerix.bincount(cellIDs, weights=alpha, minlength=Ncells)
         alphasum += (alphasum < 1e-100) * 1.0
-        alpha = alpha / alphasum
+        alpha = alpha / alphasum[cellIDs]
 
-        phi = numerix.repeat(self.distanceVar[numerix.newaxis, ...], M, axis=0)
+        phi = numerix.asarray(self.distanceVar)[cellIDs]
         alpha = numerix.where(phi > 0., 0, alpha)
 
-        volumes = numerix.array(self.mesh.cellVolumes)
+        volumes = numerix.asarray(self.mesh.cellVolumes)[cellIDs]
         alpha = alpha * volumes * norms
 
-        value = numerix.zeros((dim, Nfaces), 'd')
-
-        vector._putAdd(value, cellFaceIDs, alpha, mask=MA.getmask(MA.array(cellFaceIDs)))
-
-##         value = numerix.reshape(value, (dim, Nfaces, dim))
+        value = numerix.array([numerix.bincount(faceIDs, weights=a, minlength=Nfaces)
+                               for a in alpha])
 
         return -value / self.mesh._faceAreas
 
@@ -15,6 +15,9 @@ def _suite():
             'fipy.variables.cellVariable',
             'fipy.variables.faceVariable',
             'fipy.variables.operatorVariable',
+            'fipy.variables.operatorCache',
+            'fipy.variables.noiseVariable',
+            'fipy.variables.histogramVariable',
             'fipy.variables.betaNoiseVariable',
             'fipy.variables.exponentialNoiseVariable',
             'fipy.variables.gammaNoiseVariable',
@@ -45,7 +45,8 @@ class UniformNoiseVariable(NoiseVariable):
        :align: center
        :alt: histogram of random values with a uniform distribution
     """
-    def __init__(self, mesh, name = '', minimum = 0., maximum = 1., hasOld = 0):
+    def __init__(self, mesh, name = '', minimum = 0., maximum = 1., hasOld = 0,
+                 seed = None):
         """
         Parameters
         ----------
@@ -55,15 +56,22 @@ class UniformNoiseVariable(NoiseVariable):
             The minimum (not-inclusive) value of the distribution.
         maximum : float
             The maximum (not-inclusive) value of the distribution.
+        seed : int, optional
+            If given, draw the noise from a counter-based generator with
+            this key.  See :class:`~fipy.variables.noiseVariable.NoiseVariable`.
         """
         self.minimum = minimum
         self.maximum = maximum
-        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld,
+                               seed = seed)
 
     def random(self):
         return random.uniform(self.minimum, self.maximum,
                               size=[self.mesh.globalNumberOfCells])
 
+    def _counterRandom(self, uniform):
+        return self.minimum + (self.maximum - self.minimum) * uniform[0]
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
@@ -48,6 +48,10 @@ class Variable(object):
 
     _cacheNever = False
 
+    # number of times the value has been set, or marked stale for reasons
+    # other than a change in the `Variable` objects it depends on
+    _version = 0
+
     def __new__(cls, *args, **kwds):
         return object.__new__(cls)
 
@@ -326,114 +330,6 @@ class Variable(object):
             s += ')'
             return s
 
-    def _getCIndexString(self, shape):
-        r"""
-        Test for inline issue. `(1, ni)` shapes were not handled correctly.
-
-        >>> from fipy import *
-        >>> mesh = Tri2D(dx=1., dy=1., nx=1, ny=1)
-        >>> diffCoeff = FaceVariable(mesh = mesh, value = 1.0)
-        >>> normals = FaceVariable(mesh=mesh, rank=1, value=mesh._orientedFaceNormals)
-        >>> normalsNthCoeff = diffCoeff[numerix.newaxis] * normals
-
-        First variable value access does not provoke inlining.
-
-        >>> value = normalsNthCoeff.value
-        >>> print((normalsNthCoeff == value).all())
-        True
-
-        """
-
-        dimensions = len(shape)
-        if dimensions == 1:
-            return '[i]'
-        elif dimensions == 2:
-            if shape[-1] == 1:
-                return '[j]'
-            elif shape[0] == 1:
-                return '[i]'
-            else:
-                return '[i + j * ni]'
-        elif dimensions == 3:
-            if shape[-1] == 1:
-                if shape[-2] == 1:
-                    return '[k]'
-                else:
-                    return '[j + k * nj]'
-            elif shape[-2] == 1:
-                return '[i + k * ni * nj]'
-            else:
-                return '[i + j * ni + k * ni * nj]'
-
-
-    def _getCstring(self, argDict={}, id="", freshen=None):
-         """
-         Generate the string and dictionary to be used in inline
-             >>> from future.utils import text_to_native_str as ttns
-
-             >>> ttns((Variable((1)))._getCstring(argDict={}))
-             'var'
-
-             >>> ttns((Variable((1, 2, 3, 4)))._getCstring(argDict={}))
-             'var[i]'
-
-             >>> ttns((Variable(((1, 2), (3, 4))))._getCstring(argDict={}))
-             'var[i + j * ni]'
-
-             >>> ttns(Variable((((1, 2), (3, 4)), ((5, 6), (7, 8))))._getCstring(argDict={}))
-             'var[i + j * ni + k * ni * nj]'
-
-             >>> ttns((Variable(1) * Variable((1, 2, 3)))._getCstring(argDict={}))
-             '(var0 * var1[i])'
-
-         freshen is ignored
-
-         Testing when a cell variable multiplies an array that has a
-         shape, but has only one element. This works regularly,
-         but fails when inlining.
-
-         >>> from fipy import *
-         >>> m = Grid1D(nx=3)
-         >>> x = m.cellCenters[0]
-         >>> tmp = m.cellCenters[0] * numerix.array(((0.,), (1.,)))[1]
-         >>> print(numerix.allclose(tmp, x))
-         True
-         >>> print(numerix.allclose(tmp, x))
-         True
-
-         """
-
-         identifier = 'var%s' % (id)
-
-         v = self.value
-
-         if type(v) not in (type(numerix.array(1)),):
-             varray = numerix.array(v)
-         else:
-             varray = v
-
-         if len(varray.shape) == 0:
-             if varray.dtype in (numerix.array(1).dtype,):
-                 argDict[identifier] = int(varray)
-             elif varray.dtype in (numerix.array(1.).dtype,):
-                 argDict[identifier] = float(varray)
-             else:
-                 argDict[identifier] = varray
-         else:
-             argDict[identifier] = varray
-
-         try:
-             shape = self.opShape
-         except AttributeError:
-             shape = self.shape
-
-         if len(shape) == 0:
-             return identifier
-         elif len(shape) == 1 and shape[0] == 1:
-             return identifier + '[0]'
-         else:
-             return identifier + self._getCIndexString(shape)
-
     def tostring(self, max_line_width=75, precision=8, suppress_small=False, separator=' '):
         return numerix.tostring(self.value,
                                 max_line_width=max_line_width,
@@ -495,28 +391,111 @@ class Variable(object):
                 self._setValueInternal(value=value)
             else:
                 self._setValueInternal(value=None)
-            self._markFresh()
+            self._markFresh(changed=False)
         else:
             value = self._value
 
-        if len(self.constraints) > 0:
-            value = value.copy()
-            for constraint in self.constraints:
-                if constraint.where is None:
-                    value[:] = constraint.value
-                else:
-                    mask = constraint.where
-                    if not hasattr(mask, 'dtype') or mask.dtype != bool:
-                        mask = numerix.array(mask, dtype=bool)
-
-                    if 0 not in value.shape:
-                        try:
-                            value[..., mask] = constraint.value
-                        except:
-                            value[..., mask] = numerix.array(constraint.value)[..., mask]
+        constraints = self.constraints
+        if len(constraints) > 0:
+            value = self._constrainedValue(value, constraints)
 
         return value
 
+    def _constrainedValue(self, value, constraints):
+        """Copy of `value` with `constraints` applied
+
+        If the values and masks of all `constraints` are scalars,
+        tuples or `Variable` objects, whose changes can be seen, the
+        constrained value is kept until `self`, one of those `Variable`
+        objects, or the list of `constraints` changes.  Each read returns
+        a copy of it.
+
+            >>> v = Variable((0., 1., 2., 3.))
+            >>> mask = Variable((True, False, False, False))
+            >>> v.constrain(-1., where=mask)
+            >>> print(v)
+            [-1.  1.  2.  3.]
+            >>> print(v._constrained is not None)
+            True
+            >>> mask[:] = (False, True, False, True)
+            >>> print(v)
+            [ 0. -1.  2. -1.]
+            >>> c = Variable(5.)
+            >>> v.constrain(c, where=(True, False, False, False))
+            >>> print(v)
+            [ 5. -1.  2. -1.]
+            >>> c.value = 6.
+            >>> print(v)
+            [ 6. -1.  2. -1.]
+            >>> v.release(v.constraints[0])
+            >>> print(v)
+            [ 6.  1.  2.  3.]
+
+        Changing a constrained value in place does not change the
+        `Variable`
+
+            >>> v.value[1] = 7.
+            >>> print(v)
+            [ 6.  1.  2.  3.]
+
+        Arrays can be changed in place, so values and masks given as
+        arrays are applied on every read
+
+            >>> bc = numerix.array((1., 1., 1., 1.))
+            >>> where = numerix.array((True, False, False, False))
+            >>> v.constrain(bc, where=where)
+            >>> print(v._constrained)
+            None
+            >>> bc[:] = 5.
+            >>> where[1] = True
+            >>> print(v)
+            [ 5.  5.  2.  3.]
+        """
+        constraints = tuple(constraints)
+        cached = getattr(self, "_constrained", None)
+        if (cached is not None
+            and cached[0] is value
+            and cached[1] == constraints):
+            return cached[2].copy()
+
+        constrained = value.copy()
+        for constraint in constraints:
+            where = constraint.where
+            if (isinstance(where, Variable)
+                and not any(ref() is self for ref in where.subscribedVariables)):
+                # a changed mask must discard the constrained value
+                where._requiredBy(self)
+
+            if where is None:
+                constrained[:] = constraint.value
+            elif 0 not in constrained.shape:
+                indices = constraint._indices
+                try:
+                    constrained[indices] = constraint.value
+                except:
+                    constrained[indices] = numerix.array(constraint.value)[indices]
+
+        # evaluating `Variable` values and masks of the constraints above
+        # marked `self` stale
+        self.stale = 0
+        if all(self._isObservable(constraint.value)
+               and (constraint.where is None
+                    or isinstance(constraint.where, tuple)
+                    or self._isObservable(constraint.where))
+               for constraint in constraints):
+            self._constrained = (value, constraints, constrained)
+            return constrained.copy()
+        else:
+            self._constrained = None
+            return constrained
+
+    @staticmethod
+    def _isObservable(value):
+        """Whether any change to `value` marks the variables that depend on
+        it stale, unlike an in-place change to an array
+        """
+        return isinstance(value, Variable) or numerix.isscalar(value)
+
     def _setValueProperty(self, newVal):
         """Since `self.setValue` contains optional, named parameters, we will
         punt the property's set method off to that."""
@@ -626,8 +605,8 @@ class Variable(object):
     def _makeValue(self, value, unit=None, array=None):
 
         ## --inline code often returns spurious results with non-contiguous
-        ## arrays. A test case was put in _execInline(). The best fix turned out to
-        ## be here.
+        ## arrays. A test case was put in `fipy.tools.kernel`. The best fix
+        ## turned out to be here.
 
         if (inline.doInline
             and hasattr(value, 'iscontiguous') and not value.iscontiguous()):
@@ -821,13 +800,35 @@ class Variable(object):
                 ## See <https://github.com/usnistgov/fipy/issues/103> for more explanation.
                 subscriber()._markStale()
 
-    def _markFresh(self):
+    def _markFresh(self, changed=True):
+        """Mark `self` as up to date, and its subscribers as stale
+
+        Parameters
+        ----------
+        changed : bool
+            Whether the value was set, rather than recomputed from the
+            `Variable` objects it depends on.
+        """
         self.stale = 0
+        self._constrained = None
+        if changed:
+            self._version += 1
         self.__markStale()
 
-    def _markStale(self):
+    def _markStale(self, changed=False):
+        """Mark `self` and its subscribers as stale
+
+        Parameters
+        ----------
+        changed : bool
+            Whether the value has changed on its own, rather than because
+            of a change in the `Variable` objects it depends on.
+        """
+        if changed:
+            self._version += 1
         if not self.stale:
             self.stale = 1
+            self._constrained = None
             self.__markStale()
 
     def _requires(self, var):
@@ -853,100 +854,13 @@ class Variable(object):
     def _variableClass(self):
         return Variable
 
-    def _execInline(self, comment=None):
+    def _getKernelTree(self, leaves, fused):
         """
-        Gets the stack from `_getCstring()` which calls `_getRepresentation()`
-
-            >>> from future.utils import text_to_native_str as ttns
-
-            >>> ttns((Variable((1, 2, 3, 4)) * Variable((5, 6, 7, 8)))._getCstring())
-            '(var0[i] * var1[i])'
-            >>> ttns((Variable(((1, 2), (3, 4))) * Variable(((5, 6), (7, 8))))._getCstring())
-            '(var0[i + j * ni] * var1[i + j * ni])'
-            >>> ttns((Variable((1, 2)) * Variable((5, 6)) * Variable((7, 8)))._getCstring())
-            '((var00[i] * var01[i]) * var1[i])'
-
-        The following test was implemented due to a problem with
-        contiguous arrays.  The `mesh.cellCenters[1]` command
-        introduces a non-contiguous array into the `Variable` and this
-        causes the inline routine to return senseless results.
-
-            >>> from fipy import Grid2D, CellVariable
-            >>> mesh = Grid2D(dx=1., dy=1., nx=2, ny=2)
-            >>> var = CellVariable(mesh=mesh, value=0.)
-            >>> Y =  mesh.cellCenters[1]
-            >>> var.value = (Y + 1.0)
-            >>> print(var - Y)
-            [ 1.  1.  1.  1.]
+        Register `self` as an argument of a fused kernel (see
+        :mod:`fipy.tools.kernel`) and return its position in `leaves`.
         """
-
-        from fipy.tools import inline
-        argDict = {}
-        string = self._getCstring(argDict=argDict, freshen=True) + ';'
-
-        try:
-            shape = self.opShape
-        except AttributeError:
-            shape = self.shape
-
-        dimensions = len(shape)
-
-        if dimensions == 0:
-            string = 'result[0] = ' + string
-            dim = ()
-        else:
-            string = 'result' + self._getCIndexString(shape) + ' = ' + string
-            ni = self.opShape[-1]
-            argDict['ni'] = ni
-            if dimensions == 1:
-                dim = (ni)
-            else:
-                nj = self.opShape[-2]
-                argDict['nj'] = nj
-                if dimensions == 2:
-                    dim =(nj, ni)
-                elif dimensions == 3:
-                    nk = self.opShape[-3]
-                    dim = (nk, nj, ni)
-                    argDict['nk'] = nk
-                else:
-                    raise DimensionError('Impossible Dimensions')
-
-        ## Following section makes sure that the result array has a
-        ## valid typecode. If self._value is None then a typecode is
-        ## assigned to the Variable by running the calculation without
-        ## inlining. The non-inlined result is thus used the first
-        ## time through.
-
-
-        if self._value is None and not hasattr(self, 'typecode'):
-            self.canInline = False
-            argDict['result'] = self.value
-            self.canInline = True
-            self.typecode = numerix.obj2sctype(argDict['result'])
-        else:
-            if self._value is None:
-                if self.getsctype() == numerix.bool_:
-                    argDict['result'] = numerix.empty(dim, numerix.int8)
-                else:
-                    argDict['result'] = numerix.empty(dim, self.getsctype())
-            else:
-                argDict['result'] = self._value
-
-            resultShape = argDict['result'].shape
-
-            if resultShape == ():
-                argDict['result'] = numerix.reshape(argDict['result'], (1,))
-
-            inline._runInline(string, converters=None, comment=comment, **argDict)
-
-            if resultShape == ():
-                argDict['result'] = numerix.reshape(argDict['result'], resultShape)
-
-            if self.getsctype() == numerix.bool_:
-                argDict['result'] = numerix.asarray(argDict['result'], dtype=self.getsctype())
-
-        return argDict['result']
+        leaves.append(self)
+        return len(leaves) - 1
 
     def _broadcastShape(self, other):
         ignore, ignore, broadcastshape = numerix._broadcastShapes(self.shape, numerix.getShape(other))
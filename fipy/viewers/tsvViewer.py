@@ -4,6 +4,7 @@ __docformat__ = 'restructuredtext'
 
 import sys
 
+from fipy.tests.doctestPlus import register_skipper
 from fipy.tools import numerix
 from fipy.viewers.viewer import AbstractViewer
 from fipy.variables.cellVariable import CellVariable
@@ -13,6 +14,19 @@ __all__ = ["TSVViewer"]
 from future.utils import text_to_native_str
 __all__ = [text_to_native_str(n) for n in __all__]
 
+def _checkForPyArrow():
+    hasPyArrow = True
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except Exception:
+        hasPyArrow = False
+    return hasPyArrow
+
+register_skipper(flag="PYARROW",
+                 test=_checkForPyArrow,
+                 why="the `pyarrow` package cannot be imported")
+
 class TSVViewer(AbstractViewer):
     """
     "Views" one or more variables in tab-separated-value format.
@@ -31,7 +45,7 @@ class TSVViewer(AbstractViewer):
     """
     _axis = ["x", "y", "z"]
 
-    def __init__(self, vars, title=None, limits={}, **kwlimits):
+    def __init__(self, vars, title=None, limits={}, chunkSize=65536, **kwlimits):
         """
         Creates a `TSVViewer`.
 
@@ -51,6 +65,8 @@ class TSVViewer(AbstractViewer):
             displayed at the top of the `Viewer` window
         limits : dict, optional
             a (deprecated) alternative to limit keyword arguments
+        chunkSize : int, optional
+            number of rows to format and write at a time
         float xmin, xmax, ymin, ymax, zmin, zmax, datamin, datamax : float, optional
             displayed range of data. Any limit set to
             a (default) value of `None` will autoscale.
@@ -58,41 +74,130 @@ class TSVViewer(AbstractViewer):
         kwlimits.update(limits)
         AbstractViewer.__init__(self, vars=vars, title=title, **kwlimits)
 
+        self.chunkSize = chunkSize
+
         mesh = self.vars[0].mesh
 
         for var in self.vars:
             assert mesh is var.mesh
 
 
-    def _plot(self, values, f, dim):
-        for index in range(values.shape[-1]):
-            lineValues = values[..., index]
-
-            # omit any elements whose cell centers lie outside of the specified limits
-            skip = False
-            for axis in range(dim):
-                mini = self._getLimit("%smin" % self._axis[axis])
-                maxi = self._getLimit("%smax" % self._axis[axis])
+    def _headings(self, dim):
+        headings = []
+        for index in range(dim):
+            headings.extend(self._axis[index])
 
-                if (mini and lineValues[axis] < mini) or (maxi and lineValues[axis] > maxi):
-                    skip = True
-                    break
+        for var in self.vars:
+            name = var.name
+            if (isinstance(var, (CellVariable, FaceVariable))
+                and var.rank == 1):
+                for index in range(dim):
+                    headings.extend(["%s_%s" % (name, self._axis[index])])
+            else:
+                headings.extend([name])
 
-            if skip:
-                continue
+        return headings
 
-            # replace any values that lie outside of the specified datalimits with 'nan'
-            for valIndex in range(dim, len(lineValues)):
-                mini = self._getLimit("datamin")
-                maxi = self._getLimit("datamax")
+    def _columnSets(self, mesh):
+        """Global columns of the cell rows and of the face rows
 
-                if (mini and lineValues[valIndex] < mini) or (maxi and lineValues[valIndex] > maxi):
-                    lineValues[valIndex] = float("NaN")
-                    break
+        Each set is a list of 1D arrays, the coordinates followed by the
+        values of the variables.  The columns are views of the gathered
+        values, so nothing is copied.  The values are only gathered on
+        processor 0; the other processors get an empty list.
+        """
+        cellVars = [var for var in self.vars if isinstance(var, CellVariable)]
+        faceVars = [var for var in self.vars if isinstance(var, FaceVariable)]
 
-            line = ["%.15g" % value for value in lineValues]
-            f.write("\t".join(line))
-            f.write("\n")
+        columnSets = []
+        for Var, centers, elementVars in ((CellVariable, mesh.cellCenters, cellVars),
+                                          (FaceVariable, mesh.faceCenters, faceVars)):
+            if len(elementVars) > 0:
+                centers = centers.gatherValue()
+                gathered = [var.gatherValue() for var in self.vars]
+                if centers is None:
+                    continue
+                columns = list(numerix.array(centers))
+                for var, values in zip(self.vars, gathered):
+                    values = numerix.array(values)
+                    if isinstance(var, Var) and var.rank == 1:
+                        columns.extend(values)
+                    else:
+                        columns.append(values)
+                columnSets.append(columns)
+
+        return columnSets
+
+    def _inLimits(self, columns, dim, start=0, stop=None):
+        """Mask of rows `start:stop` whose centers lie inside the limits
+        """
+        keep = numerix.ones(len(columns[0][start:stop]), dtype=bool)
+        for axis in range(dim):
+            mini = self._getLimit("%smin" % self._axis[axis])
+            maxi = self._getLimit("%smax" % self._axis[axis])
+            coordinates = columns[axis][start:stop]
+            if mini:
+                keep &= ~(coordinates < mini)
+            if maxi:
+                keep &= ~(coordinates > maxi)
+
+        return keep
+
+    def _inDataLimits(self, values):
+        """`values`, with any that lie outside the data limits replaced by `nan`
+        """
+        values = numerix.array(values, dtype=float)
+        mini = self._getLimit("datamin")
+        maxi = self._getLimit("datamax")
+        if mini:
+            values[values < mini] = numerix.nan
+        if maxi:
+            values[values > maxi] = numerix.nan
+
+        return values
+
+    def _plot(self, columns, f, dim):
+        """Write the rows of `columns` to `f`, `chunkSize` rows at a time
+        """
+        N = len(columns[0])
+        for start in range(0, N, self.chunkSize):
+            stop = min(start + self.chunkSize, N)
+            keep = self._inLimits(columns, dim, start, stop)
+            block = numerix.array([column[start:stop][keep] for column in columns],
+                                  dtype=float)
+            block[dim:] = self._inDataLimits(block[dim:])
+
+            numerix.savetxt(f, block.T, fmt="%.15g", delimiter="\t")
+
+    def _columnar(self, headings, columnSets, dim):
+        """The kept rows of each heading, in the order of `plot`
+        """
+        keeps = [self._inLimits(columns, dim) for columns in columnSets]
+        for index, heading in enumerate(headings):
+            values = numerix.concatenate([columns[index][keep]
+                                          for columns, keep in zip(columnSets, keeps)])
+            if index >= dim:
+                values = self._inDataLimits(values)
+            yield heading, values
+
+    def _plotNPZ(self, filename, headings, columnSets, dim):
+        numerix.savez(filename, **dict(self._columnar(headings, columnSets, dim)))
+
+    def _plotArrow(self, filename, headings, columnSets, dim):
+        try:
+            import pyarrow
+            import pyarrow.ipc
+        except ImportError:
+            raise ImportError("writing `%s` requires the `pyarrow` package"
+                              % filename)
+
+        columns = self._columnar(headings, columnSets, dim)
+        table = pyarrow.Table.from_arrays([pyarrow.array(values)
+                                           for heading, values in columns],
+                                          names=headings)
+        with pyarrow.OSFile(filename, "wb") as sink:
+            with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=self.chunkSize)
 
     def plot(self, filename=None):
         """
@@ -119,25 +224,100 @@ class TSVViewer(AbstractViewer):
         0.05    0.45    -2      35      -3.33333333333333
         0.15    0.45    5       35      5
 
+        Rows are written `chunkSize` at a time, which does not change the
+        output.  Cells outside the limits are omitted and values outside
+        the data limits are replaced by `nan`
+
+        >>> TSVViewer(vars = v, title = "", chunkSize = 3,
+        ...           xmax = 0.1, datamax = 3).plot() #doctest: +NORMALIZE_WHITESPACE
+        x       y       var
+        0.05    0.15    0
+        0.05    0.45    -2
+        >>> TSVViewer(vars = v, title = "", chunkSize = 3,
+        ...           datamin = -1, datamax = 3).plot() #doctest: +NORMALIZE_WHITESPACE
+        x       y       var
+        0.05    0.15    0
+        0.15    0.15    2
+        0.05    0.45    nan
+        0.15    0.45    nan
+
+        A `filename` ending in ".npz" is written as columns, one NumPy
+        array per heading, that can be read without parsing text
+
+        >>> import os
+        >>> from tempfile import mkdtemp
+        >>> dir = mkdtemp()
+        >>> filename = os.path.join(dir, "var.npz")
+        >>> TSVViewer(vars = (v, v.grad), xmax = 0.1).plot(filename = filename)
+        >>> columns = numerix.load(filename)
+        >>> print(sorted(columns.files))
+        ['var', 'var_gauss_grad_x', 'var_gauss_grad_y', 'x', 'y']
+        >>> print(columns["var"])
+        [ 0. -2.]
+        >>> print(columns["y"])
+        [ 0.15  0.45]
+
+        and one ending in ".arrow" or ".feather" is written in the Arrow IPC
+        file format, which requires :mod:`pyarrow`
+
+        >>> filename = os.path.join(dir, "var.arrow")
+        >>> viewer = TSVViewer(vars = (v, v.grad), chunkSize = 3)
+        >>> viewer.plot(filename = filename) # doctest: +PYARROW
+        >>> import pyarrow # doctest: +PYARROW
+        >>> table = pyarrow.ipc.open_file(filename).read_all() # doctest: +PYARROW
+        >>> print(table.column("var").to_pylist()) # doctest: +PYARROW
+        [0.0, 2.0, -2.0, 5.0]
+
+        Each column of such a file has one row per cell, or one per face,
+        so cell and face variables cannot be written to the same one
+
+        >>> filename = os.path.join(dir, "mixed.npz")
+        >>> TSVViewer(vars = (v, v.faceValue)).plot(filename = filename)
+        Traceback (most recent call last):
+            ...
+        ValueError: cell and face variables must be written to separate ".npz" files
+
+        >>> import shutil
+        >>> shutil.rmtree(dir)
+
         Parameters
         ----------
         filename : str
             If not `None`, the name of a file to save the image into.
+            Files ending in ".gz" are compressed.
         """
 
         mesh = self.vars[0].mesh
         dim = mesh.dim
 
+        import os
         if filename is not None:
-            import os
-            if mesh.communicator.procID == 0:
-                if os.path.splitext(filename)[1] == ".gz":
-                    import gzip
-                    f = gzip.GzipFile(filename = filename, mode = 'w', fileobj = None)
-                else:
-                    f = open(filename, "w")
+            extension = os.path.splitext(filename)[1]
+        else:
+            extension = None
+
+        if (extension in self._columnarWriters
+            and any(isinstance(var, CellVariable) for var in self.vars)
+            and any(isinstance(var, FaceVariable) for var in self.vars)):
+            raise ValueError("cell and face variables must be written to "
+                             "separate \"%s\" files" % extension)
+
+        headings = self._headings(dim)
+        columnSets = self._columnSets(mesh)
+
+        if mesh.communicator.procID != 0:
+            return
+
+        if extension in self._columnarWriters:
+            self._columnarWriters[extension](self, filename, headings, columnSets, dim)
+            return
+
+        if filename is not None:
+            if extension == ".gz":
+                import gzip
+                f = gzip.open(filename, mode='wt')
             else:
-                f = open(os.devnull, mode='w')
+                f = open(filename, "w")
         else:
             f = sys.stdout
 
@@ -145,47 +325,21 @@ class TSVViewer(AbstractViewer):
             f.write(self.title)
             f.write("\n")
 
-        headings = []
-        for index in range(dim):
-            headings.extend(self._axis[index])
-
-        for var in self.vars:
-            name = var.name
-            if (isinstance(var, CellVariable) or isinstance(var, FaceVariable)) and var.rank == 1:
-                for index in range(dim):
-                    headings.extend(["%s_%s" % (name, self._axis[index])])
-            else:
-                headings.extend([name])
-
         f.write("\t".join(headings))
         f.write("\n")
 
-        cellVars = [var for var in self.vars if isinstance(var, CellVariable)]
-        faceVars = [var for var in self.vars if isinstance(var, FaceVariable)]
-
-        if len(cellVars) > 0:
-            values = mesh.cellCenters.globalValue
-            for var in self.vars:
-                if isinstance(var, CellVariable) and var.rank == 1:
-                    values = numerix.concatenate((values, numerix.array(var.globalValue)))
-                else:
-                    values = numerix.concatenate((values, (numerix.array(var.globalValue),)))
-
-            self._plot(values, f, dim)
-
-        if len(faceVars) > 0:
-            values = mesh.faceCenters.globalValue
-            for var in self.vars:
-                if isinstance(var, FaceVariable) and var.rank == 1:
-                    values = numerix.concatenate((values, numerix.array(var.globalValue)))
-                else:
-                    values = numerix.concatenate((values, (numerix.array(var.globalValue),)))
-
-            self._plot(values, f, dim)
+        for columns in columnSets:
+            self._plot(columns, f, dim)
 
         if f is not sys.stdout:
             f.close()
 
+    _columnarWriters = {
+        ".npz": _plotNPZ,
+        ".arrow": _plotArrow,
+        ".feather": _plotArrow
+    }
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()